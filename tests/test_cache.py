@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process TTL cache
+"""
+
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry.cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(ttl=0.05)
+    assert cache.set('a', 1) == 1
+    assert cache.get('a') == 1
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    assert cache.get('a', 'missing') == 'missing'
+
+
+def test_invalidate_and_clear():
+    cache = TTLCache()
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    cache.invalidate('not-there')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    cache.clear()
+    assert cache.get('b') is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_get_or_load_caches_falsy_values():
+    cache = TTLCache()
+    calls = []
+
+    def load():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load('k', load) is None
+    assert cache.get_or_load('k', load) is None
+    assert len(calls) == 1
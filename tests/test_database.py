@@ -5,6 +5,7 @@ Test script to verify SQLite database functionality
 
 import sys
 import os
+import time
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -70,6 +71,9 @@ def test_database():
             print("[ERROR] Failed to delete port configuration")
             return False
         
+        # Release pooled connections and the log writer so no -wal/-shm files stay behind
+        db.close()
+        
         # Clean up test database (may fail on Windows due to file locks)
         try:
             if os.path.exists("test_winsentry.db"):
@@ -85,6 +89,39 @@ def test_database():
         print(f"[ERROR] Database test failed: {e}")
         return False
 
+def test_update_port_status_counters(tmp_path):
+    """Status updates are visible at once, count checks and only move last_status_change on a flip"""
+    from winsentry.database import Database
+
+    db = Database(str(tmp_path / "status.db"))
+    try:
+        db.save_port_config(8080, 30, None, True)
+
+        def read_status():
+            (row,) = db.get_port_status(8080)
+            return row['status'], row['total_checks'], row['successful_checks'], row['last_check'], row['last_status_change']
+
+        db.update_port_status(8080, "ONLINE", 0)
+        status, total, successful, first_check, first_change = read_status()
+        assert (status, total, successful) == ("online", 1, 1)
+        assert first_change == first_check
+
+        time.sleep(0.01)
+        db.update_port_status(8080, "ONLINE", 0)
+        status, total, successful, last_check, last_change = read_status()
+        assert (status, total, successful) == ("online", 2, 2)
+        assert last_check != first_check
+        assert last_change == first_change
+
+        time.sleep(0.01)
+        db.update_port_status(8080, "OFFLINE", 1)
+        status, total, successful, last_check, last_change = read_status()
+        assert (status, total, successful) == ("offline", 3, 2)
+        assert last_change == last_check
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     success = test_database()
     if not success:
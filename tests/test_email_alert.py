@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for SMTP session sharing between alert managers
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry import email_alert
+from winsentry.email_alert import EmailAlert
+
+
+def _alerts(monkeypatch, tmp_path, count, server):
+    """EmailAlert instances, like the ones each monitor builds, sharing one SMTP config"""
+    monkeypatch.chdir(tmp_path)
+    alerts = [EmailAlert(str(tmp_path / "alerts.db")) for _ in range(count)]
+    for alert in alerts:
+        alert.smtp_config = dict(alert.smtp_config, smtp_server=server, from_email="winsentry@example.com")
+    return alerts
+
+
+def test_alerts_share_pool_and_semaphore(monkeypatch, tmp_path):
+    first, second = _alerts(monkeypatch, tmp_path, 2, "smtp.shared.example.com")
+    try:
+        assert email_alert._get_smtp_pool(first.smtp_config) is email_alert._get_smtp_pool(second.smtp_config)
+
+        other = dict(first.smtp_config, smtp_username="someone-else")
+        assert email_alert._get_smtp_pool(other) is not email_alert._get_smtp_pool(first.smtp_config)
+    finally:
+        email_alert._discard_smtp_pool(first.smtp_config)
+        email_alert._discard_smtp_pool(dict(first.smtp_config, smtp_username="someone-else"))
+
+
+def test_session_cap_holds_across_alert_managers(monkeypatch, tmp_path):
+    """Sends from several EmailAlert instances never exceed SMTP_MAX_CONCURRENT together"""
+    monkeypatch.setattr(email_alert, 'SMTP_MAX_CONCURRENT', 2)
+    alerts = _alerts(monkeypatch, tmp_path, 3, "smtp.capped.example.com")
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def deliver(self, msg, recipients):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    monkeypatch.setattr(EmailAlert, '_deliver', deliver)
+
+    async def send_all():
+        results = await asyncio.gather(*(
+            alert._send_message(None, ["ops@example.com"]) for alert in alerts for _ in range(4)
+        ))
+        assert results == [True] * 12
+
+    try:
+        asyncio.run(send_all())
+    finally:
+        email_alert._smtp_semaphores.pop(email_alert._smtp_key(alerts[0].smtp_config), None)
+    assert peak[0] == 2
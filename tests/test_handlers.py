@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Tests for WinSentry HTTP and WebSocket handlers
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tornado import web, websocket
+from tornado.httpclient import HTTPClientError
+from tornado.testing import AsyncHTTPTestCase, gen_test
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry import handlers
+from winsentry.handlers import (
+    AdhocCheckScheduledHandler, PortMonitorHandler, PortStatusWebSocketHandler, ProcessLogsHandler, _parse_pid,
+    _parse_uint
+)
+
+
+def test_parse_uint():
+    assert _parse_uint(5) == 5
+    assert _parse_uint('80') == 80
+    assert _parse_uint(b'443') == 443
+    for bad in (-1, '-1', '1.5', '', '٣', None, 2.0):
+        with pytest.raises(ValueError):
+            _parse_uint(bad)
+
+
+def test_parse_pid():
+    assert _parse_pid(b'{"pid": 1234}') == 1234
+    assert _parse_pid(b'{"pid": "42", "force": true}') == 42
+    with pytest.raises(ValueError):
+        _parse_pid(b'{"pid": "abc"}')
+    with pytest.raises(ValueError):
+        _parse_pid(b'{bad')
+
+
+class _FakeLogDatabase:
+    def __init__(self, batches):
+        self.batches = batches
+
+    def iter_process_logs(self, port, limit):
+        for batch in self.batches:
+            if isinstance(batch, Exception):
+                raise batch
+            yield batch
+
+
+class _LogsApplication(web.Application):
+    def __init__(self, db):
+        self.db_executor = ThreadPoolExecutor(max_workers=1)
+        monitor = types.SimpleNamespace(db=db)
+        super().__init__([(r'/logs', ProcessLogsHandler, dict(port_monitor=monitor))])
+
+
+class StreamLogsTest(AsyncHTTPTestCase):
+    """Streamed log responses are valid JSON however the rows are batched"""
+
+    batches = []
+
+    def get_app(self):
+        return _LogsApplication(_FakeLogDatabase(self.batches))
+
+    def _get_logs(self):
+        response = self.fetch('/logs?port=8080')
+        self.assertEqual(response.code, 200)
+        return json.loads(response.body)
+
+    def test_multiple_batches(self):
+        self.batches[:] = [[{'pid': 1}, {'pid': 2}], [{'pid': 3}], [{'pid': 4, 'name': 'x"y'}]]
+        body = self._get_logs()
+        self.assertTrue(body['success'])
+        self.assertEqual([log['pid'] for log in body['logs']], [1, 2, 3, 4])
+        self.assertEqual(body['log_count'], 4)
+
+    def test_no_rows(self):
+        self.batches[:] = []
+        self.assertEqual(self._get_logs(), {'success': True, 'logs': [], 'log_count': 0})
+
+    def test_error_before_first_batch(self):
+        self.batches[:] = [RuntimeError('database is locked')]
+        response = self.fetch('/logs?port=8080')
+        self.assertEqual(response.code, 500)
+        self.assertEqual(json.loads(response.body), {'success': False, 'error': 'database is locked'})
+
+    def test_error_after_first_batch(self):
+        self.batches[:] = [[{'pid': 1}], RuntimeError('database is locked')]
+        # The connection is dropped rather than an error envelope appended to the 200 body
+        with self.assertRaises(HTTPClientError):
+            self.fetch('/logs?port=8080')
+
+
+class _RecordingPortMonitor:
+    def __init__(self):
+        self.added = []
+
+    async def add_port(self, port, interval, powershell_script, powershell_commands):
+        self.added.append((port, interval, powershell_script, powershell_commands))
+        return True
+
+
+class AddPortValidationTest(AsyncHTTPTestCase):
+    """New ports are validated from the decoded request body"""
+
+    def get_app(self):
+        self.monitor = _RecordingPortMonitor()
+        return web.Application([(r'/ports', PortMonitorHandler, dict(port_monitor=self.monitor))])
+
+    def _post(self, body):
+        response = self.fetch('/ports', method='POST', body=body)
+        return response.code, json.loads(response.body)
+
+    def test_valid_port_is_added(self):
+        code, body = self._post(b'{"port": "8080", "interval": 60}')
+        self.assertEqual(code, 200)
+        self.assertTrue(body['success'])
+        self.assertEqual(self.monitor.added, [(8080, 60, None, None)])
+
+    def test_invalid_bodies_are_rejected(self):
+        code, body = self._post(b'{"port": 70000}')
+        self.assertEqual((code, body['error']), (400, 'Port number must be between 1 and 65535'))
+        code, body = self._post(b'{bad')
+        self.assertEqual(code, 400)
+        self.assertFalse(body['success'])
+        self.assertEqual(self.monitor.added, [])
+
+
+class _FakePortMonitor:
+    def get_monitored_ports(self):
+        return [{'port': 8080, 'status': 'online'}]
+
+
+class _ErrorCounter(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class PortStatusWebSocketTest(AsyncHTTPTestCase):
+    """Frames that are not JSON objects are ignored without logging errors"""
+
+    def get_app(self):
+        return web.Application([
+            (r'/ws', PortStatusWebSocketHandler, dict(port_monitor=_FakePortMonitor())),
+        ])
+
+    def setUp(self):
+        super().setUp()
+        PortStatusWebSocketHandler._cached_payload = None
+        self.errors = _ErrorCounter()
+        logging.getLogger('winsentry.handlers').addHandler(self.errors)
+
+    def tearDown(self):
+        logging.getLogger('winsentry.handlers').removeHandler(self.errors)
+        super().tearDown()
+
+    @gen_test
+    async def test_non_json_frames_are_ignored(self):
+        conn = await websocket.websocket_connect(self.get_url('/ws').replace('http', 'ws'))
+        initial = await conn.read_message()
+        self.assertIn(b'port_status_update', initial if isinstance(initial, bytes) else initial.encode())
+
+        await conn.write_message('hello')
+        await conn.write_message(b'\x00\x01binary', binary=True)
+        await conn.write_message('{"type":"ping"}')
+        pong = await conn.read_message()
+        self.assertIn('pong', pong if isinstance(pong, str) else pong.decode())
+
+        conn.close()
+        self.assertEqual(self.errors.records, [])
+
+
+class _FakeAdhocCheckManager:
+    def get_scheduled_checks(self):
+        return [{'id': str(i)} for i in range(5)]
+
+
+class AdhocCheckScheduledPagingTest(AsyncHTTPTestCase):
+    """The scheduled check listing pages with ?offset=&limit= and reports the total"""
+
+    def get_app(self):
+        return web.Application([
+            (r'/checks', AdhocCheckScheduledHandler, dict(adhoc_check_manager=_FakeAdhocCheckManager())),
+        ])
+
+    def test_paging(self):
+        body = json.loads(self.fetch('/checks?offset=1&limit=2').body)
+        self.assertEqual([c['id'] for c in body['checks']], ['1', '2'])
+        self.assertEqual(body['total'], 5)
+
+        body = json.loads(self.fetch('/checks?offset=3').body)
+        self.assertEqual([c['id'] for c in body['checks']], ['3', '4'])
+
+
+class _CountingPortMonitor:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_processes_on_port(self, port):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [{'pid': port}]
+
+
+def test_cached_processes_prunes_locks():
+    """Concurrent lookups share one enumeration and leave no per-port state behind"""
+    monitor = _CountingPortMonitor()
+
+    async def run():
+        results = await asyncio.gather(*(handlers._cached_processes(monitor, 8080) for _ in range(5)))
+        assert results == [[{'pid': 8080}]] * 5
+        assert monitor.calls == 1
+        assert handlers._port_process_locks == {}
+
+        handlers._invalidate_processes(8080)
+        await handlers._cached_processes(monitor, 8080)
+        assert monitor.calls == 2
+
+    asyncio.run(run())
+    handlers._invalidate_processes(8080)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the background log writer
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry.log_writer import LogWriter
+
+INSERT = 'INSERT INTO t (v) VALUES (?)'
+
+
+def _make_db(tmp_path):
+    db_path = str(tmp_path / "log.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE t (v INTEGER)')
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _values(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [v for (v,) in conn.execute('SELECT v FROM t ORDER BY rowid')]
+    finally:
+        conn.close()
+
+
+def _stalled_writer(db_path, max_pending):
+    """A writer whose first batch blocks until the returned event is set"""
+    writer = LogWriter(db_path, max_pending=max_pending)
+    release = threading.Event()
+    started = threading.Event()
+    write_batch = writer._write_batch
+
+    def blocked(rows):
+        started.set()
+        release.wait(5)
+        write_batch(rows)
+        writer._write_batch = write_batch
+
+    writer._write_batch = blocked
+    writer.write(INSERT, (0,))
+    assert started.wait(5)
+    return writer, release
+
+
+def test_close_flushes_pending_rows(tmp_path):
+    """Rows queued before close() are all written"""
+    db_path = _make_db(tmp_path)
+    writer = LogWriter(db_path)
+    for i in range(100):
+        writer.write(INSERT, (i,))
+    writer.close()
+    assert _values(db_path) == list(range(100))
+
+
+def test_overflow_drops_oldest_rows(tmp_path):
+    """A full queue discards its oldest droppable rows"""
+    db_path = _make_db(tmp_path)
+    writer, release = _stalled_writer(db_path, max_pending=3)
+    for i in range(1, 7):
+        writer.write(INSERT, (i,))
+    release.set()
+    writer.close()
+    assert _values(db_path) == [0, 4, 5, 6]
+
+
+def test_non_droppable_writes_survive_overflow(tmp_path):
+    """droppable=False statements are written even when the queue overflows"""
+    db_path = _make_db(tmp_path)
+    writer, release = _stalled_writer(db_path, max_pending=2)
+    writer.write(INSERT, (100,), droppable=False)
+    for i in range(1, 6):
+        writer.write(INSERT, (i,))
+    release.set()
+    assert writer.flush()
+    writer.close()
+    assert sorted(_values(db_path)) == [0, 4, 5, 100]
+
+
+class _LateDeque(deque):
+    """Runs a hook the first time the writer finds the deque empty"""
+
+    def __init__(self, hook):
+        super().__init__()
+        self.hook = hook
+
+    def popleft(self):
+        try:
+            return super().popleft()
+        except IndexError:
+            hook, self.hook = self.hook, None
+            if hook:
+                hook()
+            raise
+
+
+def test_non_droppable_write_is_not_stranded(tmp_path):
+    """A non-droppable write whose wake-up token hits a full queue is still written"""
+    db_path = _make_db(tmp_path)
+    writer = LogWriter(db_path, max_pending=2)
+
+    def arrive_late():
+        # Runs on the writer thread after it has emptied the deque but before it
+        # empties the queue, with the queue full
+        writer.write(INSERT, (1,))
+        writer.write(INSERT, (2,))
+        writer.write(INSERT, (100,), droppable=False)
+
+    writer._reliable = _LateDeque(arrive_late)
+    writer.write(INSERT, (0,))
+
+    deadline = time.monotonic() + 5
+    while 100 not in _values(db_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    written = _values(db_path)
+    writer.close()
+    assert 100 in written
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for locating Python app processes
+"""
+
+import os
+import sys
+import time
+import types
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry import python_app_monitor
+from winsentry.python_app_monitor import PythonAppConfig, PythonAppMonitor
+
+
+def _monitor(monkeypatch, tmp_path, running):
+    """A monitor whose process scans report the given (pid, cmdline) pairs"""
+    scans = []
+
+    def process_iter(attrs):
+        scans.append(attrs)
+        return [types.SimpleNamespace(pid=pid, info={'cmdline': cmdline}) for pid, cmdline in running]
+
+    monkeypatch.setattr(python_app_monitor.psutil, 'process_iter', process_iter)
+    return PythonAppMonitor(str(tmp_path / "apps.db")), scans
+
+
+def test_cached_miss_is_rescanned(monkeypatch, tmp_path):
+    """An app restarted since the cached snapshot was taken is still found"""
+    running = []
+    monitor, scans = _monitor(monkeypatch, tmp_path, running)
+    app = PythonAppConfig(app_id='a', name='a', script_path='C:\\apps\\worker.py', working_directory='C:\\apps')
+
+    assert monitor._find_app_process(app) is None
+    assert len(scans) == 1
+
+    running.append((os.getpid(), ['python.exe', 'C:\\apps\\worker.py']))
+    assert monitor._find_app_process(app) == os.getpid()
+    assert len(scans) == 2
+
+
+def test_cached_hit_skips_scan(monkeypatch, tmp_path):
+    running = [(os.getpid(), ['python', 'worker.py'])]
+    monitor, scans = _monitor(monkeypatch, tmp_path, running)
+    app = PythonAppConfig(app_id='a', name='a', script_path='worker.py', working_directory='.')
+    monitor._process_snapshot = (time.monotonic(), list(running))
+
+    assert monitor._find_app_process(app) == os.getpid()
+    assert scans == []
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for scheduled task log handling
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry.log_writer import get_log_writer
+from winsentry import scheduled_task_manager
+from winsentry.scheduled_task_manager import ScheduledTaskManager, _read_output
+
+
+def test_remove_task_purges_logs(tmp_path):
+    """Removing a task drops its buffered and persisted execution logs"""
+    db_path = str(tmp_path / "tasks.db")
+    manager = ScheduledTaskManager(db_path)
+
+    manager._log_task_execution('t1', 'success', 'out', None, 5)
+    manager._log_task_execution('t2', 'success', 'out', None, 7)
+    assert get_log_writer(db_path).flush()
+    assert len(manager.get_task_logs('t1', limit=1)) == 1
+
+    # Queued but not yet written when the task is removed
+    manager._log_task_execution('t1', 'failed', None, 'err', 9)
+    assert asyncio.run(manager.remove_task('t1'))
+
+    assert manager.get_task_logs('t1', limit=1) == []
+    assert [log['task_id'] for log in manager.get_task_logs(limit=10)] == ['t2']
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT task_id FROM scheduled_task_logs").fetchall()
+    finally:
+        conn.close()
+    assert rows == [('t2',)]
+
+
+def test_read_output_decodes_like_text_mode(monkeypatch):
+    """Task output is read back as UTF-8 with universal newlines and a size cap"""
+    with tempfile.TemporaryFile() as f:
+        f.write('caf\u00e9\r\nline\rend\n'.encode('utf-8'))
+        assert _read_output(f) == 'caf\u00e9\nline\nend\n'
+
+    monkeypatch.setattr(scheduled_task_manager, 'TASK_MAX_OUTPUT_BYTES', 4)
+    with tempfile.TemporaryFile() as f:
+        f.write('caf\u00e9'.encode('utf-8'))
+        assert _read_output(f) == 'caf\ufffd' + scheduled_task_manager.TRUNCATED_MARKER
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for request models and the JSON backend
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from winsentry import jsonutil
+from winsentry._schemas import AddPortRequest, RequestValidationError
+
+
+def test_add_port_request_defaults():
+    request = AddPortRequest.from_bytes(b'{"port": 8080}')
+    assert request == AddPortRequest(port=8080, interval=30)
+
+
+def test_add_port_request_from_bytes_rejects_bad_bodies():
+    with pytest.raises(RequestValidationError):
+        AddPortRequest.from_bytes(b'{"port": 70000}')
+    with pytest.raises(ValueError):
+        AddPortRequest.from_bytes(b'{bad')
+
+
+def test_add_port_request_coerces_strings():
+    request = AddPortRequest.from_dict({'port': '443', 'interval': '60', 'powershell_script': 'C:\\fix.ps1'})
+    assert (request.port, request.interval, request.powershell_script) == (443, 60, 'C:\\fix.ps1')
+
+
+@pytest.mark.parametrize('body', [
+    {'port': 0}, {'port': 65536}, {'port': 80, 'interval': 4}, {'port': 80, 'interval': 3601},
+])
+def test_add_port_request_rejects_out_of_range(body):
+    with pytest.raises(RequestValidationError):
+        AddPortRequest.from_dict(body)
+
+
+def test_add_port_request_rejects_missing_port():
+    with pytest.raises(ValueError):
+        AddPortRequest.from_dict({})
+
+
+def test_jsonutil_round_trip():
+    data = {'port': 80, 'name': 'café', 'items': [1, 2.5, None, True]}
+    encoded = jsonutil.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert jsonutil.loads(encoded) == data
+    with pytest.raises(jsonutil.JSONDecodeError):
+        jsonutil.loads(b'{bad')
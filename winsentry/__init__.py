@@ -13,14 +13,20 @@ A comprehensive monitoring solution for Windows systems providing:
 __version__ = "1.0.0"
 __author__ = "WinSentry Team"
 
-from .database import Database
-from .port_monitor import PortMonitor
-from .service_monitor import ServiceMonitor
-from .service_manager import ServiceManager
-from .email_alert import EmailAlert
-from .python_app_monitor import PythonAppMonitor
-from .system_resource_monitor import SystemResourceMonitor
-from .scheduled_task_manager import ScheduledTaskManager
+from importlib import import_module
+
+# Public classes and the submodule defining each; imported on first access so that
+# importing one submodule (e.g. winsentry.main) does not load every monitor
+_LAZY_IMPORTS = {
+    'Database': 'database',
+    'PortMonitor': 'port_monitor',
+    'ServiceMonitor': 'service_monitor',
+    'ServiceManager': 'service_manager',
+    'EmailAlert': 'email_alert',
+    'PythonAppMonitor': 'python_app_monitor',
+    'SystemResourceMonitor': 'system_resource_monitor',
+    'ScheduledTaskManager': 'scheduled_task_manager',
+}
 
 __all__ = [
     'Database',
@@ -32,3 +38,13 @@ __all__ = [
     'SystemResourceMonitor',
     'ScheduledTaskManager',
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
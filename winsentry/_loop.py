@@ -0,0 +1,20 @@
+"""
+Event loop selection for WinSentry
+"""
+
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Optional
+
+
+def install_fast_loop() -> Optional[str]:
+    """Install winloop on Windows or uvloop elsewhere, returning the name of the one installed"""
+    # Both replace the asyncio event loop policy, which Tornado 6 uses for its IOLoop,
+    # so this must run before the first loop is created
+    name = 'winloop' if sys.platform == 'win32' else 'uvloop'
+    # find_spec only looks the package up, so a missing loop costs no failed import
+    if find_spec(name) is None:
+        return None
+    import_module(name).install()
+    return name
@@ -0,0 +1,15 @@
+"""
+Process helpers shared by the WinSentry monitors
+"""
+
+# Physical memory size never changes while running; read once for memory percentages
+_total_memory = None
+
+
+def memory_percent(rss: int) -> float:
+    """Percent of physical memory used by rss, as Process.memory_percent() reports it"""
+    global _total_memory
+    if _total_memory is None:
+        import psutil
+        _total_memory = psutil.virtual_memory().total
+    return rss * 100.0 / _total_memory
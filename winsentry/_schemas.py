@@ -0,0 +1,61 @@
+"""
+Request models for WinSentry API handlers
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+from .jsonutil import loads
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+PORT_MIN = 1
+PORT_MAX = 65535
+INTERVAL_MIN = 5
+INTERVAL_MAX = 3600
+
+
+class RequestValidationError(ValueError):
+    """Raised when a request body fails validation"""
+
+
+def _as_int(value) -> int:
+    """Coerce a decoded JSON value to int, passing real ints straight through"""
+    return value if type(value) is int else int(value)
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class AddPortRequest:
+    """Body of a request to add a port to monitoring"""
+    port: int
+    interval: int = 30
+    powershell_script: Optional[str] = None
+    powershell_commands: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> 'AddPortRequest':
+        """Parse and validate a raw request body"""
+        return cls.from_dict(loads(body))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AddPortRequest':
+        """Validate an already decoded request body"""
+        try:
+            port = _as_int(data.get('port'))
+            interval = _as_int(data.get('interval', 30))
+        except TypeError:
+            raise ValueError('Port and interval must be integers')
+
+        if not PORT_MIN <= port <= PORT_MAX:
+            raise RequestValidationError('Port number must be between 1 and 65535')
+        if not INTERVAL_MIN <= interval <= INTERVAL_MAX:
+            raise RequestValidationError('Check interval must be between 5 and 3600 seconds')
+
+        return cls(
+            port=port,
+            interval=interval,
+            powershell_script=data.get('powershell_script'),
+            powershell_commands=data.get('powershell_commands')
+        )
@@ -5,19 +5,20 @@ Adhoc Check Manager - Handles on-demand and scheduled checks for services and pr
 import asyncio
 import logging
 import uuid
-import json
 import subprocess
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 
+from ._schemas import DATACLASS_OPTIONS
 from .database import Database
 from .email_alert import EmailAlert
+from .jsonutil import dumps as _dumps, loads as _loads
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ScheduledCheck:
     """Configuration for a scheduled adhoc check"""
     id: str
@@ -102,8 +103,8 @@ class AdhocCheckManager:
                     check_type=row['check_type'],
                     target_name=row['target_name'],
                     expected_state=row['expected_state'] or 'running',
-                    schedule=json.loads(row['schedule'] or '{}'),
-                    actions=json.loads(row['actions'] or '{}'),
+                    schedule=_loads(row['schedule'] or '{}'),
+                    actions=_loads(row['actions'] or '{}'),
                     powershell_script=row['powershell_script'] or '',
                     email_recipients=row['email_recipients'] or '',
                     enabled=bool(row['enabled']),
@@ -287,7 +288,7 @@ class AdhocCheckManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 check.id, check.name, check.check_type, check.target_name,
-                check.expected_state, json.dumps(check.schedule), json.dumps(check.actions),
+                check.expected_state, _dumps(check.schedule).decode(), _dumps(check.actions).decode(),
                 check.powershell_script, check.email_recipients, 1, 
                 check.created_at.isoformat()
             ))
@@ -523,7 +524,7 @@ class AdhocCheckManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 check_id, check_type, target_name, expected_state, current_state,
-                status, json.dumps(actions_taken), message
+                status, _dumps(actions_taken).decode(), message
             ))
             self.db.commit()
         except Exception as e:
@@ -3,8 +3,12 @@ Tornado web application for WinSentry
 """
 
 import os
-from tornado import web
+from concurrent.futures import ThreadPoolExecutor
 
+from tornado import template, web
+
+# SQLite calls are short and mostly I/O bound, so allow several per core
+DB_EXECUTOR_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 try:
     # Try absolute imports first (when installed as package)
@@ -114,6 +118,9 @@ class WinSentryApplication(web.Application):
         self.resource_monitor = resource_monitor
         self.adhoc_check_manager = adhoc_check_manager
         
+        # Shared pool for blocking SQLite calls made from request handlers
+        self.db_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="winsentry-db")
+        
         handlers = [
             (r"/", MainHandler),
             (r"/email-config", EmailConfigPageHandler),
@@ -185,3 +192,8 @@ class WinSentryApplication(web.Application):
         self.service_manager = service_manager
         self.port_monitor = port_monitor
         self.resource_monitor = resource_monitor
+        
+        # The HTML pages are static, so render them once instead of on every GET
+        loader = template.Loader(settings["template_path"], autoescape=settings["autoescape"])
+        self.index_page = loader.load("index.html").generate()
+        self.email_config_page = loader.load("email_config.html").generate()
@@ -5,26 +5,105 @@ SQLite database module for WinSentry
 import sqlite3
 import json
 import logging
-from typing import List, Dict, Optional
+import queue
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 import os
 
+from .log_writer import close_log_writer
+
 logger = logging.getLogger(__name__)
 
+# Rows fetched and converted per step when streaming log queries
+LOG_BATCH_SIZE = 1000
+
+# Bytes of the database file pooled readers access through a memory map rather than
+# read() calls, so scans of large log tables are served straight from the page cache
+READ_MMAP_SIZE = 256 * 1024 * 1024
+
+# Byte counts are scaled by multiplying with the reciprocal; 1/2**20 is exact in binary
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Columns added to existing tables after their first release, as (name, definition)
+COLUMN_MIGRATIONS = {
+    'port_configs': [
+        ('powershell_commands', 'TEXT'),
+        ('recovery_script_delay', 'INTEGER DEFAULT 300'),
+    ],
+    'service_configs': [
+        ('recovery_script_delay', 'INTEGER DEFAULT 300'),
+    ],
+}
+
 
 class Database:
     """SQLite database manager for WinSentry"""
     
+    # Idle read connections kept open for the hot lookup paths
+    READ_POOL_SIZE = 4
+    
     def __init__(self, db_path: str = "winsentry.db"):
         self.db_path = db_path
+        self._read_pool = queue.LifoQueue(maxsize=self.READ_POOL_SIZE)
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection that may be handed between executor threads"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA mmap_size=%d' % READ_MMAP_SIZE)
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """Open a short-lived connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def read_connection(self):
+        """Borrow a pooled connection for a read-only query"""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.row_factory = None
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Flush queued log writes and close pooled connections for this database file"""
+        close_log_writer(self.db_path)
+        while True:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+    
     def init_database(self):
         """Initialize the database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL lets the pooled readers run alongside writers; the mode persists in the file
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                # Create tables, indexes and migrated columns in one transaction so the
+                # schema is applied atomically with a single commit instead of one per statement
+                cursor.execute('BEGIN IMMEDIATE')
+                
                 # Create port configurations table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS port_configs (
@@ -163,42 +242,33 @@ class Database:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_thresholds_service ON service_thresholds(service_name)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_process_logs_service ON service_process_logs(service_name)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_process_logs_timestamp ON service_process_logs(timestamp)')
-                
-                # Add powershell_commands column if it doesn't exist (migration)
-                try:
-                    cursor.execute('ALTER TABLE port_configs ADD COLUMN powershell_commands TEXT')
-                    logger.info("Added powershell_commands column to port_configs table")
-                except sqlite3.OperationalError:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add recovery_script_delay column to port_configs (migration)
-                try:
-                    cursor.execute('ALTER TABLE port_configs ADD COLUMN recovery_script_delay INTEGER DEFAULT 300')
-                    logger.info("Added recovery_script_delay column to port_configs table")
-                except sqlite3.OperationalError:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add recovery_script_delay column to service_configs (migration)
-                try:
-                    cursor.execute('ALTER TABLE service_configs ADD COLUMN recovery_script_delay INTEGER DEFAULT 300')
-                    logger.info("Added recovery_script_delay column to service_configs table")
-                except sqlite3.OperationalError:
-                    # Column already exists, ignore
-                    pass
+                # (key, timestamp) indexes let "WHERE key = ? ORDER BY timestamp DESC LIMIT n"
+                # walk the newest n rows directly instead of sorting every row for that key
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_port_logs_port_timestamp ON port_logs(port, timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_logs_service_timestamp ON service_logs(service_name, timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_process_logs_port_timestamp ON process_logs(port, timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_service_process_logs_service_timestamp ON service_process_logs(service_name, timestamp)')
+                
+                # Add columns introduced after the tables were first created (migration)
+                for table, columns in COLUMN_MIGRATIONS.items():
+                    cursor.execute('PRAGMA table_info(%s)' % table)
+                    existing = {row[1] for row in cursor.fetchall()}
+                    for column, definition in columns:
+                        if column not in existing:
+                            cursor.execute('ALTER TABLE %s ADD COLUMN %s %s' % (table, column, definition))
+                            logger.info("Added %s column to %s table", column, table)
                 
                 conn.commit()
                 logger.info("Database initialized successfully")
                 
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
     
     def save_port_config(self, port: int, interval: int, powershell_script: Optional[str] = None, powershell_commands: Optional[str] = None, enabled: bool = True, recovery_script_delay: int = 20) -> bool:
         """Save or update port configuration"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -208,17 +278,17 @@ class Database:
                 ''', (port, interval, powershell_script, powershell_commands, enabled, recovery_script_delay))
                 
                 conn.commit()
-                logger.info(f"Port configuration saved: port={port}, interval={interval}s, recovery_delay={recovery_script_delay}s")
+                logger.info("Port configuration saved: port=%s, interval=%ss, recovery_delay=%ss", port, interval, recovery_script_delay)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to save port configuration: {e}")
+            logger.error("Failed to save port configuration: %s", e)
             return False
     
     def get_port_config(self, port: int) -> Optional[Dict]:
         """Get port configuration by port number"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -243,14 +313,13 @@ class Database:
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to get port configuration: {e}")
+            logger.error("Failed to get port configuration: %s", e)
             return None
     
     def get_all_port_configs(self) -> List[Dict]:
         """Get all port configurations"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -259,46 +328,44 @@ class Database:
                     FROM port_configs ORDER BY port
                 ''')
                 
-                configs = []
-                for row in cursor.fetchall():
-                    configs.append({
-                        'port': row['port'],
-                        'interval': row['interval_seconds'],
-                        'powershell_script': row['powershell_script'],
-                        'powershell_commands': row['powershell_commands'],
-                        'enabled': bool(row['enabled']),
-                        'recovery_script_delay': row['recovery_script_delay'] or 20,
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at']
-                    })
-                
-                return configs
+                # Unpack plain tuples in one pass rather than going through sqlite3.Row lookups
+                return [{
+                    'port': port,
+                    'interval': interval,
+                    'powershell_script': powershell_script,
+                    'powershell_commands': powershell_commands,
+                    'enabled': bool(enabled),
+                    'recovery_script_delay': recovery_script_delay or 20,
+                    'created_at': created_at,
+                    'updated_at': updated_at
+                } for (port, interval, powershell_script, powershell_commands, enabled,
+                       recovery_script_delay, created_at, updated_at) in cursor.fetchall()]
                 
         except Exception as e:
-            logger.error(f"Failed to get all port configurations: {e}")
+            logger.error("Failed to get all port configurations: %s", e)
             return []
     
     def delete_port_config(self, port: int) -> bool:
         """Delete port configuration"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM port_configs WHERE port = ?', (port,))
                 cursor.execute('DELETE FROM port_logs WHERE port = ?', (port,))
                 
                 conn.commit()
-                logger.info(f"Port configuration deleted: port={port}")
+                logger.info("Port configuration deleted: port=%s", port)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to delete port configuration: {e}")
+            logger.error("Failed to delete port configuration: %s", e)
             return False
     
     def log_port_check(self, port: int, status: str, failure_count: int = 0, message: str = None) -> bool:
         """Log a port check result"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -310,64 +377,40 @@ class Database:
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to log port check: {e}")
+            logger.error("Failed to log port check: %s", e)
             return False
     
     def update_port_status(self, port: int, status: str, failure_count: int = 0) -> bool:
         """Update real-time port status in database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check if port status record exists
-                cursor.execute('SELECT status, last_status_change FROM port_status WHERE port = ?', (port,))
-                existing = cursor.fetchone()
-                
+            with self._connection() as conn:
                 current_time = datetime.now().isoformat()
-                status_changed = False
-                
-                if existing:
-                    old_status = existing[0]
-                    last_change = existing[1]
-                    status_changed = (old_status != status)
-                    
-                    if status_changed:
-                        # Update with status change
-                        cursor.execute('''
-                            UPDATE port_status 
-                            SET status = ?, last_check = ?, failure_count = ?, 
-                                last_status_change = ?, total_checks = total_checks + 1,
-                                successful_checks = CASE WHEN ? = 'ONLINE' THEN successful_checks + 1 ELSE successful_checks END
-                            WHERE port = ?
-                        ''', (status, current_time, failure_count, current_time, status, port))
-                    else:
-                        # Update without status change
-                        cursor.execute('''
-                            UPDATE port_status 
-                            SET last_check = ?, failure_count = ?, total_checks = total_checks + 1,
-                                successful_checks = CASE WHEN ? = 'ONLINE' THEN successful_checks + 1 ELSE successful_checks END
-                            WHERE port = ?
-                        ''', (current_time, failure_count, status, port))
-                else:
-                    # Insert new port status record
-                    cursor.execute('''
-                        INSERT INTO port_status (port, status, last_check, failure_count, 
-                                               last_status_change, total_checks, successful_checks)
-                        VALUES (?, ?, ?, ?, ?, 1, ?)
-                    ''', (port, status, current_time, failure_count, current_time, 1 if status == 'ONLINE' else 0))
-                    status_changed = True
-                
-                conn.commit()
+                # Written synchronously: get_monitored_ports reads port_status straight back
+                # after a check, so a deferred write would serve the previous status.
+                # Single upsert per check; last_status_change only moves when the status flips
+                conn.execute('''
+                    INSERT INTO port_status (port, status, last_check, failure_count, 
+                                           last_status_change, total_checks, successful_checks)
+                    VALUES (?, ?, ?, ?, ?, 1, ?)
+                    ON CONFLICT(port) DO UPDATE SET
+                        last_status_change = CASE WHEN status != excluded.status
+                                                  THEN excluded.last_check ELSE last_status_change END,
+                        status = excluded.status,
+                        last_check = excluded.last_check,
+                        failure_count = excluded.failure_count,
+                        total_checks = total_checks + 1,
+                        successful_checks = successful_checks + excluded.successful_checks
+                ''', (port, status, current_time, failure_count, current_time, 1 if status == 'ONLINE' else 0))
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to update port status: {e}")
+            logger.error("Failed to update port status: %s", e)
             return False
     
     def get_port_status(self, port: Optional[int] = None) -> List[Dict]:
         """Get real-time port status from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -419,13 +462,13 @@ class Database:
                 return status_list
                 
         except Exception as e:
-            logger.error(f"Failed to get port status: {e}")
+            logger.error("Failed to get port status: %s", e)
             return []
     
     def get_port_logs(self, port: Optional[int] = None, limit: int = 100) -> List[Dict]:
         """Get port monitoring logs"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -455,13 +498,13 @@ class Database:
                 return logs
                 
         except Exception as e:
-            logger.error(f"Failed to get port logs: {e}")
+            logger.error("Failed to get port logs: %s", e)
             return []
     
     def cleanup_old_logs(self, days: int = 30) -> int:
         """Clean up old logs older than specified days"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -473,18 +516,18 @@ class Database:
                 conn.commit()
                 
                 if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old log entries")
+                    logger.info("Cleaned up %s old log entries", deleted_count)
                 
                 return deleted_count
                 
         except Exception as e:
-            logger.error(f"Failed to cleanup old logs: {e}")
+            logger.error("Failed to cleanup old logs: %s", e)
             return 0
     
     def get_database_stats(self) -> Dict:
         """Get database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get port config count
@@ -504,7 +547,10 @@ class Database:
                 service_log_count = cursor.fetchone()[0]
                 
                 # Get database size
-                db_size = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+                try:
+                    db_size = os.path.getsize(self.db_path)
+                except OSError:
+                    db_size = 0
                 
                 return {
                     'port_configs': port_config_count,
@@ -513,18 +559,18 @@ class Database:
                     'service_log_entries': service_log_count,
                     'total_log_entries': port_log_count + service_log_count,
                     'database_size_bytes': db_size,
-                    'database_size_mb': round(db_size / (1024 * 1024), 2)
+                    'database_size_mb': round(db_size * _INV_MB, 2)
                 }
                 
         except Exception as e:
-            logger.error(f"Failed to get database stats: {e}")
+            logger.error("Failed to get database stats: %s", e)
             return {}
     
     # Service monitoring methods
     def save_service_config(self, service_name: str, interval: int, powershell_script: Optional[str] = None, powershell_commands: Optional[str] = None, enabled: bool = True, recovery_script_delay: int = 20) -> bool:
         """Save or update service configuration"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -534,17 +580,17 @@ class Database:
                 ''', (service_name, interval, powershell_script, powershell_commands, enabled, recovery_script_delay))
                 
                 conn.commit()
-                logger.info(f"Service configuration saved: service={service_name}, interval={interval}s, recovery_delay={recovery_script_delay}s")
+                logger.info("Service configuration saved: service=%s, interval=%ss, recovery_delay=%ss", service_name, interval, recovery_script_delay)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to save service configuration: {e}")
+            logger.error("Failed to save service configuration: %s", e)
             return False
     
     def get_service_config(self, service_name: str) -> Optional[Dict]:
         """Get service configuration by service name"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -569,13 +615,13 @@ class Database:
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to get service configuration: {e}")
+            logger.error("Failed to get service configuration: %s", e)
             return None
     
     def get_all_service_configs(self) -> List[Dict]:
         """Get all service configurations"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -601,30 +647,30 @@ class Database:
                 return configs
                 
         except Exception as e:
-            logger.error(f"Failed to get all service configurations: {e}")
+            logger.error("Failed to get all service configurations: %s", e)
             return []
     
     def delete_service_config(self, service_name: str) -> bool:
         """Delete service configuration"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM service_configs WHERE service_name = ?', (service_name,))
                 cursor.execute('DELETE FROM service_logs WHERE service_name = ?', (service_name,))
                 
                 conn.commit()
-                logger.info(f"Service configuration deleted: service={service_name}")
+                logger.info("Service configuration deleted: service=%s", service_name)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to delete service configuration: {e}")
+            logger.error("Failed to delete service configuration: %s", e)
             return False
     
     def log_service_check(self, service_name: str, status: str, failure_count: int = 0, message: str = None) -> bool:
         """Log a service check result"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -636,13 +682,13 @@ class Database:
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to log service check: {e}")
+            logger.error("Failed to log service check: %s", e)
             return False
     
     def get_service_logs(self, service_name: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """Get service monitoring logs"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -672,13 +718,13 @@ class Database:
                 return logs
                 
         except Exception as e:
-            logger.error(f"Failed to get service logs: {e}")
+            logger.error("Failed to get service logs: %s", e)
             return []
     
     def cleanup_old_service_logs(self, days: int = 30) -> int:
         """Clean up old service logs older than specified days"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -690,19 +736,19 @@ class Database:
                 conn.commit()
                 
                 if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old service log entries")
+                    logger.info("Cleaned up %s old service log entries", deleted_count)
                 
                 return deleted_count
                 
         except Exception as e:
-            logger.error(f"Failed to cleanup old service logs: {e}")
+            logger.error("Failed to cleanup old service logs: %s", e)
             return 0
     
     # Port resource threshold methods
     def save_port_thresholds(self, port: int, cpu_threshold: float = 0, ram_threshold: float = 0, email_alerts_enabled: bool = False) -> bool:
         """Save or update port resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -712,17 +758,17 @@ class Database:
                 ''', (port, cpu_threshold, ram_threshold, email_alerts_enabled))
                 
                 conn.commit()
-                logger.info(f"Port thresholds saved: port={port}, cpu={cpu_threshold}%, ram={ram_threshold}%")
+                logger.info("Port thresholds saved: port=%s, cpu=%s%%, ram=%s%%", port, cpu_threshold, ram_threshold)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to save port thresholds: {e}")
+            logger.error("Failed to save port thresholds: %s", e)
             return False
     
     def get_port_thresholds(self, port: int) -> Optional[Dict]:
         """Get port resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -744,29 +790,29 @@ class Database:
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to get port thresholds: {e}")
+            logger.error("Failed to get port thresholds: %s", e)
             return None
     
     def delete_port_thresholds(self, port: int) -> bool:
         """Delete port resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM port_thresholds WHERE port = ?', (port,))
                 
                 conn.commit()
-                logger.info(f"Port thresholds deleted: port={port}")
+                logger.info("Port thresholds deleted: port=%s", port)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to delete port thresholds: {e}")
+            logger.error("Failed to delete port thresholds: %s", e)
             return False
     
     def log_process_metrics(self, port: int, pid: int, process_name: str, cpu_percent: float, memory_percent: float, memory_rss_bytes: int) -> bool:
         """Log process resource metrics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -778,14 +824,18 @@ class Database:
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to log process metrics: {e}")
+            logger.error("Failed to log process metrics: %s", e)
             return False
     
     def get_process_logs(self, port: Optional[int] = None, limit: int = 100) -> List[Dict]:
         """Get process monitoring logs"""
+        return [log for batch in self.iter_process_logs(port, limit) for log in batch]
+    
+    def iter_process_logs(self, port: Optional[int] = None, limit: int = 100,
+                          batch_size: int = LOG_BATCH_SIZE) -> Iterator[List[Dict]]:
+        """Yield process monitoring logs in batches of at most batch_size rows"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
                 
                 if port:
@@ -801,29 +851,29 @@ class Database:
                         ORDER BY timestamp DESC LIMIT ?
                     ''', (limit,))
                 
-                logs = []
-                for row in cursor.fetchall():
-                    logs.append({
-                        'port': row['port'],
-                        'pid': row['pid'],
-                        'process_name': row['process_name'],
-                        'cpu_percent': row['cpu_percent'],
-                        'memory_percent': row['memory_percent'],
-                        'memory_rss_bytes': row['memory_rss_bytes'],
-                        'memory_rss_mb': round(row['memory_rss_bytes'] / (1024 * 1024), 2),
-                        'timestamp': row['timestamp']
-                    })
-                
-                return logs
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [{
+                        'port': port,
+                        'pid': pid,
+                        'process_name': process_name,
+                        'cpu_percent': cpu_percent,
+                        'memory_percent': memory_percent,
+                        'memory_rss_bytes': memory_rss_bytes,
+                        'memory_rss_mb': round(memory_rss_bytes * _INV_MB, 2),
+                        'timestamp': timestamp
+                    } for (port, pid, process_name, cpu_percent, memory_percent,
+                           memory_rss_bytes, timestamp) in rows]
                 
         except Exception as e:
-            logger.error(f"Failed to get process logs: {e}")
-            return []
+            logger.error("Failed to get process logs: %s", e)
     
     def cleanup_old_process_logs(self, days: int = 30) -> int:
         """Clean up old process logs older than specified days"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -835,19 +885,19 @@ class Database:
                 conn.commit()
                 
                 if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old process log entries")
+                    logger.info("Cleaned up %s old process log entries", deleted_count)
                 
                 return deleted_count
                 
         except Exception as e:
-            logger.error(f"Failed to cleanup old process logs: {e}")
+            logger.error("Failed to cleanup old process logs: %s", e)
             return 0
     
     # Service resource threshold methods
     def save_service_thresholds(self, service_name: str, cpu_threshold: float = 0, ram_threshold: float = 0, email_alerts_enabled: bool = False) -> bool:
         """Save or update service resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -857,17 +907,17 @@ class Database:
                 ''', (service_name, cpu_threshold, ram_threshold, email_alerts_enabled))
                 
                 conn.commit()
-                logger.info(f"Service thresholds saved: service={service_name}, cpu={cpu_threshold}%, ram={ram_threshold}%")
+                logger.info("Service thresholds saved: service=%s, cpu=%s%%, ram=%s%%", service_name, cpu_threshold, ram_threshold)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to save service thresholds: {e}")
+            logger.error("Failed to save service thresholds: %s", e)
             return False
     
     def get_service_thresholds(self, service_name: str) -> Optional[Dict]:
         """Get service resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -889,14 +939,13 @@ class Database:
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to get service thresholds: {e}")
+            logger.error("Failed to get service thresholds: %s", e)
             return None
     
     def get_all_service_thresholds(self) -> List[Dict]:
         """Get all service resource thresholds with current resource usage"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -905,48 +954,44 @@ class Database:
                     ORDER BY service_name
                 ''')
                 
-                thresholds = []
-                for row in cursor.fetchall():
-                    # Get current resource usage for this service
-                    # This is a simplified version - in a real implementation, you'd get actual current usage
-                    thresholds.append({
-                        'service_name': row['service_name'],
-                        'cpu_threshold': row['cpu_threshold'],
-                        'ram_threshold': row['ram_threshold'],
-                        'email_alerts_enabled': bool(row['email_alerts_enabled']),
-                        'current_cpu': 0.0,  # Placeholder - would be populated with actual current usage
-                        'current_ram': 0.0,  # Placeholder - would be populated with actual current usage
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at'],
-                        'last_updated': row['updated_at']
-                    })
-                
-                return thresholds
+                # Current usage is a placeholder - in a real implementation, you'd get actual current usage
+                return [{
+                    'service_name': service_name,
+                    'cpu_threshold': cpu_threshold,
+                    'ram_threshold': ram_threshold,
+                    'email_alerts_enabled': bool(email_alerts_enabled),
+                    'current_cpu': 0.0,
+                    'current_ram': 0.0,
+                    'created_at': created_at,
+                    'updated_at': updated_at,
+                    'last_updated': updated_at
+                } for (service_name, cpu_threshold, ram_threshold, email_alerts_enabled,
+                       created_at, updated_at) in cursor.fetchall()]
                 
         except Exception as e:
-            logger.error(f"Failed to get all service thresholds: {e}")
+            logger.error("Failed to get all service thresholds: %s", e)
             return []
     
     def delete_service_thresholds(self, service_name: str) -> bool:
         """Delete service resource thresholds"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM service_thresholds WHERE service_name = ?', (service_name,))
                 
                 conn.commit()
-                logger.info(f"Service thresholds deleted: service={service_name}")
+                logger.info("Service thresholds deleted: service=%s", service_name)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to delete service thresholds: {e}")
+            logger.error("Failed to delete service thresholds: %s", e)
             return False
     
     def log_service_process_metrics(self, service_name: str, pid: int, process_name: str, cpu_percent: float, memory_percent: float, memory_rss_bytes: int) -> bool:
         """Log service process resource metrics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -958,14 +1003,18 @@ class Database:
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to log service process metrics: {e}")
+            logger.error("Failed to log service process metrics: %s", e)
             return False
     
     def get_service_process_logs(self, service_name: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """Get service process monitoring logs"""
+        return [log for batch in self.iter_service_process_logs(service_name, limit) for log in batch]
+    
+    def iter_service_process_logs(self, service_name: Optional[str] = None, limit: int = 100,
+                                  batch_size: int = LOG_BATCH_SIZE) -> Iterator[List[Dict]]:
+        """Yield service process monitoring logs in batches of at most batch_size rows"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
                 
                 if service_name:
@@ -981,29 +1030,29 @@ class Database:
                         ORDER BY timestamp DESC LIMIT ?
                     ''', (limit,))
                 
-                logs = []
-                for row in cursor.fetchall():
-                    logs.append({
-                        'service_name': row['service_name'],
-                        'pid': row['pid'],
-                        'process_name': row['process_name'],
-                        'cpu_percent': row['cpu_percent'],
-                        'memory_percent': row['memory_percent'],
-                        'memory_rss_bytes': row['memory_rss_bytes'],
-                        'memory_rss_mb': round(row['memory_rss_bytes'] / (1024 * 1024), 2),
-                        'timestamp': row['timestamp']
-                    })
-                
-                return logs
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [{
+                        'service_name': service_name,
+                        'pid': pid,
+                        'process_name': process_name,
+                        'cpu_percent': cpu_percent,
+                        'memory_percent': memory_percent,
+                        'memory_rss_bytes': memory_rss_bytes,
+                        'memory_rss_mb': round(memory_rss_bytes * _INV_MB, 2),
+                        'timestamp': timestamp
+                    } for (service_name, pid, process_name, cpu_percent, memory_percent,
+                           memory_rss_bytes, timestamp) in rows]
                 
         except Exception as e:
-            logger.error(f"Failed to get service process logs: {e}")
-            return []
+            logger.error("Failed to get service process logs: %s", e)
     
     def cleanup_old_service_process_logs(self, days: int = 30) -> int:
         """Clean up old service process logs older than specified days"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -1015,10 +1064,10 @@ class Database:
                 conn.commit()
                 
                 if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old service process log entries")
+                    logger.info("Cleaned up %s old service process log entries", deleted_count)
                 
                 return deleted_count
                 
         except Exception as e:
-            logger.error(f"Failed to cleanup old service process logs: {e}")
+            logger.error("Failed to cleanup old service process logs: %s", e)
             return 0
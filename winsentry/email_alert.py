@@ -5,6 +5,9 @@ Email alert functionality for WinSentry
 import smtplib
 import logging
 import asyncio
+import queue
+import threading
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -14,8 +17,146 @@ from datetime import datetime
 import json
 import os
 
+from .cache import TTLCache
+from .jsonutil import loads as _loads
+
 logger = logging.getLogger(__name__)
 
+# Cap on simultaneous SMTP sessions; most providers refuse more than a handful per client
+SMTP_MAX_CONCURRENT = int(os.environ.get("WINSENTRY_SMTP_MAX_CONCURRENT", "5"))
+# Temporary-failure reply codes worth retrying, and the backoff before each retry
+SMTP_TRANSIENT_CODES = frozenset((421, 450, 451, 452))
+SMTP_RETRY_DELAYS = (0.5, 1.0, 2.0)
+# Seconds a per-port/per-service alert config is reused before the file is read again
+EMAIL_CONFIG_CACHE_TTL = 30.0
+
+
+class SMTPConnectionPool:
+    """Pool of logged-in SMTP sessions for a single server configuration"""
+    
+    def __init__(self, config: Dict, size: int = SMTP_MAX_CONCURRENT, max_messages_per_connection: int = 100):
+        self.config = dict(config)
+        self.size = size
+        self.max_messages_per_connection = max_messages_per_connection
+        # (server, messages_sent) pairs; LIFO keeps the most recently used session warm
+        self._idle = queue.LifoQueue()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP session"""
+        server = smtplib.SMTP(
+            self.config["smtp_server"],
+            self.config.get("smtp_port", 587),
+            timeout=30
+        )
+        try:
+            if self.config.get("use_tls", True):
+                server.starttls()
+            
+            # Only login if credentials are provided
+            username = self.config.get("smtp_username", "")
+            password = self.config.get("smtp_password", "")
+            if username and password:
+                server.login(username, password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _acquire(self):
+        """Get a live idle session, or open a new one"""
+        while True:
+            try:
+                server, sent = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect(), 0
+            try:
+                if server.noop()[0] == 250:
+                    return server, sent
+            except OSError:
+                # smtplib errors are OSError subclasses too; drop the dead session
+                pass
+            server.close()
+    
+    def _release(self, server: smtplib.SMTP, sent: int):
+        """Return a session to the pool, retiring it once it has sent enough messages"""
+        if sent >= self.max_messages_per_connection or self._idle.qsize() >= self.size:
+            self._quit(server)
+        else:
+            self._idle.put((server, sent))
+    
+    @staticmethod
+    def _quit(server: smtplib.SMTP):
+        """Close a session politely, falling back to dropping the socket"""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a session; it is discarded instead of reused if the block raises"""
+        server, sent = self._acquire()
+        try:
+            yield server
+        except Exception:
+            server.close()
+            raise
+        self._release(server, sent + 1)
+    
+    def healthcheck(self):
+        """Ping an idle session (or log in once) to verify the server is reachable"""
+        server, sent = self._acquire()
+        self._release(server, sent)
+    
+    def close(self):
+        """Quit every idle session"""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(server)
+
+
+# Pools and session caps are shared by every EmailAlert (each monitor builds its own),
+# so the cap holds per SMTP account rather than per component
+_smtp_pools: Dict[tuple, SMTPConnectionPool] = {}
+_smtp_semaphores: Dict[tuple, asyncio.Semaphore] = {}
+_smtp_pools_lock = threading.Lock()
+
+
+def _smtp_key(config: Dict) -> tuple:
+    """The settings that determine an SMTP session, as a hashable key"""
+    return (config.get("smtp_server"), config.get("smtp_port", 587), config.get("smtp_username", ""),
+            config.get("smtp_password", ""), config.get("use_tls", True))
+
+
+def _get_smtp_pool(config: Dict) -> SMTPConnectionPool:
+    """Get the shared pool for an SMTP config"""
+    key = _smtp_key(config)
+    with _smtp_pools_lock:
+        pool = _smtp_pools.get(key)
+        if pool is None:
+            pool = _smtp_pools[key] = SMTPConnectionPool(config)
+        return pool
+
+
+def _discard_smtp_pool(config: Dict):
+    """Close and forget the shared pool for an SMTP config that is no longer in use"""
+    with _smtp_pools_lock:
+        pool = _smtp_pools.pop(_smtp_key(config), None)
+    if pool is not None:
+        pool.close()
+
+
+def _get_smtp_semaphore(config: Dict) -> asyncio.Semaphore:
+    """Shared semaphore bounding in-flight sessions for an SMTP config; only used on the event loop"""
+    key = _smtp_key(config)
+    semaphore = _smtp_semaphores.get(key)
+    if semaphore is None:
+        semaphore = _smtp_semaphores[key] = asyncio.Semaphore(SMTP_MAX_CONCURRENT)
+    return semaphore
+
 
 class EmailAlert:
     """Email alert manager for WinSentry"""
@@ -25,27 +166,28 @@ class EmailAlert:
         self.db_path = db_path
         self.smtp_config = self._load_smtp_config()
         self.email_templates = self._load_email_templates()
+        # Monitors look these up on every failed check; saves and deletes invalidate
+        self._email_config_cache = TTLCache(maxsize=1024, ttl=EMAIL_CONFIG_CACHE_TTL)
     
     def _load_smtp_config(self) -> Dict:
         """Load SMTP configuration from file"""
         config_file = "smtp_config.json"
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            else:
-                # Default configuration
-                return {
-                    "smtp_server": "",
-                    "smtp_port": 587,
-                    "smtp_username": "",
-                    "smtp_password": "",
-                    "use_tls": True,
-                    "from_email": "",
-                    "from_name": "WinSentry Alert System"
-                }
+            with open(config_file, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            # Default configuration
+            return {
+                "smtp_server": "",
+                "smtp_port": 587,
+                "smtp_username": "",
+                "smtp_password": "",
+                "use_tls": True,
+                "from_email": "",
+                "from_name": "WinSentry Alert System"
+            }
         except Exception as e:
-            self.logger.error(f"Failed to load SMTP config: {e}")
+            self.logger.error("Failed to load SMTP config: %s", e)
             return {}
     
     def _save_smtp_config(self, config: Dict) -> bool:
@@ -54,25 +196,57 @@ class EmailAlert:
             config_file = "smtp_config.json"
             with open(config_file, 'w') as f:
                 json.dump(config, f, indent=2)
-            self.smtp_config = config
+            old_config, self.smtp_config = self.smtp_config, config
+            if _smtp_key(old_config) != _smtp_key(config):
+                _discard_smtp_pool(old_config)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save SMTP config: {e}")
+            self.logger.error("Failed to save SMTP config: %s", e)
             return False
     
+    def _deliver(self, msg: MIMEMultipart, recipients: List[str]):
+        """Send a message over a pooled SMTP session"""
+        with _get_smtp_pool(self.smtp_config).connection() as server:
+            server.sendmail(self.smtp_config["from_email"], recipients, msg.as_string())
+    
+    async def _send_message(self, msg: MIMEMultipart, recipients: List[str]):
+        """Send a message, retrying temporary SMTP failures; returns True or an error string"""
+        loop = asyncio.get_event_loop()
+        async with _get_smtp_semaphore(self.smtp_config):
+            for delay in SMTP_RETRY_DELAYS + (None,):
+                try:
+                    await loop.run_in_executor(None, self._deliver, msg, recipients)
+                    return True
+                except smtplib.SMTPResponseException as e:
+                    if delay is None or e.smtp_code not in SMTP_TRANSIENT_CODES:
+                        return str(e)
+                    error = e
+                except smtplib.SMTPServerDisconnected as e:
+                    if delay is None:
+                        return str(e)
+                    error = e
+                except Exception as e:
+                    return str(e)
+                self.logger.warning("Temporary SMTP failure, retrying in %ss: %s", delay, error)
+                await asyncio.sleep(delay)
+    
+    async def test_smtp_connection_async(self) -> Dict:
+        """Run test_smtp_connection off the event loop, within the SMTP session cap"""
+        async with _get_smtp_semaphore(self.smtp_config):
+            return await asyncio.get_event_loop().run_in_executor(None, self.test_smtp_connection)
+    
     def _load_email_templates(self) -> Dict:
         """Load email templates from file"""
         templates_file = "email_templates.json"
         try:
-            if os.path.exists(templates_file):
-                with open(templates_file, 'r') as f:
-                    return json.load(f)
-            else:
-                # Default templates
-                return {
-                    "default": {
-                        "subject": "WinSentry Alert - Port {port} is {status}",
-                        "body": """Dear Administrator,
+            with open(templates_file, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            # Default templates
+            return {
+                "default": {
+                    "subject": "WinSentry Alert - Port {port} is {status}",
+                    "body": """Dear Administrator,
 
 This is an automated alert from WinSentry.
 
@@ -87,10 +261,10 @@ Please check the system immediately.
 
 Best regards,
 WinSentry Alert System"""
-                    },
-                    "service_default": {
-                        "subject": "WinSentry Alert - Service {service_name} is {status}",
-                        "body": """Dear Administrator,
+                },
+                "service_default": {
+                    "subject": "WinSentry Alert - Service {service_name} is {status}",
+                    "body": """Dear Administrator,
 
 This is an automated alert from WinSentry.
 
@@ -105,10 +279,10 @@ Please check the system immediately.
 
 Best regards,
 WinSentry Alert System"""
-                    }
                 }
+            }
         except Exception as e:
-            self.logger.error(f"Failed to load email templates: {e}")
+            self.logger.error("Failed to load email templates: %s", e)
             return {}
     
     def _save_email_templates(self, templates: Dict) -> bool:
@@ -120,7 +294,7 @@ WinSentry Alert System"""
             self.email_templates = templates
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save email templates: {e}")
+            self.logger.error("Failed to save email templates: %s", e)
             return False
     
     def update_smtp_config(self, config: Dict) -> bool:
@@ -148,10 +322,10 @@ WinSentry Alert System"""
             
             return self._save_smtp_config(config)
         except ValueError as e:
-            self.logger.error(f"Invalid SMTP config: {e}")
+            self.logger.error("Invalid SMTP config: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Failed to update SMTP config: {e}")
+            self.logger.error("Failed to update SMTP config: %s", e)
             return False
     
     def get_smtp_config(self) -> Dict:
@@ -174,7 +348,7 @@ WinSentry Alert System"""
             }
             return self._save_email_templates(self.email_templates)
         except Exception as e:
-            self.logger.error(f"Failed to add email template: {e}")
+            self.logger.error("Failed to add email template: %s", e)
             return False
     
     def get_email_templates(self) -> Dict:
@@ -189,7 +363,7 @@ WinSentry Alert System"""
                 return self._save_email_templates(self.email_templates)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to delete email template: {e}")
+            self.logger.error("Failed to delete email template: %s", e)
             return False
     
     def test_smtp_connection(self) -> Dict:
@@ -201,24 +375,8 @@ WinSentry Alert System"""
             if not self.smtp_config.get("from_email"):
                 return {"success": False, "error": "From email not configured"}
             
-            # Create SMTP connection
-            server = smtplib.SMTP(
-                self.smtp_config["smtp_server"], 
-                self.smtp_config.get("smtp_port", 587),
-                timeout=30
-            )
-            
-            # Enable TLS if configured
-            if self.smtp_config.get("use_tls", True):
-                server.starttls()
-            
-            # Only login if credentials are provided
-            username = self.smtp_config.get("smtp_username", "")
-            password = self.smtp_config.get("smtp_password", "")
-            if username and password:
-                server.login(username, password)
-            
-            server.quit()
+            # Reuses an idle pooled session when one is still alive
+            _get_smtp_pool(self.smtp_config).healthcheck()
             
             return {"success": True, "message": "SMTP connection successful"}
         except smtplib.SMTPAuthenticationError as e:
@@ -242,7 +400,7 @@ WinSentry Alert System"""
         # Get template
         template = self.email_templates.get(template_name, self.email_templates.get("default"))
         if not template:
-            self.logger.error(f"Email template '{template_name}' not found")
+            self.logger.error("Email template '%s' not found", template_name)
             return False
         
         # Prepare email data
@@ -268,65 +426,44 @@ WinSentry Alert System"""
         # Add body
         msg.attach(MIMEText(body, 'plain'))
         
-        def _send():
-            try:
-                # Send email
-                server = smtplib.SMTP(
-                    self.smtp_config["smtp_server"], 
-                    self.smtp_config.get("smtp_port", 587),
-                    timeout=30
-                )
-                
-                if self.smtp_config.get("use_tls", True):
-                    server.starttls()
-                
-                # Only login if credentials are provided
-                username = self.smtp_config.get("smtp_username", "")
-                password = self.smtp_config.get("smtp_password", "")
-                if username and password:
-                    server.login(username, password)
-                
-                text = msg.as_string()
-                server.sendmail(self.smtp_config["from_email"], recipients, text)
-                server.quit()
-                return True
-            except Exception as e:
-                return str(e)
-        
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _send)
+            result = await self._send_message(msg, recipients)
             
             if result is True:
-                self.logger.info(f"Alert email sent for port {port} to {len(recipients)} recipients")
+                self.logger.info("Alert email sent for port %s to %s recipients", port, len(recipients))
                 return True
             else:
-                self.logger.error(f"Failed to send alert email: {result}")
+                self.logger.error("Failed to send alert email: %s", result)
                 return False
             
         except Exception as e:
-            self.logger.error(f"Failed to send alert email: {e}")
+            self.logger.error("Failed to send alert email: %s", e)
             return False
     
     def get_port_email_config(self, port: int) -> Dict:
         """Get email configuration for specific port"""
+        # Callers may add keys to the result, so hand out copies of the cached dict
+        cached = self._email_config_cache.get(('port', port))
+        if cached is not None:
+            return dict(cached)
         config_file = f"port_email_config_{port}.json"
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {
-                    "enabled": False,
-                    "recipients": [],
-                    "template": "default",
-                    "powershell_script_failures": 3,
-                    "email_alert_failures": 5,
-                    "custom_data": {}
-                }
+            # Open directly rather than stat first; most ports have no config file
+            with open(config_file, 'rb') as f:
+                config = _loads(f.read())
+        except FileNotFoundError:
+            config = {
+                "enabled": False,
+                "recipients": [],
+                "template": "default",
+                "powershell_script_failures": 3,
+                "email_alert_failures": 5,
+                "custom_data": {}
+            }
         except Exception as e:
-            self.logger.error(f"Failed to get port email config: {e}")
+            self.logger.error("Failed to get port email config: %s", e)
             return {}
+        return dict(self._email_config_cache.set(('port', port), config))
     
     def save_port_email_config(self, port: int, config: Dict) -> bool:
         """Save email configuration for specific port"""
@@ -334,21 +471,24 @@ WinSentry Alert System"""
             config_file = f"port_email_config_{port}.json"
             with open(config_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            self._email_config_cache.invalidate(('port', port))
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save port email config: {e}")
+            self.logger.error("Failed to save port email config: %s", e)
             return False
     
     def delete_port_email_config(self, port: int) -> bool:
         """Delete email configuration for specific port"""
         try:
             config_file = f"port_email_config_{port}.json"
-            if os.path.exists(config_file):
-                os.remove(config_file)
-            return True
+            os.remove(config_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.logger.error(f"Failed to delete port email config: {e}")
+            self.logger.error("Failed to delete port email config: %s", e)
             return False
+        self._email_config_cache.invalidate(('port', port))
+        return True
     
     def get_all_port_email_configs(self) -> List[Dict]:
         """Get all port email configurations"""
@@ -366,7 +506,7 @@ WinSentry Alert System"""
             
             return configs
         except Exception as e:
-            self.logger.error(f"Failed to get all port email configs: {e}")
+            self.logger.error("Failed to get all port email configs: %s", e)
             return []
     
     # Service monitoring email methods
@@ -384,7 +524,7 @@ WinSentry Alert System"""
         # Get template
         template = self.email_templates.get(template_name, self.email_templates.get("service_default"))
         if not template:
-            self.logger.error(f"Email template '{template_name}' not found")
+            self.logger.error("Email template '%s' not found", template_name)
             return False
         
         # Prepare email data
@@ -410,65 +550,44 @@ WinSentry Alert System"""
         # Add body
         msg.attach(MIMEText(body, 'plain'))
         
-        def _send():
-            try:
-                # Send email
-                server = smtplib.SMTP(
-                    self.smtp_config["smtp_server"], 
-                    self.smtp_config.get("smtp_port", 587),
-                    timeout=30
-                )
-                
-                if self.smtp_config.get("use_tls", True):
-                    server.starttls()
-                
-                # Only login if credentials are provided
-                username = self.smtp_config.get("smtp_username", "")
-                password = self.smtp_config.get("smtp_password", "")
-                if username and password:
-                    server.login(username, password)
-                
-                text = msg.as_string()
-                server.sendmail(self.smtp_config["from_email"], recipients, text)
-                server.quit()
-                return True
-            except Exception as e:
-                return str(e)
-        
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _send)
+            result = await self._send_message(msg, recipients)
             
             if result is True:
-                self.logger.info(f"Alert email sent for service {service_name} to {len(recipients)} recipients")
+                self.logger.info("Alert email sent for service %s to %s recipients", service_name, len(recipients))
                 return True
             else:
-                self.logger.error(f"Failed to send service alert email: {result}")
+                self.logger.error("Failed to send service alert email: %s", result)
                 return False
             
         except Exception as e:
-            self.logger.error(f"Failed to send service alert email: {e}")
+            self.logger.error("Failed to send service alert email: %s", e)
             return False
     
     def get_service_email_config(self, service_name: str) -> Dict:
         """Get email configuration for specific service"""
+        # Callers may add keys to the result, so hand out copies of the cached dict
+        cached = self._email_config_cache.get(('service', service_name))
+        if cached is not None:
+            return dict(cached)
         config_file = f"service_email_config_{service_name}.json"
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {
-                    "enabled": False,
-                    "recipients": [],
-                    "template": "service_default",
-                    "powershell_script_failures": 3,
-                    "email_alert_failures": 5,
-                    "custom_data": {}
-                }
+            # Open directly rather than stat first; most services have no config file
+            with open(config_file, 'rb') as f:
+                config = _loads(f.read())
+        except FileNotFoundError:
+            config = {
+                "enabled": False,
+                "recipients": [],
+                "template": "service_default",
+                "powershell_script_failures": 3,
+                "email_alert_failures": 5,
+                "custom_data": {}
+            }
         except Exception as e:
-            self.logger.error(f"Failed to get service email config: {e}")
+            self.logger.error("Failed to get service email config: %s", e)
             return {}
+        return dict(self._email_config_cache.set(('service', service_name), config))
     
     def save_service_email_config(self, service_name: str, config: Dict) -> bool:
         """Save email configuration for specific service"""
@@ -476,18 +595,21 @@ WinSentry Alert System"""
             config_file = f"service_email_config_{service_name}.json"
             with open(config_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            self._email_config_cache.invalidate(('service', service_name))
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save service email config: {e}")
+            self.logger.error("Failed to save service email config: %s", e)
             return False
     
     def delete_service_email_config(self, service_name: str) -> bool:
         """Delete email configuration for specific service"""
         try:
             config_file = f"service_email_config_{service_name}.json"
-            if os.path.exists(config_file):
-                os.remove(config_file)
-            return True
+            os.remove(config_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.logger.error(f"Failed to delete service email config: {e}")
-            return False
\ No newline at end of file
+            self.logger.error("Failed to delete service email config: %s", e)
+            return False
+        self._email_config_cache.invalidate(('service', service_name))
+        return True
\ No newline at end of file
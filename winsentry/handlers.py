@@ -2,18 +2,172 @@
 Tornado request handlers for WinSentry API
 """
 
-import json
+import asyncio
 import logging
+import re
+import time
 import uuid
+import weakref
 from datetime import datetime
-from functools import wraps
+from functools import cached_property, lru_cache, partial, wraps
 
+from tornado.iostream import StreamClosedError
 from tornado.web import RequestHandler, HTTPError
 from tornado import websocket
 
+from .jsonutil import JSONDecodeError as _JSONDecodeError, dumps as _dumps, loads as _loads
+from ._schemas import INTERVAL_MAX, INTERVAL_MIN, AddPortRequest, RequestValidationError
+from .cache import TTLCache
+
 
 logger = logging.getLogger(__name__)
 
+# PID request bodies are tiny ({"pid": 1234}); anything larger is rejected
+MAX_PID_BODY_BYTES = 256
+_PID_BODY_RE = re.compile(rb'^\s*\{\s*"pid"\s*:\s*(\d+)\s*\}\s*$')
+
+
+def _parse_uint(value):
+    """Parse a non-negative decimal integer from an int, str or bytes value"""
+    if type(value) is int:
+        if value < 0:
+            raise ValueError(f"Expected a non-negative integer, got {value}")
+        return value
+    if isinstance(value, (str, bytes)) and value.isascii() and value.isdigit():
+        return int(value)
+    raise ValueError(f"Expected a non-negative integer, got {value!r}")
+
+
+# Query strings repeat the same few port numbers, so remember their parsed values
+_parse_port_arg = lru_cache(maxsize=1024)(_parse_uint)
+
+
+def _parse_pid(body):
+    """Extract the PID from a request body, skipping JSON decode for the common shape"""
+    match = _PID_BODY_RE.match(body)
+    if match:
+        return int(match.group(1))
+    data = _loads(body)
+    return _parse_uint(data.get('pid'))
+
+
+def _port_added_message(success, port, interval, powershell_script, powershell_commands):
+    """Build the result message for adding a port to monitoring"""
+    if not success:
+        if powershell_script:
+            return f"Failed to add port {port} to monitoring - PowerShell script validation failed"
+        return f"Failed to add port {port} to monitoring"
+    if powershell_script:
+        return f"Port {port} added to monitoring with interval {interval}s and PowerShell script file: {powershell_script}"
+    if powershell_commands:
+        return f"Port {port} added to monitoring with interval {interval}s and inline PowerShell commands configured"
+    return f"Port {port} added to monitoring with interval {interval}s"
+
+
+def _port_updated_message(port, interval, powershell_script, powershell_commands, enabled):
+    """Build the success message for a port configuration update, joined once"""
+    parts = [f"Port {port} configuration updated"]
+    if interval is not None:
+        parts.append(f" (interval: {interval}s)")
+    if powershell_script is not None:
+        parts.append(f" (script: {powershell_script})" if powershell_script else " (script removed)")
+    if powershell_commands is not None:
+        parts.append(" (inline commands updated)" if powershell_commands else " (inline commands removed)")
+    if enabled is not None:
+        parts.append(f" (enabled: {enabled})")
+    return ''.join(parts)
+
+
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+# Prebuilt envelopes for the common two-key responses
+_OK_PREFIX = b'{"success": true, "message": '
+_ERR_PREFIX = b'{"success": false, "error": '
+_FAILED_PREFIX = b'{"success": false, "message": '
+
+# Prebuilt bodies for the common static 400 responses
+_ERR_INVALID_PORT = _dumps({'success': False, 'error': 'Invalid port number'})
+_ERR_PORT_REQUIRED = _dumps({'success': False, 'error': 'Port number is required'})
+_ERR_SERVICE_REQUIRED = _dumps({'success': False, 'error': 'Service name is required'})
+_ERR_TARGET_REQUIRED = _dumps({'success': False, 'error': 'Target name is required'})
+_ERR_INVALID_PID = _dumps({'success': False, 'error': 'Invalid process ID'})
+_ERR_PID_REQUIRED = _dumps({'success': False, 'error': 'Process ID (PID) is required'})
+_ERR_BODY_TOO_LARGE = _dumps({'success': False, 'error': 'Request body too large'})
+_ERR_NO_RECIPIENTS = _dumps({'success': False, 'error': 'No recipients specified'})
+_ERR_INVALID_INTERVAL = _dumps({'success': False, 'error': 'Check interval must be between 5 and 3600 seconds'})
+_ERR_INVALID_LIMIT = _dumps({'success': False, 'error': 'Invalid limit parameter'})
+
+# Prebuilt bodies for the remaining fixed-message responses
+_ERR_NO_POWERSHELL_COMMANDS = _dumps({'success': False, 'error': 'No PowerShell commands provided'})
+_ERR_INTERVAL_TOO_SHORT = _dumps({'success': False, 'error': 'Interval must be an integer >= 5 seconds'})
+_ERR_INVALID_PORT_OR_LIMIT = _dumps({'success': False, 'error': 'Invalid port number or limit'})
+_ERR_PORT_CONFIG_NOT_FOUND = _dumps({'success': False, 'error': 'Port configuration not found'})
+_ERR_INVALID_PORT_OR_INTERVAL = _dumps({'success': False, 'error': 'Invalid port number or interval'})
+_ERR_INVALID_PORT_OR_CONFIG = _dumps({'success': False, 'error': 'Invalid port number or configuration'})
+_ERR_INVALID_TEST_TYPE = _dumps({'success': False, 'error': 'Invalid test type'})
+_ERR_TEST_ALERT_FAILED = _dumps({'success': False, 'error': 'Failed to send test alert. Check SMTP configuration.'})
+_ERR_SET_THRESHOLD_FAILED = _dumps({'success': False, 'error': 'Failed to set threshold'})
+_OK_THRESHOLD_REMOVED = _dumps({'success': True, 'message': 'Threshold removed'})
+_ERR_REMOVE_THRESHOLD_FAILED = _dumps({'success': False, 'error': 'Failed to remove threshold'})
+
+# Prebuilt 400 bodies for out-of-range CPU/RAM thresholds
+THRESHOLD_MIN = 0
+THRESHOLD_MAX = 100
+_ERR_CPU_THRESHOLD = _dumps({'success': False, 'error': 'CPU threshold must be between 0 and 100'})
+_ERR_RAM_THRESHOLD = _dumps({'success': False, 'error': 'RAM threshold must be between 0 and 100'})
+
+
+def _threshold_range_error(cpu_threshold, ram_threshold):
+    """Return the prebuilt error body for an out-of-range threshold, or None if both are valid"""
+    if not THRESHOLD_MIN <= cpu_threshold <= THRESHOLD_MAX:
+        return _ERR_CPU_THRESHOLD
+    if not THRESHOLD_MIN <= ram_threshold <= THRESHOLD_MAX:
+        return _ERR_RAM_THRESHOLD
+    return None
+
+
+# Thresholds and port configs change rarely; GETs are served from these until a write
+# through the API invalidates them or the TTL runs out
+_port_threshold_cache = TTLCache()
+_service_threshold_cache = TTLCache()
+_port_config_cache = TTLCache()
+
+# Encoded bodies for list endpoints, invalidated by the handlers that write them
+_ALL_SERVICE_THRESHOLDS = 'service_thresholds'
+_response_cache = TTLCache(maxsize=32)
+
+# Row counts are full COUNT(*) scans; the stats page can be a few seconds stale
+_database_stats_cache = TTLCache(maxsize=1, ttl=10.0)
+_DATABASE_STATS = 'database_stats'
+
+# Back-to-back UI calls (list, kill, list) share one process enumeration per port
+PROCESS_CACHE_TTL = 0.1
+_port_process_cache = TTLCache(maxsize=64, ttl=PROCESS_CACHE_TTL)
+# Per-port [lock, users] pairs, removed once the last caller for a port is done
+_port_process_locks = {}
+
+
+async def _cached_processes(port_monitor, port):
+    """Get processes on a port, reusing a result younger than PROCESS_CACHE_TTL"""
+    entry = _port_process_locks.get(port)
+    if entry is None:
+        entry = _port_process_locks[port] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            return await _port_process_cache.get_or_load_async(
+                port, lambda: port_monitor.get_processes_on_port(port)
+            )
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _port_process_locks[port]
+
+
+def _invalidate_processes(port):
+    """Drop the cached process list for a port after it changes"""
+    _port_process_cache.invalidate(port)
+
 
 def validate_json_body(required_fields=None):
     """Decorator to validate JSON request body"""
@@ -22,45 +176,54 @@ def validate_json_body(required_fields=None):
         async def wrapper(self, *args, **kwargs):
             try:
                 if self.request.body:
-                    data = json.loads(self.request.body)
+                    data = self.json_body
                     if required_fields:
                         missing = [f for f in required_fields if f not in data]
                         if missing:
-                            self.write_json({
-                                'success': False,
-                                'error': f'Missing required fields: {", ".join(missing)}'
-                            }, 400)
+                            self.write_err(f'Missing required fields: {", ".join(missing)}', 400)
                             return
                     self._json_data = data
                 else:
                     self._json_data = {}
-            except json.JSONDecodeError as e:
-                self.write_json({
-                    'success': False,
-                    'error': f'Invalid JSON: {str(e)}'
-                }, 400)
+            except _JSONDecodeError as e:
+                self.write_err(f'Invalid JSON: {str(e)}', 400)
                 return
             return await func(self, *args, **kwargs)
         return wrapper
     return decorator
 
 
+def json_endpoint(func):
+    """Decorator to turn uncaught handler errors into JSON error responses"""
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        except ValueError as e:
+            self.write_err(f"Invalid input: {e}", 400)
+        except Exception as e:
+            logger.error("%s failed: %s", func.__qualname__, e)
+            self.write_err(str(e), 500)
+    return wrapper
+
+
 class BaseHandler(RequestHandler):
     """Base handler with common functionality and production-ready features"""
     
     def prepare(self):
         """Prepare the request - add request ID for tracking"""
         self._request_id = str(uuid.uuid4())[:8]
-        self._start_time = datetime.now()
+        # perf_counter is monotonic and avoids building a datetime per request
+        self._start_time = time.perf_counter()
     
     def on_finish(self):
         """Log request completion with timing"""
         if hasattr(self, '_start_time'):
-            duration = (datetime.now() - self._start_time).total_seconds() * 1000
+            duration = (time.perf_counter() - self._start_time) * 1000
             if duration > 1000:  # Log slow requests (>1s)
                 logger.warning(
-                    f"[{self._request_id}] Slow request: {self.request.method} {self.request.uri} "
-                    f"completed in {duration:.2f}ms"
+                    "[%s] Slow request: %s %s completed in %.2fms",
+                    self._request_id, self.request.method, self.request.uri, duration
                 )
     
     def set_default_headers(self):
@@ -83,9 +246,38 @@ class BaseHandler(RequestHandler):
     
     def write_json(self, data, status=200):
         """Write JSON response with proper headers"""
+        # 200 is already the default status, so only set it when it differs
+        if status != 200:
+            self.set_status(status)
+        self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+        self.write(_dumps(data))
+    
+    def write_json_bytes(self, payload, status=200):
+        """Write an already encoded JSON body"""
+        if status != 200:
+            self.set_status(status)
+        self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+        self.write(payload)
+    
+    def write_ok(self, message, status=200):
+        """Write a success response with a message using a prebuilt envelope"""
+        if status != 200:
+            self.set_status(status)
+        self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+        self.write(b''.join((_OK_PREFIX, _dumps(message), b'}')))
+    
+    def write_result(self, success, message, status=200):
+        """Write a {"success", "message"} response using a prebuilt envelope"""
+        if status != 200:
+            self.set_status(status)
+        self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+        self.write(b''.join((_OK_PREFIX if success else _FAILED_PREFIX, _dumps(message), b'}')))
+    
+    def write_err(self, error, status=500):
+        """Write an error response using a prebuilt envelope"""
         self.set_status(status)
-        self.set_header("Content-Type", "application/json; charset=utf-8")
-        self.write(json.dumps(data, default=str, ensure_ascii=False))
+        self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+        self.write(b''.join((_ERR_PREFIX, _dumps(error), b'}')))
     
     def write_error(self, status_code, **kwargs):
         """Custom error handler for better error responses"""
@@ -97,7 +289,7 @@ class BaseHandler(RequestHandler):
                 error_message = exc.log_message or str(exc)
             else:
                 error_message = str(exc)
-                logger.error(f"[{getattr(self, '_request_id', 'unknown')}] Error: {error_message}", 
+                logger.error("[%s] Error: %s", getattr(self, '_request_id', 'unknown'), error_message, 
                            exc_info=kwargs["exc_info"])
         
         self.write_json({
@@ -106,15 +298,59 @@ class BaseHandler(RequestHandler):
             'status_code': status_code
         }, status_code)
     
-    def get_json_body(self):
-        """Safely parse JSON body"""
+    def _port_arg(self):
+        """Get the required 'port' query argument as an int"""
+        return _parse_port_arg(self.get_argument('port'))
+    
+    def _db(self, fn, *args, **kwargs):
+        """Run a blocking database call on the shared DB executor"""
+        if kwargs:
+            fn = partial(fn, **kwargs)
+        return asyncio.get_running_loop().run_in_executor(self.application.db_executor, fn, *args)
+    
+    async def _stream_logs(self, batches):
+        """Write {"success", "logs", "log_count"} from a batch iterator, flushing between batches"""
+        count = 0
+        try:
+            # Each batch is fetched on the DB executor so the IOLoop keeps serving. The first
+            # one is fetched before anything is written, so a failure there still gets a clean
+            # error response from json_endpoint
+            batch = await self._db(next, batches, None)
+            self.set_header("Content-Type", _JSON_CONTENT_TYPE)
+            self.write(b'{"success": true, "logs": [')
+            while batch is not None:
+                if count:
+                    self.write(b',')
+                self.write(_dumps(batch)[1:-1])
+                count += len(batch)
+                try:
+                    await self.flush()
+                    batch = await self._db(next, batches, None)
+                except StreamClosedError:
+                    # Client went away mid-stream
+                    return
+                except Exception as e:
+                    # The 200 status line and part of the body are already out, so an error
+                    # envelope would only corrupt the JSON; drop the connection instead
+                    logger.error("Streaming %s failed after %d row(s): %s", self.request.path, count, e)
+                    self.request.connection.close()
+                    return
+        finally:
+            batches.close()
+        self.write(b'], "log_count": %d}' % count)
+    
+    @cached_property
+    def json_body(self):
+        """Request body decoded once per request; raises ValueError on invalid JSON"""
         if hasattr(self, '_json_data'):
             return self._json_data
+        return _loads(self.request.body) if self.request.body else {}
+    
+    def get_json_body(self):
+        """Safely parse JSON body"""
         try:
-            if self.request.body:
-                return json.loads(self.request.body)
-            return {}
-        except json.JSONDecodeError:
+            return self.json_body
+        except _JSONDecodeError:
             return {}
 
 
@@ -123,7 +359,7 @@ class MainHandler(BaseHandler):
     
     async def get(self):
         self.set_header("Content-Type", "text/html; charset=utf-8")
-        self.render("index.html")
+        self.write(self.application.index_page)
 
 
 class EmailConfigPageHandler(BaseHandler):
@@ -131,7 +367,7 @@ class EmailConfigPageHandler(BaseHandler):
     
     async def get(self):
         self.set_header("Content-Type", "text/html; charset=utf-8")
-        self.render("email_config.html")
+        self.write(self.application.email_config_page)
 
 
 class PortMonitorHandler(BaseHandler):
@@ -140,95 +376,46 @@ class PortMonitorHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get list of monitored ports"""
-        try:
-            ports = self.port_monitor.get_monitored_ports()
-            self.write_json({
-                'success': True,
-                'ports': ports
-            })
-        except Exception as e:
-            logger.error(f"Failed to get monitored ports: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        ports = self.port_monitor.get_monitored_ports()
+        self.write_json({
+            'success': True,
+            'ports': ports
+        })
     
+    @json_endpoint
     async def post(self):
         """Add a new port to monitor"""
         try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
-            interval = int(data.get('interval', 30))
-            powershell_script = data.get('powershell_script')
-            powershell_commands = data.get('powershell_commands')
-            
-            # Validate port number
-            if port < 1 or port > 65535:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number must be between 1 and 65535'
-                }, 400)
-                return
-            
-            # Validate interval
-            if interval < 5 or interval > 3600:
-                self.write_json({
-                    'success': False,
-                    'error': 'Check interval must be between 5 and 3600 seconds'
-                }, 400)
-                return
+            req = AddPortRequest.from_dict(self.json_body)
+            port = req.port
+            interval = req.interval
+            powershell_script = req.powershell_script
+            powershell_commands = req.powershell_commands
             
             success = await self.port_monitor.add_port(port, interval, powershell_script, powershell_commands)
+            _port_config_cache.invalidate(port)
             
-            if success:
-                message = f"Port {port} added to monitoring with interval {interval}s"
-                if powershell_script:
-                    message += f" and PowerShell script file: {powershell_script}"
-                elif powershell_commands:
-                    message += f" and inline PowerShell commands configured"
-            else:
-                message = f"Failed to add port {port} to monitoring"
-                if powershell_script:
-                    message += " - PowerShell script validation failed"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
+            self.write_result(success, _port_added_message(success, port, interval, powershell_script, powershell_commands))
             
+        except RequestValidationError as e:
+            self.write_err(str(e), 400)
         except ValueError as e:
-            self.write_json({
-                'success': False,
-                'error': f"Invalid input: {str(e)}"
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to add port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_err(f"Invalid input: {str(e)}", 400)
     
+    @json_endpoint
     async def delete(self):
         """Remove a port from monitoring"""
-        try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
-            
-            success = await self.port_monitor.remove_port(port)
-            
-            self.write_json({
-                'success': success,
-                'message': f"Port {port} {'removed' if success else 'not found'} from monitoring"
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to remove port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        port = _parse_uint(data.get('port'))
+        
+        success = await self.port_monitor.remove_port(port)
+        _port_config_cache.invalidate(port)
+        _invalidate_processes(port)
+        
+        self.write_result(success, f"Port {port} {'removed' if success else 'not found'} from monitoring")
 
 
 class PortKillProcessHandler(BaseHandler):
@@ -237,17 +424,19 @@ class PortKillProcessHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Kill a specific process by PID"""
         try:
-            data = json.loads(self.request.body)
-            pid = int(data.get('pid'))
+            body = self.request.body
+            if len(body) > MAX_PID_BODY_BYTES:
+                self.write_json_bytes(_ERR_BODY_TOO_LARGE, 400)
+                return
+            
+            pid = _parse_pid(body)
             
             if not pid:
-                self.write_json({
-                    'success': False,
-                    'error': 'Process ID (PID) is required'
-                }, 400)
+                self.write_json_bytes(_ERR_PID_REQUIRED, 400)
                 return
             
             success = await self.port_monitor.kill_process(pid)
@@ -258,16 +447,7 @@ class PortKillProcessHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid process ID'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to kill process: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PID, 400)
 
 
 class PortForceKillProcessHandler(BaseHandler):
@@ -276,17 +456,19 @@ class PortForceKillProcessHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Force kill a specific process by PID"""
         try:
-            data = json.loads(self.request.body)
-            pid = int(data.get('pid'))
+            body = self.request.body
+            if len(body) > MAX_PID_BODY_BYTES:
+                self.write_json_bytes(_ERR_BODY_TOO_LARGE, 400)
+                return
+            
+            pid = _parse_pid(body)
             
             if not pid:
-                self.write_json({
-                    'success': False,
-                    'error': 'Process ID (PID) is required'
-                }, 400)
+                self.write_json_bytes(_ERR_PID_REQUIRED, 400)
                 return
             
             success = await self.port_monitor.force_kill_process(pid)
@@ -297,16 +479,7 @@ class PortForceKillProcessHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid process ID'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to force kill process: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PID, 400)
 
 
 class PortMonitoringStatusHandler(BaseHandler):
@@ -315,20 +488,14 @@ class PortMonitoringStatusHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get port monitoring status"""
-        try:
-            status = self.port_monitor.get_monitoring_status()
-            self.write_json({
-                'success': True,
-                'status': status
-            })
-        except Exception as e:
-            logger.error(f"Failed to get monitoring status: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        status = await self._db(self.port_monitor.get_monitoring_status)
+        self.write_json({
+            'success': True,
+            'status': status
+        })
 
 
 class ServicesHandler(BaseHandler):
@@ -337,89 +504,64 @@ class ServicesHandler(BaseHandler):
     def initialize(self, service_manager):
         self.service_manager = service_manager
     
+    @json_endpoint
     async def get(self):
         """Get all Windows services"""
-        try:
-            # Get all services from the service manager
-            services = await self.service_manager.get_services()
-            
-            self.write_json({
-                'success': True,
-                'services': services
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get services: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        # Get all services from the service manager
+        services = await self.service_manager.get_services()
+        
+        self.write_json({
+            'success': True,
+            'services': services
+        })
 
 
 class ServiceActionHandler(BaseHandler):
     """Handle service action requests (start/stop/restart)"""
     
+    _ACTIONS = {
+        'start': 'start_service',
+        'stop': 'stop_service',
+        'restart': 'restart_service'
+    }
+    
     def initialize(self, service_manager):
         self.service_manager = service_manager
     
+    @json_endpoint
     async def post(self, service_name, action):
         """Perform action on a service"""
-        try:
-            if action == 'start':
-                success = await self.service_manager.start_service(service_name)
-            elif action == 'stop':
-                success = await self.service_manager.stop_service(service_name)
-            elif action == 'restart':
-                success = await self.service_manager.restart_service(service_name)
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Invalid action: {action}'
-                }, 400)
-                return
-            
-            if success:
-                message = f"Service {service_name} {action}ed successfully"
-            else:
-                message = f"Failed to {action} service {service_name}"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to {action} service {service_name}: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        method_name = self._ACTIONS.get(action)
+        if method_name is None:
+            self.write_err(f'Invalid action: {action}', 400)
+            return
+        
+        success = await getattr(self.service_manager, method_name)(service_name)
+        
+        if success:
+            message = f"Service {service_name} {action}ed successfully"
+        else:
+            message = f"Failed to {action} service {service_name}"
+        
+        self.write_result(success, message)
 
 
 class LogsHandler(BaseHandler):
     """Handle log requests"""
     
+    @json_endpoint
     async def get(self):
         """Get monitoring logs"""
-        try:
-            port = self.get_argument('port', None)
-            port = int(port) if port else None
-            
-            # Get logs from port monitor
-            app = self.application
-            logs = app.port_monitor.get_port_logs(port)
-            
-            self.write_json({
-                'success': True,
-                'logs': logs
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get logs: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        port = self.get_argument('port', None)
+        port = _parse_uint(port) if port else None
+        
+        # Get logs from port monitor
+        logs = await self._db(self.application.port_monitor.get_port_logs, port)
+        
+        self.write_json({
+            'success': True,
+            'logs': logs
+        })
 
 
 class PortKillHandler(BaseHandler):
@@ -428,42 +570,35 @@ class PortKillHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Kill process using a specific port"""
-        try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
-            
-            # Get processes using the port
-            processes = await self.port_monitor.get_processes_on_port(port)
-            
-            if not processes:
-                self.write_json({
-                    'success': False,
-                    'message': f'No processes found using port {port}'
-                })
-                return
-            
-            killed_count = 0
-            for process in processes:
-                try:
-                    await self.port_monitor.kill_process(process['pid'])
-                    killed_count += 1
-                    logger.info(f"Killed process {process['pid']} ({process['name']}) using port {port}")
-                except Exception as e:
-                    logger.error(f"Failed to kill process {process['pid']}: {e}")
-            
-            self.write_json({
-                'success': True,
-                'message': f'Killed {killed_count} process(es) using port {port}'
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to kill processes on port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        port = _parse_uint(data.get('port'))
+        
+        # Get processes using the port
+        processes = await _cached_processes(self.port_monitor, port)
+        
+        if not processes:
+            self.write_result(False, f'No processes found using port {port}')
+            return
+        
+        # Kill all processes concurrently; each kill runs in the executor
+        results = await asyncio.gather(
+            *(self.port_monitor.kill_process(p['pid']) for p in processes),
+            return_exceptions=True
+        )
+        _invalidate_processes(port)
+        
+        killed_count = 0
+        for process, result in zip(processes, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to kill process %s: %s", process['pid'], result)
+            elif result is True:
+                killed_count += 1
+                logger.info("Killed process %s (%s) using port %s", process['pid'], process['name'], port)
+        
+        self.write_ok(f'Killed {killed_count} process(es) using port {port}')
 
 
 class PortForceKillHandler(BaseHandler):
@@ -472,42 +607,35 @@ class PortForceKillHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Force kill all processes using a specific port"""
-        try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
-            
-            # Get all processes using the port
-            processes = await self.port_monitor.get_processes_on_port(port)
-            
-            if not processes:
-                self.write_json({
-                    'success': False,
-                    'message': f'No processes found using port {port}'
-                })
-                return
-            
-            killed_count = 0
-            for process in processes:
-                try:
-                    await self.port_monitor.force_kill_process(process['pid'])
-                    killed_count += 1
-                    logger.info(f"Force killed process {process['pid']} ({process['name']}) using port {port}")
-                except Exception as e:
-                    logger.error(f"Failed to force kill process {process['pid']}: {e}")
-            
-            self.write_json({
-                'success': True,
-                'message': f'Force killed {killed_count} process(es) using port {port}'
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to force kill processes on port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        port = _parse_uint(data.get('port'))
+        
+        # Get all processes using the port
+        processes = await _cached_processes(self.port_monitor, port)
+        
+        if not processes:
+            self.write_result(False, f'No processes found using port {port}')
+            return
+        
+        # Kill all processes concurrently; each kill runs in the executor
+        results = await asyncio.gather(
+            *(self.port_monitor.force_kill_process(p['pid']) for p in processes),
+            return_exceptions=True
+        )
+        _invalidate_processes(port)
+        
+        killed_count = 0
+        for process, result in zip(processes, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to force kill process %s: %s", process['pid'], result)
+            elif result is True:
+                killed_count += 1
+                logger.info("Force killed process %s (%s) using port %s", process['pid'], process['name'], port)
+        
+        self.write_ok(f'Force killed {killed_count} process(es) using port {port}')
 
 
 class DatabaseStatsHandler(BaseHandler):
@@ -516,41 +644,29 @@ class DatabaseStatsHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get database statistics"""
-        try:
-            stats = self.port_monitor.get_database_stats()
-            self.write_json({
-                'success': True,
-                'stats': stats
-            })
-        except Exception as e:
-            logger.error(f"Failed to get database stats: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        async def load():
+            stats = await self._db(self.port_monitor.get_database_stats)
+            return _dumps({'success': True, 'stats': stats})
+        
+        self.write_json_bytes(await _database_stats_cache.get_or_load_async(_DATABASE_STATS, load))
     
+    @json_endpoint
     async def post(self):
         """Clean up old logs"""
-        try:
-            data = json.loads(self.request.body)
-            days = int(data.get('days', 30))
-            
-            cleaned_count = self.port_monitor.cleanup_old_logs(days)
-            
-            self.write_json({
-                'success': True,
-                'message': f'Cleaned up {cleaned_count} old log entries',
-                'cleaned_count': cleaned_count
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to cleanup logs: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        days = int(data.get('days', 30))
+        
+        cleaned_count = await self._db(self.port_monitor.cleanup_old_logs, days)
+        _database_stats_cache.invalidate(_DATABASE_STATS)
+        
+        self.write_json({
+            'success': True,
+            'message': f'Cleaned up {cleaned_count} old log entries',
+            'cleaned_count': cleaned_count
+        })
 
 
 class PortCheckNowHandler(BaseHandler):
@@ -559,25 +675,20 @@ class PortCheckNowHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Trigger immediate status check for a specific port"""
         try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
+            data = self.json_body
+            port = _parse_uint(data.get('port'))
             
             if not port:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number is required'
-                }, 400)
+                self.write_json_bytes(_ERR_PORT_REQUIRED, 400)
                 return
             
             # Check if port is being monitored
             if port not in self.port_monitor.monitored_ports:
-                self.write_json({
-                    'success': False,
-                    'error': f'Port {port} is not being monitored'
-                }, 404)
+                self.write_err(f'Port {port} is not being monitored', 404)
                 return
             
             # Perform immediate status check
@@ -597,16 +708,7 @@ class PortCheckNowHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to check port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class ServiceCheckNowHandler(BaseHandler):
@@ -615,49 +717,36 @@ class ServiceCheckNowHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def post(self):
         """Trigger immediate status check for a specific service"""
-        try:
-            data = json.loads(self.request.body)
-            service_name = data.get('service_name')
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            # Check if service is being monitored
-            if service_name not in self.service_monitor.monitored_services:
-                self.write_json({
-                    'success': False,
-                    'error': f'Service {service_name} is not being monitored'
-                }, 404)
-                return
-            
-            # Perform immediate status check
-            await self.service_monitor.check_service(service_name)
-            
-            # Get updated status
-            config = self.service_monitor.monitored_services.get(service_name)
-            status = config.last_status if config.last_status else 'unknown'
-            
-            self.write_json({
-                'success': True,
-                'service_name': service_name,
-                'status': status,
-                'last_check': config.last_check.isoformat() if config.last_check else None,
-                'failure_count': config.failure_count,
-                'message': f'Service {service_name} checked: {status.upper()}'
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to check service: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        service_name = data.get('service_name')
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        # Check if service is being monitored
+        if service_name not in self.service_monitor.monitored_services:
+            self.write_err(f'Service {service_name} is not being monitored', 404)
+            return
+        
+        # Perform immediate status check
+        await self.service_monitor.check_service(service_name)
+        
+        # Get updated status
+        config = self.service_monitor.monitored_services.get(service_name)
+        status = config.last_status if config.last_status else 'unknown'
+        
+        self.write_json({
+            'success': True,
+            'service_name': service_name,
+            'status': status,
+            'last_check': config.last_check.isoformat() if config.last_check else None,
+            'failure_count': config.failure_count,
+            'message': f'Service {service_name} checked: {status.upper()}'
+        })
 
 
 class PowerShellExecuteHandler(BaseHandler):
@@ -666,38 +755,28 @@ class PowerShellExecuteHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Execute PowerShell commands and return output"""
-        try:
-            data = json.loads(self.request.body)
-            commands = data.get('commands', '')
-            port = data.get('port', 9999)
-            
-            if not commands.strip():
-                self.write_json({
-                    'success': False,
-                    'error': 'No PowerShell commands provided'
-                })
-                return
-            
-            # Execute PowerShell commands
-            result = await self.port_monitor.execute_powershell_commands(commands, port)
-            
-            self.write_json({
-                'success': result['success'],
-                'stdout': result['stdout'],
-                'stderr': result['stderr'],
-                'exit_code': result['exit_code'],
-                'execution_time': result['execution_time'],
-                'error': result.get('error')
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to execute PowerShell commands: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        commands = data.get('commands', '')
+        port = data.get('port', 9999)
+        
+        if not commands.strip():
+            self.write_json_bytes(_ERR_NO_POWERSHELL_COMMANDS)
+            return
+        
+        # Execute PowerShell commands
+        result = await self.port_monitor.execute_powershell_commands(commands, port)
+        
+        self.write_json({
+            'success': result['success'],
+            'stdout': result['stdout'],
+            'stderr': result['stderr'],
+            'exit_code': result['exit_code'],
+            'execution_time': result['execution_time'],
+            'error': result.get('error')
+        })
 
 
 class ServiceConfigHandler(BaseHandler):
@@ -706,50 +785,37 @@ class ServiceConfigHandler(BaseHandler):
     def initialize(self, service_manager):
         self.service_manager = service_manager
     
+    @json_endpoint
     async def get(self):
         """Get current service configuration"""
-        try:
-            config = self.service_manager.get_service_config()
-            self.write_json({
-                'success': True,
-                'config': config
-            })
-        except Exception as e:
-            logger.error(f"Failed to get service config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        config = self.service_manager.get_service_config()
+        self.write_json({
+            'success': True,
+            'config': config
+        })
     
+    @json_endpoint
     async def post(self):
         """Update service configuration"""
-        try:
-            data = json.loads(self.request.body)
-            
-            load_all_services = data.get('load_all_services')
-            disable_auto_refresh = data.get('disable_auto_refresh')
-            watched_services = data.get('watched_services', [])
-            excluded_services = data.get('excluded_services', [])
-            
-            self.service_manager.update_service_config(
-                load_all_services=load_all_services,
-                disable_auto_refresh=disable_auto_refresh,
-                watched_services=watched_services,
-                excluded_services=excluded_services
-            )
-            
-            self.write_json({
-                'success': True,
-                'message': 'Service configuration updated successfully',
-                'config': self.service_manager.get_service_config()
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to update service config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        load_all_services = data.get('load_all_services')
+        disable_auto_refresh = data.get('disable_auto_refresh')
+        watched_services = data.get('watched_services', [])
+        excluded_services = data.get('excluded_services', [])
+        
+        self.service_manager.update_service_config(
+            load_all_services=load_all_services,
+            disable_auto_refresh=disable_auto_refresh,
+            watched_services=watched_services,
+            excluded_services=excluded_services
+        )
+        
+        self.write_json({
+            'success': True,
+            'message': 'Service configuration updated successfully',
+            'config': self.service_manager.get_service_config()
+        })
 
 
 class ServiceMonitorHandler(BaseHandler):
@@ -758,20 +824,14 @@ class ServiceMonitorHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get monitored services"""
-        try:
-            services = await self.service_monitor.get_monitored_services_async()
-            self.write_json({
-                'success': True,
-                'services': services
-            })
-        except Exception as e:
-            logger.error(f"Failed to get monitored services: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        services = await self.service_monitor.get_monitored_services_async()
+        self.write_json({
+            'success': True,
+            'services': services
+        })
 
 
 class ServiceMonitorConfigHandler(BaseHandler):
@@ -780,153 +840,102 @@ class ServiceMonitorConfigHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def post(self):
         """Add or update service monitoring configuration"""
-        try:
-            data = json.loads(self.request.body)
-            
-            service_name = data.get('service_name')
-            interval = data.get('interval', 30)
-            powershell_script = data.get('powershell_script') or data.get('recovery_script')
-            powershell_commands = data.get('powershell_commands')
-            enabled = data.get('enabled', True)
-            
-            # Auto-restart configuration
-            auto_restart_enabled = data.get('auto_restart_enabled', True)
-            max_restart_attempts = int(data.get('max_restart_attempts', 3))
-            restart_delay = int(data.get('restart_delay', 5))
-            
-            # Alert configuration
-            email_recipients = data.get('email_recipients', '')
-            alert_on_stopped = data.get('alert_on_stopped', True)
-            alert_on_started = data.get('alert_on_started', False)
-            alert_on_restart_success = data.get('alert_on_restart_success', True)
-            alert_on_restart_failed = data.get('alert_on_restart_failed', True)
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            # Validate interval
-            if not isinstance(interval, int) or interval < 5:
-                self.write_json({
-                    'success': False,
-                    'error': 'Interval must be an integer >= 5 seconds'
-                }, 400)
-                return
-            
-            success = await self.service_monitor.add_service(
-                service_name=service_name,
-                interval=interval,
-                powershell_script=powershell_script,
-                powershell_commands=powershell_commands,
-                enabled=enabled,
-                auto_restart_enabled=auto_restart_enabled,
-                max_restart_attempts=max_restart_attempts,
-                restart_delay=restart_delay,
-                email_recipients=email_recipients,
-                alert_on_stopped=alert_on_stopped,
-                alert_on_started=alert_on_started,
-                alert_on_restart_success=alert_on_restart_success,
-                alert_on_restart_failed=alert_on_restart_failed
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Service {service_name} added to monitoring'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to add service {service_name} to monitoring'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to configure service monitoring: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        service_name = data.get('service_name')
+        interval = data.get('interval', 30)
+        powershell_script = data.get('powershell_script') or data.get('recovery_script')
+        powershell_commands = data.get('powershell_commands')
+        enabled = data.get('enabled', True)
+        
+        # Auto-restart configuration
+        auto_restart_enabled = data.get('auto_restart_enabled', True)
+        max_restart_attempts = int(data.get('max_restart_attempts', 3))
+        restart_delay = int(data.get('restart_delay', 5))
+        
+        # Alert configuration
+        email_recipients = data.get('email_recipients', '')
+        alert_on_stopped = data.get('alert_on_stopped', True)
+        alert_on_started = data.get('alert_on_started', False)
+        alert_on_restart_success = data.get('alert_on_restart_success', True)
+        alert_on_restart_failed = data.get('alert_on_restart_failed', True)
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        # Validate interval
+        if not isinstance(interval, int) or interval < 5:
+            self.write_json_bytes(_ERR_INTERVAL_TOO_SHORT, 400)
+            return
+        
+        success = await self.service_monitor.add_service(
+            service_name=service_name,
+            interval=interval,
+            powershell_script=powershell_script,
+            powershell_commands=powershell_commands,
+            enabled=enabled,
+            auto_restart_enabled=auto_restart_enabled,
+            max_restart_attempts=max_restart_attempts,
+            restart_delay=restart_delay,
+            email_recipients=email_recipients,
+            alert_on_stopped=alert_on_stopped,
+            alert_on_started=alert_on_started,
+            alert_on_restart_success=alert_on_restart_success,
+            alert_on_restart_failed=alert_on_restart_failed
+        )
+        
+        if success:
+            self.write_ok(f'Service {service_name} added to monitoring')
+        else:
+            self.write_err(f'Failed to add service {service_name} to monitoring', 500)
     
+    @json_endpoint
     async def put(self):
         """Update service monitoring configuration"""
-        try:
-            data = json.loads(self.request.body)
-            
-            service_name = data.get('service_name')
-            interval = data.get('interval')
-            powershell_script = data.get('powershell_script')
-            powershell_commands = data.get('powershell_commands')
-            enabled = data.get('enabled')
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            success = await self.service_monitor.update_service_config(
-                service_name=service_name,
-                interval=interval,
-                powershell_script=powershell_script,
-                powershell_commands=powershell_commands,
-                enabled=enabled
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Service {service_name} configuration updated'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to update service {service_name} configuration'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to update service monitoring: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        service_name = data.get('service_name')
+        interval = data.get('interval')
+        powershell_script = data.get('powershell_script')
+        powershell_commands = data.get('powershell_commands')
+        enabled = data.get('enabled')
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        success = await self.service_monitor.update_service_config(
+            service_name=service_name,
+            interval=interval,
+            powershell_script=powershell_script,
+            powershell_commands=powershell_commands,
+            enabled=enabled
+        )
+        
+        if success:
+            self.write_ok(f'Service {service_name} configuration updated')
+        else:
+            self.write_err(f'Failed to update service {service_name} configuration', 500)
     
+    @json_endpoint
     async def delete(self):
         """Remove service from monitoring"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            success = await self.service_monitor.remove_service(service_name)
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Service {service_name} removed from monitoring'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to remove service {service_name} from monitoring'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to remove service monitoring: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        success = await self.service_monitor.remove_service(service_name)
+        
+        if success:
+            self.write_ok(f'Service {service_name} removed from monitoring')
+        else:
+            self.write_err(f'Failed to remove service {service_name} from monitoring', 500)
 
 
 class ServiceEmailConfigHandler(BaseHandler):
@@ -935,97 +944,55 @@ class ServiceEmailConfigHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get service email configuration"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            config = self.service_monitor.email_alert.get_service_email_config(service_name)
-            self.write_json({
-                'success': True,
-                'config': config
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get service email config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        config = self.service_monitor.email_alert.get_service_email_config(service_name)
+        self.write_json({
+            'success': True,
+            'config': config
+        })
     
+    @json_endpoint
     async def post(self):
         """Save service email configuration"""
-        try:
-            data = json.loads(self.request.body)
-            
-            service_name = data.get('service_name')
-            config = data.get('config', {})
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            success = self.service_monitor.email_alert.save_service_email_config(service_name, config)
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Email configuration saved for service {service_name}'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to save email configuration for service {service_name}'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to save service email config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        service_name = data.get('service_name')
+        config = data.get('config', {})
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        success = self.service_monitor.email_alert.save_service_email_config(service_name, config)
+        
+        if success:
+            self.write_ok(f'Email configuration saved for service {service_name}')
+        else:
+            self.write_err(f'Failed to save email configuration for service {service_name}', 500)
     
+    @json_endpoint
     async def delete(self):
         """Delete service email configuration"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            success = self.service_monitor.email_alert.delete_service_email_config(service_name)
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Email configuration deleted for service {service_name}'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to delete email configuration for service {service_name}'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to delete service email config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        success = self.service_monitor.email_alert.delete_service_email_config(service_name)
+        
+        if success:
+            self.write_ok(f'Email configuration deleted for service {service_name}')
+        else:
+            self.write_err(f'Failed to delete email configuration for service {service_name}', 500)
 
 
 class PortProcessHandler(BaseHandler):
@@ -1034,12 +1001,13 @@ class PortProcessHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get processes on a specific port"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
-            processes = await self.port_monitor.get_processes_on_port(port)
+            processes = await _cached_processes(self.port_monitor, port)
             
             self.write_json({
                 'success': True,
@@ -1049,16 +1017,7 @@ class PortProcessHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get processes for port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class PortResourceSummaryHandler(BaseHandler):
@@ -1067,10 +1026,11 @@ class PortResourceSummaryHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get comprehensive resource summary for a port"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
             summary = await self.port_monitor.get_port_resource_summary(port)
             
@@ -1080,16 +1040,7 @@ class PortResourceSummaryHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get resource summary for port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class PortThresholdHandler(BaseHandler):
@@ -1098,12 +1049,15 @@ class PortThresholdHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get port resource thresholds"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
-            thresholds = self.port_monitor.db.get_port_thresholds(port)
+            thresholds = await _port_threshold_cache.get_or_load_async(
+                port, lambda: self._db(self.port_monitor.db.get_port_thresholds, port)
+            )
             
             self.write_json({
                 'success': True,
@@ -1112,109 +1066,68 @@ class PortThresholdHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get port thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
     
+    @json_endpoint
     async def post(self):
         """Set port resource thresholds"""
-        try:
-            data = json.loads(self.request.body)
-            
-            port = data.get('port')
-            cpu_threshold = data.get('cpu_threshold', 0)
-            ram_threshold = data.get('ram_threshold', 0)
-            email_alerts_enabled = data.get('email_alerts_enabled', False)
-            
-            if not port:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number is required'
-                }, 400)
-                return
-            
-            # Validate thresholds
-            if cpu_threshold < 0 or cpu_threshold > 100:
-                self.write_json({
-                    'success': False,
-                    'error': 'CPU threshold must be between 0 and 100'
-                }, 400)
-                return
-            
-            if ram_threshold < 0 or ram_threshold > 100:
-                self.write_json({
-                    'success': False,
-                    'error': 'RAM threshold must be between 0 and 100'
-                }, 400)
-                return
-            
-            success = self.port_monitor.db.save_port_thresholds(
-                port=port,
-                cpu_threshold=cpu_threshold,
-                ram_threshold=ram_threshold,
-                email_alerts_enabled=email_alerts_enabled
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Thresholds saved for port {port}',
-                    'thresholds': {
-                        'port': port,
-                        'cpu_threshold': cpu_threshold,
-                        'ram_threshold': ram_threshold,
-                        'email_alerts_enabled': email_alerts_enabled
-                    }
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to save thresholds for port {port}'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to save port thresholds: {e}")
+        data = self.json_body
+        
+        port = data.get('port')
+        cpu_threshold = data.get('cpu_threshold', 0)
+        ram_threshold = data.get('ram_threshold', 0)
+        email_alerts_enabled = data.get('email_alerts_enabled', False)
+        
+        if not port:
+            self.write_json_bytes(_ERR_PORT_REQUIRED, 400)
+            return
+        
+        # Validate thresholds
+        error = _threshold_range_error(cpu_threshold, ram_threshold)
+        if error is not None:
+            self.write_json_bytes(error, 400)
+            return
+        
+        success = await self._db(
+            self.port_monitor.db.save_port_thresholds,
+            port=port,
+            cpu_threshold=cpu_threshold,
+            ram_threshold=ram_threshold,
+            email_alerts_enabled=email_alerts_enabled
+        )
+        # port may arrive as a string or an int here, so drop every cached entry
+        _port_threshold_cache.clear()
+        
+        if success:
             self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+                'success': True,
+                'message': f'Thresholds saved for port {port}',
+                'thresholds': {
+                    'port': port,
+                    'cpu_threshold': cpu_threshold,
+                    'ram_threshold': ram_threshold,
+                    'email_alerts_enabled': email_alerts_enabled
+                }
+            })
+        else:
+            self.write_err(f'Failed to save thresholds for port {port}', 500)
     
+    @json_endpoint
     async def delete(self):
         """Delete port resource thresholds"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
-            success = self.port_monitor.db.delete_port_thresholds(port)
+            success = await self._db(self.port_monitor.db.delete_port_thresholds, port)
+            _port_threshold_cache.invalidate(port)
             
             if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Thresholds deleted for port {port}'
-                })
+                self.write_ok(f'Thresholds deleted for port {port}')
             else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to delete thresholds for port {port}'
-                }, 500)
+                self.write_err(f'Failed to delete thresholds for port {port}', 500)
                 
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to delete port thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class PortThresholdCheckHandler(BaseHandler):
@@ -1223,10 +1136,11 @@ class PortThresholdCheckHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Check if port processes exceed thresholds"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
             result = await self.port_monitor.check_resource_thresholds(port)
             
@@ -1237,16 +1151,7 @@ class PortThresholdCheckHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to check port thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class ProcessLogsHandler(BaseHandler):
@@ -1255,6 +1160,7 @@ class ProcessLogsHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get process monitoring logs"""
         try:
@@ -1262,27 +1168,12 @@ class ProcessLogsHandler(BaseHandler):
             limit = int(self.get_argument('limit', 100))
             
             if port:
-                port = int(port)
-            
-            logs = self.port_monitor.db.get_process_logs(port, limit)
+                port = _parse_uint(port)
             
-            self.write_json({
-                'success': True,
-                'logs': logs,
-                'log_count': len(logs)
-            })
+            await self._stream_logs(self.port_monitor.db.iter_process_logs(port, limit))
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number or limit'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get process logs: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT_OR_LIMIT, 400)
 
 
 class ServiceProcessHandler(BaseHandler):
@@ -1291,26 +1182,19 @@ class ServiceProcessHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get processes for a specific service"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            processes = await self.service_monitor.get_service_processes(service_name)
-            
-            self.write_json({
-                'success': True,
-                'service_name': service_name,
-                'processes': processes,
-                'process_count': len(processes)
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get processes for service: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        processes = await self.service_monitor.get_service_processes(service_name)
+        
+        self.write_json({
+            'success': True,
+            'service_name': service_name,
+            'processes': processes,
+            'process_count': len(processes)
+        })
 
 
 class ServiceResourceSummaryHandler(BaseHandler):
@@ -1319,24 +1203,17 @@ class ServiceResourceSummaryHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get comprehensive resource summary for a service"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            summary = await self.service_monitor.get_service_resource_summary(service_name)
-            
-            self.write_json({
-                'success': True,
-                'summary': summary
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get resource summary for service: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        summary = await self.service_monitor.get_service_resource_summary(service_name)
+        
+        self.write_json({
+            'success': True,
+            'summary': summary
+        })
 
 
 class ServiceThresholdHandler(BaseHandler):
@@ -1345,121 +1222,87 @@ class ServiceThresholdHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get service resource thresholds"""
-        try:
-            service_name = self.get_argument('service_name', None)
-            
-            if service_name:
-                # Get specific service thresholds
-                thresholds = self.service_monitor.db.get_service_thresholds(service_name)
-                self.write_json({
-                    'success': True,
-                    'service_name': service_name,
-                    'thresholds': thresholds or {}
-                })
-            else:
-                # Get all service thresholds
-                thresholds = self.service_monitor.db.get_all_service_thresholds()
-                self.write_json({
-                    'success': True,
-                    'thresholds': thresholds
-                })
-            
-        except Exception as e:
-            logger.error(f"Failed to get service thresholds: {e}")
+        service_name = self.get_argument('service_name', None)
+        
+        if service_name:
+            # Get specific service thresholds
+            thresholds = await _service_threshold_cache.get_or_load_async(
+                service_name, lambda: self._db(self.service_monitor.db.get_service_thresholds, service_name)
+            )
             self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+                'success': True,
+                'service_name': service_name,
+                'thresholds': thresholds or {}
+            })
+        else:
+            # Get all service thresholds, encoded once until the next write
+            async def load_all():
+                thresholds = await self._db(self.service_monitor.db.get_all_service_thresholds)
+                return _dumps({'success': True, 'thresholds': thresholds})
+            
+            body = await _response_cache.get_or_load_async(_ALL_SERVICE_THRESHOLDS, load_all)
+            self.write_json_bytes(body)
     
+    @json_endpoint
     async def post(self):
         """Set service resource thresholds"""
-        try:
-            data = json.loads(self.request.body)
-            
-            service_name = data.get('service_name')
-            cpu_threshold = data.get('cpu_threshold', 0)
-            ram_threshold = data.get('ram_threshold', 0)
-            email_alerts_enabled = data.get('email_alerts_enabled', False)
-            
-            if not service_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Service name is required'
-                }, 400)
-                return
-            
-            # Validate thresholds
-            if cpu_threshold < 0 or cpu_threshold > 100:
-                self.write_json({
-                    'success': False,
-                    'error': 'CPU threshold must be between 0 and 100'
-                }, 400)
-                return
-            
-            if ram_threshold < 0 or ram_threshold > 100:
-                self.write_json({
-                    'success': False,
-                    'error': 'RAM threshold must be between 0 and 100'
-                }, 400)
-                return
-            
-            success = self.service_monitor.db.save_service_thresholds(
-                service_name=service_name,
-                cpu_threshold=cpu_threshold,
-                ram_threshold=ram_threshold,
-                email_alerts_enabled=email_alerts_enabled
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Thresholds saved for service {service_name}',
-                    'thresholds': {
-                        'service_name': service_name,
-                        'cpu_threshold': cpu_threshold,
-                        'ram_threshold': ram_threshold,
-                        'email_alerts_enabled': email_alerts_enabled
-                    }
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to save thresholds for service {service_name}'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to save service thresholds: {e}")
+        data = self.json_body
+        
+        service_name = data.get('service_name')
+        cpu_threshold = data.get('cpu_threshold', 0)
+        ram_threshold = data.get('ram_threshold', 0)
+        email_alerts_enabled = data.get('email_alerts_enabled', False)
+        
+        if not service_name:
+            self.write_json_bytes(_ERR_SERVICE_REQUIRED, 400)
+            return
+        
+        # Validate thresholds
+        error = _threshold_range_error(cpu_threshold, ram_threshold)
+        if error is not None:
+            self.write_json_bytes(error, 400)
+            return
+        
+        success = await self._db(
+            self.service_monitor.db.save_service_thresholds,
+            service_name=service_name,
+            cpu_threshold=cpu_threshold,
+            ram_threshold=ram_threshold,
+            email_alerts_enabled=email_alerts_enabled
+        )
+        _service_threshold_cache.invalidate(service_name)
+        _response_cache.invalidate(_ALL_SERVICE_THRESHOLDS)
+        
+        if success:
             self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+                'success': True,
+                'message': f'Thresholds saved for service {service_name}',
+                'thresholds': {
+                    'service_name': service_name,
+                    'cpu_threshold': cpu_threshold,
+                    'ram_threshold': ram_threshold,
+                    'email_alerts_enabled': email_alerts_enabled
+                }
+            })
+        else:
+            self.write_err(f'Failed to save thresholds for service {service_name}', 500)
     
+    @json_endpoint
     async def delete(self):
         """Delete service resource thresholds"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            success = self.service_monitor.db.delete_service_thresholds(service_name)
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Thresholds deleted for service {service_name}'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to delete thresholds for service {service_name}'
-                }, 500)
-                
-        except Exception as e:
-            logger.error(f"Failed to delete service thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        success = await self._db(self.service_monitor.db.delete_service_thresholds, service_name)
+        _service_threshold_cache.invalidate(service_name)
+        _response_cache.invalidate(_ALL_SERVICE_THRESHOLDS)
+        
+        if success:
+            self.write_ok(f'Thresholds deleted for service {service_name}')
+        else:
+            self.write_err(f'Failed to delete thresholds for service {service_name}', 500)
 
 
 class ServiceThresholdCheckHandler(BaseHandler):
@@ -1468,25 +1311,18 @@ class ServiceThresholdCheckHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Check if service processes exceed thresholds"""
-        try:
-            service_name = self.get_argument('service_name')
-            
-            result = await self.service_monitor.check_service_resource_thresholds(service_name)
-            
-            self.write_json({
-                'success': True,
-                'service_name': service_name,
-                'result': result
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to check service thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        service_name = self.get_argument('service_name')
+        
+        result = await self.service_monitor.check_service_resource_thresholds(service_name)
+        
+        self.write_json({
+            'success': True,
+            'service_name': service_name,
+            'result': result
+        })
 
 
 class ServiceProcessLogsHandler(BaseHandler):
@@ -1495,118 +1331,173 @@ class ServiceProcessLogsHandler(BaseHandler):
     def initialize(self, service_monitor):
         self.service_monitor = service_monitor
     
+    @json_endpoint
     async def get(self):
         """Get service process monitoring logs"""
         try:
             service_name = self.get_argument('service_name', None)
             limit = int(self.get_argument('limit', 100))
             
-            logs = self.service_monitor.db.get_service_process_logs(service_name, limit)
-            
-            self.write_json({
-                'success': True,
-                'logs': logs,
-                'log_count': len(logs)
-            })
+            await self._stream_logs(self.service_monitor.db.iter_service_process_logs(service_name, limit))
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid limit parameter'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get service process logs: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_LIMIT, 400)
 
 
 class PortStatusWebSocketHandler(websocket.WebSocketHandler):
     """WebSocket handler for real-time port status updates"""
     
-    # Class variable to store all connected clients
-    clients = set()
+    # Class variable to store all connected clients; weak so a handler that never
+    # reaches on_close is dropped once it is garbage collected
+    clients = weakref.WeakSet()
+    
+    # Last encoded port_status_update, shared by every client until it goes stale
+    PAYLOAD_TTL = 1.0
+    _cached_payload = None
+    _cached_at = 0.0
+    
+    # Shared lookup for concurrent opens/request_update messages while the payload is stale
+    _inflight = None
+    
+    # Second-resolution ISO timestamp shared by all messages sent within that second
+    _ts_second = 0
+    _ts_string = ''
+    
+    # Heartbeats skip JSON entirely: known ping frames are matched verbatim and the
+    # pong is spliced from a template around the cached timestamp
+    _PING_MESSAGES = frozenset(('{"type":"ping"}', '{"type": "ping"}'))
+    _PONG_PREFIX = b'{"type":"pong","timestamp":"'
+    _PONG_SUFFIX = b'"}'
+    _pong_second = 0
+    _pong_message = b''
     
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
-    def open(self):
+    async def open(self):
         """Handle new WebSocket connection"""
         logger.info("WebSocket connection opened")
         self.clients.add(self)
         
         # Send current port status immediately
         try:
-            ports = self.port_monitor.get_monitored_ports()
-            self.write_message(json.dumps({
-                'type': 'port_status_update',
-                'data': {
-                    'ports': ports,
-                    'timestamp': self._get_timestamp()
-                }
-            }))
+            self.write_message(await self._port_status_payload())
         except Exception as e:
-            logger.error(f"Failed to send initial port status: {e}")
+            logger.error("Failed to send initial port status: %s", e)
     
     def on_close(self):
         """Handle WebSocket connection close"""
         logger.info("WebSocket connection closed")
         self.clients.discard(self)
     
-    def on_message(self, message):
+    async def on_message(self, message):
         """Handle incoming WebSocket message"""
         try:
-            data = json.loads(message)
+            if message in self._PING_MESSAGES:
+                self.write_message(self._get_pong())
+                return
+            # Binary frames arrive as bytes; anything that is not a JSON object is ignored
+            if message[:1] not in ('{', b'{'):
+                return
+            
+            data = _loads(message)
             message_type = data.get('type')
             
             if message_type == 'ping':
                 # Respond to ping with pong
-                self.write_message(json.dumps({
-                    'type': 'pong',
-                    'timestamp': self._get_timestamp()
-                }))
+                self.write_message(self._get_pong())
             elif message_type == 'request_update':
                 # Send current port status
-                ports = self.port_monitor.get_monitored_ports()
-                self.write_message(json.dumps({
-                    'type': 'port_status_update',
-                    'data': {
-                        'ports': ports,
-                        'timestamp': self._get_timestamp()
-                    }
-                }))
+                self.write_message(await self._port_status_payload())
         except Exception as e:
-            logger.error(f"Failed to handle WebSocket message: {e}")
+            logger.error("Failed to handle WebSocket message: %s", e)
     
-    def _get_timestamp(self):
-        """Get current timestamp in ISO format"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    async def _port_status_payload(self):
+        """Get the encoded port status, reusing the cached payload while it is fresh"""
+        cls = type(self)
+        if cls._cached_payload is not None and time.monotonic() - cls._cached_at < cls.PAYLOAD_TTL:
+            return cls._cached_payload
+        if cls._inflight is None:
+            cls._inflight = asyncio.ensure_future(cls._load_port_status(self.port_monitor))
+            cls._inflight.add_done_callback(cls._clear_inflight)
+        # Shielded so one client disconnecting does not cancel the lookup for the others
+        return await asyncio.shield(cls._inflight)
     
     @classmethod
-    def broadcast_port_update(cls, port_data):
-        """Broadcast port status update to all connected clients"""
-        if not cls.clients:
-            return
-        
-        from datetime import datetime
-        
-        message = json.dumps({
+    async def _load_port_status(cls, port_monitor):
+        """Read monitored ports off the event loop and encode them"""
+        loop = asyncio.get_running_loop()
+        port_data = await loop.run_in_executor(None, port_monitor.get_monitored_ports)
+        return cls._encode_port_update(port_data)
+    
+    @classmethod
+    def _clear_inflight(cls, future):
+        """Allow the next stale read to start a new lookup"""
+        cls._inflight = None
+    
+    @classmethod
+    def _encode_port_update(cls, port_data):
+        """Encode a port_status_update message and cache it for other clients"""
+        payload = _dumps({
             'type': 'port_status_update',
             'data': {
                 'ports': port_data,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': cls._get_timestamp()
             }
         })
+        cls._cached_payload = payload
+        cls._cached_at = time.monotonic()
+        return payload
+    
+    @classmethod
+    def _get_timestamp(cls):
+        """Get current timestamp in ISO format, formatted at most once per second"""
+        now = int(time.time())
+        if now != cls._ts_second:
+            cls._ts_second = now
+            cls._ts_string = datetime.fromtimestamp(now).isoformat()
+        return cls._ts_string
+    
+    @classmethod
+    def _get_pong(cls):
+        """Get the encoded pong message, rebuilt only when the timestamp changes"""
+        timestamp = cls._get_timestamp()
+        if cls._pong_second != cls._ts_second:
+            cls._pong_second = cls._ts_second
+            cls._pong_message = b''.join((cls._PONG_PREFIX, timestamp.encode('ascii'), cls._PONG_SUFFIX))
+        return cls._pong_message
+    
+    @classmethod
+    async def broadcast_port_update(cls, port_data):
+        """Broadcast port status update to all connected clients"""
+        if not cls.clients:
+            return
         
-        # Send to all connected clients
+        message = cls._encode_port_update(port_data)
+        
+        # Queue the frame on every client first, then wait for all writes together;
+        # bytes still go out as text frames
+        failed = set()
+        pending = {}
         for client in list(cls.clients):
             try:
-                client.write_message(message)
-            except Exception as e:
-                logger.error(f"Failed to send WebSocket message to client: {e}")
-                cls.clients.discard(client)
+                future = client.write_message(message)
+            except Exception:
+                failed.add(client)
+                continue
+            # Most frames flush straight into the socket buffer; only wait on the rest
+            if not future.done():
+                pending[future] = client
+            elif future.cancelled() or future.exception() is not None:
+                failed.add(client)
+        
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            failed.update(client for client, result in zip(pending.values(), results)
+                          if isinstance(result, BaseException))
+        if failed:
+            logger.error("Failed to send WebSocket message to %d client(s)", len(failed))
+            cls.clients -= failed
 
 
 class PortConfigHandler(BaseHandler):
@@ -1615,19 +1506,19 @@ class PortConfigHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get port configuration"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
             # Get port configuration from database
-            config = self.port_monitor.db.get_port_config(port)
+            config = await _port_config_cache.get_or_load_async(
+                port, lambda: self._db(self.port_monitor.db.get_port_config, port)
+            )
             
             if not config:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port configuration not found'
-                }, 404)
+                self.write_json_bytes(_ERR_PORT_CONFIG_NOT_FOUND, 404)
                 return
             
             self.write_json({
@@ -1642,165 +1533,80 @@ class PortConfigHandler(BaseHandler):
             })
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to get port configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
     
+    @json_endpoint
     async def post(self):
         """Add a new port to monitor"""
         try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
-            interval = int(data.get('interval', 30))
-            powershell_script = data.get('powershell_script')
-            powershell_commands = data.get('powershell_commands')
-            
-            # Validate port number
-            if port < 1 or port > 65535:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number must be between 1 and 65535'
-                }, 400)
-                return
-            
-            # Validate interval
-            if interval < 5 or interval > 3600:
-                self.write_json({
-                    'success': False,
-                    'error': 'Check interval must be between 5 and 3600 seconds'
-                }, 400)
-                return
+            req = AddPortRequest.from_dict(self.json_body)
+            port = req.port
+            interval = req.interval
+            powershell_script = req.powershell_script
+            powershell_commands = req.powershell_commands
             
             success = await self.port_monitor.add_port(port, interval, powershell_script, powershell_commands)
+            _port_config_cache.invalidate(port)
             
-            if success:
-                message = f"Port {port} added to monitoring with interval {interval}s"
-                if powershell_script:
-                    message += f" and PowerShell script file: {powershell_script}"
-                elif powershell_commands:
-                    message += f" and inline PowerShell commands configured"
-            else:
-                message = f"Failed to add port {port} to monitoring"
-                if powershell_script:
-                    message += " - PowerShell script validation failed"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
+            self.write_result(success, _port_added_message(success, port, interval, powershell_script, powershell_commands))
             
+        except RequestValidationError as e:
+            self.write_err(str(e), 400)
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number or interval'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to add port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT_OR_INTERVAL, 400)
     
+    @json_endpoint
     async def put(self):
         """Update port configuration"""
         try:
-            data = json.loads(self.request.body)
-            port = int(data.get('port'))
+            data = self.json_body
+            port = _parse_uint(data.get('port'))
             interval = data.get('interval')
             powershell_script = data.get('powershell_script')
             powershell_commands = data.get('powershell_commands')
             enabled = data.get('enabled')
             
             if not port:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number is required'
-                }, 400)
+                self.write_json_bytes(_ERR_PORT_REQUIRED, 400)
                 return
             
             # Validate interval if provided
-            if interval is not None and (interval < 5 or interval > 3600):
-                self.write_json({
-                    'success': False,
-                    'error': 'Check interval must be between 5 and 3600 seconds'
-                }, 400)
+            if interval is not None and not INTERVAL_MIN <= interval <= INTERVAL_MAX:
+                self.write_json_bytes(_ERR_INVALID_INTERVAL, 400)
                 return
             
             success = await self.port_monitor.update_port_config(
                 port, interval, powershell_script, powershell_commands, enabled
             )
+            _port_config_cache.invalidate(port)
             
             if success:
-                message = f"Port {port} configuration updated"
-                if interval is not None:
-                    message += f" (interval: {interval}s)"
-                if powershell_script is not None:
-                    if powershell_script:
-                        message += f" (script: {powershell_script})"
-                    else:
-                        message += " (script removed)"
-                if powershell_commands is not None:
-                    if powershell_commands:
-                        message += " (inline commands updated)"
-                    else:
-                        message += " (inline commands removed)"
-                if enabled is not None:
-                    message += f" (enabled: {enabled})"
+                self.write_ok(_port_updated_message(port, interval, powershell_script, powershell_commands, enabled))
             else:
-                message = f"Failed to update port {port} configuration"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
+                self.write_result(False, f"Failed to update port {port} configuration")
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number or configuration'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to update port configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT_OR_CONFIG, 400)
     
+    @json_endpoint
     async def delete(self):
         """Remove port from monitoring"""
         try:
-            port = int(self.get_argument('port'))
+            port = self._port_arg()
             
             success = await self.port_monitor.remove_port(port)
+            _port_config_cache.invalidate(port)
+            _invalidate_processes(port)
             
             if success:
                 message = f"Port {port} removed from monitoring"
             else:
                 message = f"Failed to remove port {port} from monitoring"
             
-            self.write_json({
-                'success': success,
-                'message': message
-            })
+            self.write_result(success, message)
             
         except ValueError:
-            self.write_json({
-                'success': False,
-                'error': 'Invalid port number'
-            }, 400)
-        except Exception as e:
-            logger.error(f"Failed to remove port: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            self.write_json_bytes(_ERR_INVALID_PORT, 400)
 
 
 class EmailConfigHandler(BaseHandler):
@@ -1809,56 +1615,39 @@ class EmailConfigHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get email configuration"""
-        try:
-            # Get email configuration from the port monitor's email alert system
-            config = self.port_monitor.email_alert.get_smtp_config()
-            
-            self.write_json({
-                'success': True,
-                'smtp_config': config
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get email configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        # Get email configuration from the port monitor's email alert system
+        config = self.port_monitor.email_alert.get_smtp_config()
+        
+        self.write_json({
+            'success': True,
+            'smtp_config': config
+        })
     
+    @json_endpoint
     async def post(self):
         """Save email configuration"""
-        try:
-            data = json.loads(self.request.body)
-            
-            # Save SMTP configuration
-            success = self.port_monitor.email_alert.update_smtp_config({
-                'smtp_server': data.get('smtp_server'),
-                'smtp_port': data.get('smtp_port'),
-                'smtp_username': data.get('smtp_username'),
-                'smtp_password': data.get('smtp_password'),
-                'from_email': data.get('from_email'),
-                'from_name': data.get('from_name'),
-                'use_tls': data.get('use_tls', True)
-            })
-            
-            if success:
-                message = "Email configuration saved successfully"
-            else:
-                message = "Failed to save email configuration"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to save email configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        # Save SMTP configuration
+        success = self.port_monitor.email_alert.update_smtp_config({
+            'smtp_server': data.get('smtp_server'),
+            'smtp_port': data.get('smtp_port'),
+            'smtp_username': data.get('smtp_username'),
+            'smtp_password': data.get('smtp_password'),
+            'from_email': data.get('from_email'),
+            'from_name': data.get('from_name'),
+            'use_tls': data.get('use_tls', True)
+        })
+        
+        if success:
+            message = "Email configuration saved successfully"
+        else:
+            message = "Failed to save email configuration"
+        
+        self.write_result(success, message)
 
 
 class EmailTemplateHandler(BaseHandler):
@@ -1867,75 +1656,48 @@ class EmailTemplateHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get all email templates"""
-        try:
-            templates = self.port_monitor.email_alert.get_email_templates()
-            
-            self.write_json({
-                'success': True,
-                'templates': templates
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get email templates: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        templates = self.port_monitor.email_alert.get_email_templates()
+        
+        self.write_json({
+            'success': True,
+            'templates': templates
+        })
     
+    @json_endpoint
     async def post(self):
         """Create or update email template"""
-        try:
-            data = json.loads(self.request.body)
-            
-            success = self.port_monitor.email_alert.add_email_template(
-                template_name=data.get('name') or data.get('template_name'),
-                subject=data.get('subject'),
-                body=data.get('body')
-            )
-            
-            if success:
-                message = f"Template '{data.get('template_name')}' saved successfully"
-            else:
-                message = f"Failed to save template '{data.get('template_name')}'"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to save email template: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        success = self.port_monitor.email_alert.add_email_template(
+            template_name=data.get('name') or data.get('template_name'),
+            subject=data.get('subject'),
+            body=data.get('body')
+        )
+        
+        if success:
+            message = f"Template '{data.get('template_name')}' saved successfully"
+        else:
+            message = f"Failed to save template '{data.get('template_name')}'"
+        
+        self.write_result(success, message)
     
+    @json_endpoint
     async def delete(self):
         """Delete email template"""
-        try:
-            data = json.loads(self.request.body)
-            template_name = data.get('template_name')
-            
-            success = self.port_monitor.email_alert.delete_email_template(template_name)
-            
-            if success:
-                message = f"Template '{template_name}' deleted successfully"
-            else:
-                message = f"Failed to delete template '{template_name}'"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to delete email template: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        template_name = data.get('template_name')
+        
+        success = self.port_monitor.email_alert.delete_email_template(template_name)
+        
+        if success:
+            message = f"Template '{template_name}' deleted successfully"
+        else:
+            message = f"Failed to delete template '{template_name}'"
+        
+        self.write_result(success, message)
 
 
 class PortEmailConfigHandler(BaseHandler):
@@ -1944,73 +1706,46 @@ class PortEmailConfigHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get all port email configurations"""
-        try:
-            configs = self.port_monitor.email_alert.get_all_port_email_configs()
-            
-            self.write_json({
-                'success': True,
-                'configs': configs
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get port email configurations: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        configs = self.port_monitor.email_alert.get_all_port_email_configs()
+        
+        self.write_json({
+            'success': True,
+            'configs': configs
+        })
     
+    @json_endpoint
     async def post(self):
         """Save port email configuration"""
-        try:
-            data = json.loads(self.request.body)
-            port = data.get('port')
-            config = data.get('config')
-            
-            success = self.port_monitor.email_alert.save_port_email_config(port, config)
-            
-            if success:
-                message = f"Email configuration for port {port} saved successfully"
-            else:
-                message = f"Failed to save email configuration for port {port}"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to save port email configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        port = data.get('port')
+        config = data.get('config')
+        
+        success = self.port_monitor.email_alert.save_port_email_config(port, config)
+        
+        if success:
+            message = f"Email configuration for port {port} saved successfully"
+        else:
+            message = f"Failed to save email configuration for port {port}"
+        
+        self.write_result(success, message)
     
+    @json_endpoint
     async def delete(self):
         """Delete port email configuration"""
-        try:
-            data = json.loads(self.request.body)
-            port = data.get('port')
-            
-            success = self.port_monitor.email_alert.delete_port_config(port)
-            
-            if success:
-                message = f"Email configuration for port {port} deleted successfully"
-            else:
-                message = f"Failed to delete email configuration for port {port}"
-            
-            self.write_json({
-                'success': success,
-                'message': message
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to delete port email configuration: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        port = data.get('port')
+        
+        success = self.port_monitor.email_alert.delete_port_config(port)
+        
+        if success:
+            message = f"Email configuration for port {port} deleted successfully"
+        else:
+            message = f"Failed to delete email configuration for port {port}"
+        
+        self.write_result(success, message)
 
 
 class EmailTestHandler(BaseHandler):
@@ -2019,67 +1754,51 @@ class EmailTestHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Test email configuration or send test email"""
+        # Parse body if present, otherwise default to connection test
         try:
-            # Parse body if present, otherwise default to connection test
-            try:
-                data = json.loads(self.request.body) if self.request.body else {}
-            except json.JSONDecodeError:
-                data = {}
-            
-            test_type = data.get('type', 'connection')  # Default to connection test
-            
-            if test_type == 'connection':
-                # Test SMTP connection - this is synchronous
-                result = self.port_monitor.email_alert.test_smtp_connection()
-                self.write_json(result)
+            data = self.json_body
+        except _JSONDecodeError:
+            data = {}
+        
+        test_type = data.get('type', 'connection')  # Default to connection test
+        
+        if test_type == 'connection':
+            # Test SMTP connection
+            result = await self.port_monitor.email_alert.test_smtp_connection_async()
+            self.write_json(result)
+            return
+                
+        elif test_type == 'email':
+            # Send test email
+            recipients = data.get('recipients', [])
+            if not recipients:
+                self.write_json_bytes(_ERR_NO_RECIPIENTS, 400)
                 return
-                    
-            elif test_type == 'email':
-                # Send test email
-                recipients = data.get('recipients', [])
-                if not recipients:
-                    self.write_json({
-                        'success': False,
-                        'error': 'No recipients specified'
-                    }, 400)
-                    return
-                    
-                # Send a test email using the alert email function
-                success = await self.port_monitor.email_alert.send_alert_email(
-                    port=0,
-                    recipients=recipients,
-                    template_name='default',
-                    custom_data={
-                        'status': 'TEST',
-                        'message': 'This is a test email from WinSentry',
-                        'server_name': 'WinSentry Test',
-                        'timestamp': datetime.now().isoformat()
-                    }
-                )
                 
-                if success:
-                    message = f"Test email sent successfully to {', '.join(recipients)}"
-                else:
-                    message = "Failed to send test email"
-                    
-                self.write_json({
-                    'success': success,
-                    'message': message
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': 'Invalid test type'
-                }, 400)
+            # Send a test email using the alert email function
+            success = await self.port_monitor.email_alert.send_alert_email(
+                port=0,
+                recipients=recipients,
+                template_name='default',
+                custom_data={
+                    'status': 'TEST',
+                    'message': 'This is a test email from WinSentry',
+                    'server_name': 'WinSentry Test',
+                    'timestamp': datetime.now().isoformat()
+                }
+            )
             
-        except Exception as e:
-            logger.error(f"Failed to test email: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+            if success:
+                message = f"Test email sent successfully to {', '.join(recipients)}"
+            else:
+                message = "Failed to send test email"
+                
+            self.write_result(success, message)
+        else:
+            self.write_json_bytes(_ERR_INVALID_TEST_TYPE, 400)
 
 
 class EmailTestAlertHandler(BaseHandler):
@@ -2088,79 +1807,60 @@ class EmailTestAlertHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def post(self):
         """Send a test alert for a port or service"""
-        try:
-            data = self.get_json_body()
-            alert_type = data.get('type', 'port')
-            recipients = data.get('recipients', [])
-            
-            if not recipients:
-                self.write_json({
-                    'success': False,
-                    'error': 'No recipients specified'
-                }, 400)
-                return
-            
-            # Ensure recipients is a list
-            if isinstance(recipients, str):
-                recipients = [r.strip() for r in recipients.split(',') if r.strip()]
-            
-            if alert_type == 'port':
-                port = data.get('port', 0)
-                success = await self.port_monitor.email_alert.send_alert_email(
-                    port=port,
-                    recipients=recipients,
-                    template_name='default',
-                    custom_data={
-                        'status': 'TEST ALERT',
-                        'severity': 'INFO',
-                        'message': f'This is a test alert for port {port} from WinSentry',
-                        'failure_count': 0,
-                        'server_name': 'WinSentry Test',
-                        'timestamp': datetime.now().isoformat()
-                    }
-                )
-                
-            elif alert_type == 'service':
-                service_name = data.get('service_name', 'TestService')
-                success = await self.port_monitor.email_alert.send_service_alert_email(
-                    service_name=service_name,
-                    recipients=recipients,
-                    template_name='service_default',
-                    custom_data={
-                        'status': 'TEST ALERT',
-                        'severity': 'INFO',
-                        'message': f'This is a test alert for service {service_name} from WinSentry',
-                        'failure_count': 0,
-                        'server_name': 'WinSentry Test',
-                        'timestamp': datetime.now().isoformat()
-                    }
-                )
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Invalid alert type: {alert_type}'
-                }, 400)
-                return
+        data = self.get_json_body()
+        alert_type = data.get('type', 'port')
+        recipients = data.get('recipients', [])
+        
+        if not recipients:
+            self.write_json_bytes(_ERR_NO_RECIPIENTS, 400)
+            return
+        
+        # Ensure recipients is a list
+        if isinstance(recipients, str):
+            recipients = [r.strip() for r in recipients.split(',') if r.strip()]
+        
+        if alert_type == 'port':
+            port = data.get('port', 0)
+            success = await self.port_monitor.email_alert.send_alert_email(
+                port=port,
+                recipients=recipients,
+                template_name='default',
+                custom_data={
+                    'status': 'TEST ALERT',
+                    'severity': 'INFO',
+                    'message': f'This is a test alert for port {port} from WinSentry',
+                    'failure_count': 0,
+                    'server_name': 'WinSentry Test',
+                    'timestamp': datetime.now().isoformat()
+                }
+            )
             
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Test alert sent to {len(recipients)} recipients'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': 'Failed to send test alert. Check SMTP configuration.'
-                })
-                
-        except Exception as e:
-            logger.error(f"Failed to send test alert: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        elif alert_type == 'service':
+            service_name = data.get('service_name', 'TestService')
+            success = await self.port_monitor.email_alert.send_service_alert_email(
+                service_name=service_name,
+                recipients=recipients,
+                template_name='service_default',
+                custom_data={
+                    'status': 'TEST ALERT',
+                    'severity': 'INFO',
+                    'message': f'This is a test alert for service {service_name} from WinSentry',
+                    'failure_count': 0,
+                    'server_name': 'WinSentry Test',
+                    'timestamp': datetime.now().isoformat()
+                }
+            )
+        else:
+            self.write_err(f'Invalid alert type: {alert_type}', 400)
+            return
+        
+        if success:
+            self.write_ok(f'Test alert sent to {len(recipients)} recipients')
+        else:
+            self.write_json_bytes(_ERR_TEST_ALERT_FAILED)
 
 
 class SinglePortEmailConfigHandler(BaseHandler):
@@ -2169,63 +1869,37 @@ class SinglePortEmailConfigHandler(BaseHandler):
     def initialize(self, port_monitor):
         self.port_monitor = port_monitor
     
+    @json_endpoint
     async def get(self):
         """Get email configuration for a specific port"""
-        try:
-            port = self.get_argument('port', None)
-            if not port:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number is required'
-                }, 400)
-                return
-            
-            config = self.port_monitor.email_alert.get_port_email_config(int(port))
-            self.write_json({
-                'success': True,
-                'config': config
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get port email config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        port = self.get_argument('port', None)
+        if not port:
+            self.write_json_bytes(_ERR_PORT_REQUIRED, 400)
+            return
+        
+        config = self.port_monitor.email_alert.get_port_email_config(_parse_uint(port))
+        self.write_json({
+            'success': True,
+            'config': config
+        })
     
+    @json_endpoint
     async def post(self):
         """Save email configuration for a specific port"""
-        try:
-            data = self.get_json_body()
-            port = data.get('port')
-            config = data.get('config', {})
-            
-            if not port:
-                self.write_json({
-                    'success': False,
-                    'error': 'Port number is required'
-                }, 400)
-                return
-            
-            success = self.port_monitor.email_alert.save_port_email_config(int(port), config)
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Email configuration saved for port {port}'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Failed to save email configuration for port {port}'
-                })
-                
-        except Exception as e:
-            logger.error(f"Failed to save port email config: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.get_json_body()
+        port = data.get('port')
+        config = data.get('config', {})
+        
+        if not port:
+            self.write_json_bytes(_ERR_PORT_REQUIRED, 400)
+            return
+        
+        success = self.port_monitor.email_alert.save_port_email_config(_parse_uint(port), config)
+        
+        if success:
+            self.write_ok(f'Email configuration saved for port {port}')
+        else:
+            self.write_err(f'Failed to save email configuration for port {port}', 200)
 
 
 
@@ -2235,22 +1909,15 @@ class SystemResourcesHandler(BaseHandler):
     def initialize(self, resource_monitor):
         self.resource_monitor = resource_monitor
     
+    @json_endpoint
     async def get(self):
         """Get current system resource usage (CPU, RAM, Disk)"""
-        try:
-            resources = self.resource_monitor.get_all_resources()
-            
-            self.write_json({
-                'success': True,
-                'resources': resources
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get system resources: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        resources = self.resource_monitor.get_all_resources()
+        
+        self.write_json({
+            'success': True,
+            'resources': resources
+        })
 
 
 class SystemResourceThresholdsHandler(BaseHandler):
@@ -2259,93 +1926,60 @@ class SystemResourceThresholdsHandler(BaseHandler):
     def initialize(self, resource_monitor):
         self.resource_monitor = resource_monitor
     
+    @json_endpoint
     async def get(self):
         """Get all configured resource thresholds"""
-        try:
-            thresholds = self.resource_monitor.get_thresholds()
-            
-            self.write_json({
-                'success': True,
-                'thresholds': thresholds
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get resource thresholds: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        thresholds = self.resource_monitor.get_thresholds()
+        
+        self.write_json({
+            'success': True,
+            'thresholds': thresholds
+        })
     
+    @json_endpoint
     async def post(self):
         """Set a new resource threshold"""
-        try:
-            data = json.loads(self.request.body)
-            
-            resource_type = data.get('resource_type')
-            threshold_percent = float(data.get('threshold_percent', 80))
-            drive_letter = data.get('drive_letter')
-            check_interval = int(data.get('check_interval', 60))
-            email_alerts_enabled = data.get('email_alerts_enabled', True)
-            email_recipients_str = data.get('email_recipients', '')
-            
-            # Parse email recipients
-            email_recipients = [r.strip() for r in email_recipients_str.split(',') if r.strip()]
-            
-            success = await self.resource_monitor.set_threshold(
-                resource_type=resource_type,
-                threshold_percent=threshold_percent,
-                drive_letter=drive_letter,
-                email_alerts_enabled=email_alerts_enabled,
-                email_recipients=email_recipients,
-                check_interval=check_interval
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': f'Threshold set for {resource_type}'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': 'Failed to set threshold'
-                }, 400)
-            
-        except Exception as e:
-            logger.error(f"Failed to set resource threshold: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        resource_type = data.get('resource_type')
+        threshold_percent = float(data.get('threshold_percent', 80))
+        drive_letter = data.get('drive_letter')
+        check_interval = int(data.get('check_interval', 60))
+        email_alerts_enabled = data.get('email_alerts_enabled', True)
+        email_recipients_str = data.get('email_recipients', '')
+        
+        # Parse email recipients
+        email_recipients = [r.strip() for r in email_recipients_str.split(',') if r.strip()]
+        
+        success = await self.resource_monitor.set_threshold(
+            resource_type=resource_type,
+            threshold_percent=threshold_percent,
+            drive_letter=drive_letter,
+            email_alerts_enabled=email_alerts_enabled,
+            email_recipients=email_recipients,
+            check_interval=check_interval
+        )
+        
+        if success:
+            self.write_ok(f'Threshold set for {resource_type}')
+        else:
+            self.write_json_bytes(_ERR_SET_THRESHOLD_FAILED, 400)
     
+    @json_endpoint
     async def delete(self):
         """Remove a resource threshold"""
-        try:
-            resource_type = self.get_argument('resource_type')
-            drive_letter = self.get_argument('drive_letter', None)
-            
-            success = await self.resource_monitor.remove_threshold(
-                resource_type=resource_type,
-                drive_letter=drive_letter
-            )
-            
-            if success:
-                self.write_json({
-                    'success': True,
-                    'message': 'Threshold removed'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': 'Failed to remove threshold'
-                }, 400)
-            
-        except Exception as e:
-            logger.error(f"Failed to remove resource threshold: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        resource_type = self.get_argument('resource_type')
+        drive_letter = self.get_argument('drive_letter', None)
+        
+        success = await self.resource_monitor.remove_threshold(
+            resource_type=resource_type,
+            drive_letter=drive_letter
+        )
+        
+        if success:
+            self.write_json_bytes(_OK_THRESHOLD_REMOVED)
+        else:
+            self.write_json_bytes(_ERR_REMOVE_THRESHOLD_FAILED, 400)
 
 
 class SystemResourceLogsHandler(BaseHandler):
@@ -2354,25 +1988,18 @@ class SystemResourceLogsHandler(BaseHandler):
     def initialize(self, resource_monitor):
         self.resource_monitor = resource_monitor
     
+    @json_endpoint
     async def get(self):
         """Get resource monitoring logs"""
-        try:
-            resource_type = self.get_argument('resource_type', None)
-            limit = int(self.get_argument('limit', 100))
-            
-            logs = self.resource_monitor.get_resource_logs(resource_type, limit)
-            
-            self.write_json({
-                'success': True,
-                'logs': logs
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get resource logs: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        resource_type = self.get_argument('resource_type', None)
+        limit = int(self.get_argument('limit', 100))
+        
+        logs = self.resource_monitor.get_resource_logs(resource_type, limit)
+        
+        self.write_json({
+            'success': True,
+            'logs': logs
+        })
 
 
 class AdhocCheckRunHandler(BaseHandler):
@@ -2381,42 +2008,32 @@ class AdhocCheckRunHandler(BaseHandler):
     def initialize(self, adhoc_check_manager):
         self.adhoc_check_manager = adhoc_check_manager
     
+    @json_endpoint
     async def post(self):
         """Run an adhoc check immediately"""
-        try:
-            data = json.loads(self.request.body)
-            
-            check_type = data.get('check_type', 'service')
-            target_name = data.get('target_name')
-            expected_state = data.get('expected_state', 'running')
-            actions = data.get('actions', {})
-            powershell_script = data.get('powershell_script', '')
-            email_recipients = data.get('email_recipients', '')
-            
-            if not target_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Target name is required'
-                }, 400)
-                return
-            
-            result = await self.adhoc_check_manager.run_check(
-                check_type=check_type,
-                target_name=target_name,
-                expected_state=expected_state,
-                actions=actions,
-                powershell_script=powershell_script,
-                email_recipients=email_recipients
-            )
-            
-            self.write_json(result)
-            
-        except Exception as e:
-            logger.error(f"Failed to run adhoc check: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        check_type = data.get('check_type', 'service')
+        target_name = data.get('target_name')
+        expected_state = data.get('expected_state', 'running')
+        actions = data.get('actions', {})
+        powershell_script = data.get('powershell_script', '')
+        email_recipients = data.get('email_recipients', '')
+        
+        if not target_name:
+            self.write_json_bytes(_ERR_TARGET_REQUIRED, 400)
+            return
+        
+        result = await self.adhoc_check_manager.run_check(
+            check_type=check_type,
+            target_name=target_name,
+            expected_state=expected_state,
+            actions=actions,
+            powershell_script=powershell_script,
+            email_recipients=email_recipients
+        )
+        
+        self.write_json(result)
 
 
 class AdhocCheckScheduleHandler(BaseHandler):
@@ -2425,49 +2042,39 @@ class AdhocCheckScheduleHandler(BaseHandler):
     def initialize(self, adhoc_check_manager):
         self.adhoc_check_manager = adhoc_check_manager
     
+    @json_endpoint
     async def post(self):
         """Schedule a new adhoc check"""
-        try:
-            data = json.loads(self.request.body)
-            
-            name = data.get('name')
-            check_type = data.get('check_type', 'service')
-            target_name = data.get('target_name')
-            expected_state = data.get('expected_state', 'running')
-            schedule = data.get('schedule', {})
-            actions = data.get('actions', {})
-            powershell_script = data.get('powershell_script', '')
-            email_recipients = data.get('email_recipients', '')
-            
-            if not target_name:
-                self.write_json({
-                    'success': False,
-                    'error': 'Target name is required'
-                }, 400)
-                return
-            
-            if not name:
-                name = f"{check_type}-{target_name}"
-            
-            result = await self.adhoc_check_manager.schedule_check(
-                name=name,
-                check_type=check_type,
-                target_name=target_name,
-                expected_state=expected_state,
-                schedule=schedule,
-                actions=actions,
-                powershell_script=powershell_script,
-                email_recipients=email_recipients
-            )
-            
-            self.write_json(result)
-            
-        except Exception as e:
-            logger.error(f"Failed to schedule adhoc check: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        data = self.json_body
+        
+        name = data.get('name')
+        check_type = data.get('check_type', 'service')
+        target_name = data.get('target_name')
+        expected_state = data.get('expected_state', 'running')
+        schedule = data.get('schedule', {})
+        actions = data.get('actions', {})
+        powershell_script = data.get('powershell_script', '')
+        email_recipients = data.get('email_recipients', '')
+        
+        if not target_name:
+            self.write_json_bytes(_ERR_TARGET_REQUIRED, 400)
+            return
+        
+        if not name:
+            name = f"{check_type}-{target_name}"
+        
+        result = await self.adhoc_check_manager.schedule_check(
+            name=name,
+            check_type=check_type,
+            target_name=target_name,
+            expected_state=expected_state,
+            schedule=schedule,
+            actions=actions,
+            powershell_script=powershell_script,
+            email_recipients=email_recipients
+        )
+        
+        self.write_json(result)
 
 
 class AdhocCheckScheduledHandler(BaseHandler):
@@ -2476,22 +2083,17 @@ class AdhocCheckScheduledHandler(BaseHandler):
     def initialize(self, adhoc_check_manager):
         self.adhoc_check_manager = adhoc_check_manager
     
+    @json_endpoint
     async def get(self):
-        """Get all scheduled checks"""
-        try:
-            checks = self.adhoc_check_manager.get_scheduled_checks()
-            
-            self.write_json({
-                'success': True,
-                'checks': checks
-            })
-            
-        except Exception as e:
-            logger.error(f"Failed to get scheduled checks: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        """Get scheduled checks, optionally paged with ?offset=&limit="""
+        offset = _parse_uint(self.get_argument('offset', '0'))
+        limit = self.get_argument('limit', None)
+        if limit is not None:
+            limit = _parse_uint(limit)
+        
+        checks = self.adhoc_check_manager.get_scheduled_checks()
+        page = checks[offset:] if limit is None else checks[offset:offset + limit]
+        self.write_json({'success': True, 'checks': page, 'total': len(checks)})
 
 
 class AdhocCheckScheduledActionHandler(BaseHandler):
@@ -2500,28 +2102,15 @@ class AdhocCheckScheduledActionHandler(BaseHandler):
     def initialize(self, adhoc_check_manager):
         self.adhoc_check_manager = adhoc_check_manager
     
+    @json_endpoint
     async def delete(self, check_id):
         """Delete a scheduled check"""
-        try:
-            result = await self.adhoc_check_manager.delete_scheduled_check(check_id)
-            
-            if result:
-                self.write_json({
-                    'success': True,
-                    'message': f'Scheduled check {check_id} deleted'
-                })
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Scheduled check {check_id} not found'
-                }, 404)
-                
-        except Exception as e:
-            logger.error(f"Failed to delete scheduled check: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        result = await self.adhoc_check_manager.delete_scheduled_check(check_id)
+        
+        if result:
+            self.write_ok(f'Scheduled check {check_id} deleted')
+        else:
+            self.write_err(f'Scheduled check {check_id} not found', 404)
 
 
 class AdhocCheckScheduledRunHandler(BaseHandler):
@@ -2530,22 +2119,12 @@ class AdhocCheckScheduledRunHandler(BaseHandler):
     def initialize(self, adhoc_check_manager):
         self.adhoc_check_manager = adhoc_check_manager
     
+    @json_endpoint
     async def post(self, check_id):
         """Run a scheduled check immediately"""
-        try:
-            result = await self.adhoc_check_manager.run_scheduled_check(check_id)
-            
-            if result:
-                self.write_json(result)
-            else:
-                self.write_json({
-                    'success': False,
-                    'error': f'Scheduled check {check_id} not found'
-                }, 404)
-                
-        except Exception as e:
-            logger.error(f"Failed to run scheduled check: {e}")
-            self.write_json({
-                'success': False,
-                'error': str(e)
-            }, 500)
+        result = await self.adhoc_check_manager.run_scheduled_check(check_id)
+        
+        if result:
+            self.write_json(result)
+        else:
+            self.write_err(f'Scheduled check {check_id} not found', 404)
@@ -0,0 +1,51 @@
+"""
+JSON backend shared by the API handlers and request models
+"""
+
+import json
+import os
+
+# Pick the fastest available JSON backend once at import time;
+# WINSENTRY_JSON=orjson|ujson|json forces a specific one.
+_REQUESTED_BACKEND = os.environ.get('WINSENTRY_JSON', '').strip().lower()
+
+
+def dumps(obj):
+    """Serialize to UTF-8 JSON bytes"""
+    return json.dumps(obj, default=str, ensure_ascii=False).encode('utf-8')
+
+
+loads = json.loads
+JSONDecodeError = json.JSONDecodeError
+JSON_BACKEND = 'json'
+
+if _REQUESTED_BACKEND in ('', 'orjson'):
+    try:
+        import orjson
+        # Keep datetimes/dataclasses on the default=str path so output matches the stdlib encoder
+        _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                           orjson.OPT_PASSTHROUGH_DATACLASS)
+
+        def dumps(obj):
+            """Serialize to UTF-8 JSON bytes"""
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+
+        loads = orjson.loads
+        JSON_BACKEND = 'orjson'
+    except ImportError:
+        pass
+
+if JSON_BACKEND == 'json' and _REQUESTED_BACKEND in ('', 'ujson'):
+    try:
+        import ujson
+
+        def dumps(obj):
+            """Serialize to UTF-8 JSON bytes"""
+            return ujson.dumps(obj, default=str, ensure_ascii=False,
+                               escape_forward_slashes=False).encode('utf-8')
+
+        loads = ujson.loads
+        JSONDecodeError = ValueError
+        JSON_BACKEND = 'ujson'
+    except ImportError:
+        pass
@@ -0,0 +1,169 @@
+"""
+Background writer for execution/event log rows
+"""
+
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+from collections import deque
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rows waiting to be written; when full the oldest pending row is dropped
+MAX_PENDING = 10000
+
+_STOP = object()
+_WAKE = object()
+
+
+class LogWriter:
+    """Queues log INSERTs and applies them from a dedicated thread"""
+
+    def __init__(self, db_path: str, max_pending: int = MAX_PENDING):
+        self.db_path = db_path
+        self._queue = queue.Queue(maxsize=max_pending)
+        # Statements and control markers that must never be dropped; the queue only
+        # carries a wake-up token for them
+        self._reliable = deque()
+        # Owned by the writer thread and kept open between batches
+        self._conn = None
+        self._thread = threading.Thread(target=self._drain, name="winsentry-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, sql: str, params: Tuple = (), droppable: bool = True):
+        """Queue a statement; never blocks the caller
+
+        Droppable statements are discarded oldest-first under backlog. Pass
+        droppable=False for state updates and deletes that must not be lost.
+        """
+        if not droppable:
+            self._signal((sql, params))
+            return
+        while True:
+            try:
+                self._queue.put_nowait((sql, params))
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _signal(self, item):
+        """Queue an item that must not be dropped and wake the writer thread"""
+        self._reliable.append(item)
+        try:
+            self._queue.put_nowait(_WAKE)
+        except queue.Full:
+            # The writer has a full queue to work through and checks the deque
+            # again before it next blocks
+            pass
+
+    def _drain(self):
+        """Write queued rows, one transaction per batch of whatever is pending"""
+        while True:
+            if self._reliable:
+                # An item whose wake-up token did not fit in a full queue is still
+                # pending, so do not block waiting for one
+                try:
+                    first = self._queue.get_nowait()
+                except queue.Empty:
+                    first = _WAKE
+            else:
+                first = self._queue.get()
+            # Take the reliable items before emptying the queue, so every row queued
+            # ahead of a flush or stop marker is part of this batch
+            reliable = []
+            while True:
+                try:
+                    reliable.append(self._reliable.popleft())
+                except IndexError:
+                    break
+            batch = [first]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            batch.extend(reliable)
+
+            stop = any(item is _STOP for item in batch)
+            flushed = [item for item in batch if isinstance(item, threading.Event)]
+            rows = [item for item in batch if type(item) is tuple]
+            if rows:
+                self._write_batch(rows)
+            for event in flushed:
+                event.set()
+            if stop:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                return
+
+    def _write_batch(self, rows):
+        """Apply a batch in one transaction, skipping individual rows that fail"""
+        failed = 0
+        error = None
+        try:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path)
+            with self._conn:
+                for sql, params in rows:
+                    try:
+                        self._conn.execute(sql, params)
+                    except sqlite3.Error as e:
+                        failed += 1
+                        error = e
+        except Exception as e:
+            # Reconnect on the next batch in case the connection itself went bad
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            failed = len(rows)
+            error = e
+        if failed:
+            logger.error("Failed to write %d log row(s): %s", failed, error)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been written; False on timeout"""
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._signal(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Flush pending rows and stop the writer thread"""
+        if self._thread.is_alive():
+            self._signal(_STOP)
+            self._thread.join(timeout)
+
+
+_writers: Dict[str, LogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(db_path: str) -> LogWriter:
+    """Get the shared writer for a database file"""
+    with _writers_lock:
+        writer = _writers.get(db_path)
+        if writer is None:
+            writer = _writers[db_path] = LogWriter(db_path)
+        return writer
+
+
+def close_log_writer(db_path: str):
+    """Flush and stop the writer for a database file, if one is running"""
+    with _writers_lock:
+        writer = _writers.pop(db_path, None)
+    if writer is not None:
+        writer.close()
+
+
+@atexit.register
+def _close_writers():
+    for writer in list(_writers.values()):
+        writer.close()
@@ -2,19 +2,102 @@
 Logging configuration for WinSentry
 """
 
+import atexit
+import gzip
 import logging
 import logging.handlers
 import os
+import queue
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
+# Seconds between size checks on the rotating log files
+ROLLOVER_CHECK_INTERVAL = 60.0
+
+# Loggers with their own log file that do not propagate to the root logger
+_DEDICATED_LOGGERS = ('port_monitor', 'service_manager')
+
+# Background thread that formats records and writes them to the real handlers
+_queue_listener = None
+
+# Rotated log files are gzipped here so a rollover does not stall log writes
+_compress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='winsentry-log-gzip')
+
+
+def _gzip_file(source, dest):
+    """Compress source into dest and remove source"""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class ThrottledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that checks the file size at most once per interval"""
+
+    def __init__(self, *args, check_interval: float = ROLLOVER_CHECK_INTERVAL,
+                 compress: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.check_interval = check_interval
+        self._next_check = 0.0
+        self._compressing = None
+        if compress:
+            self.namer = self._gzip_name
+            self.rotator = self._gzip_rotator
+
+    def shouldRollover(self, record):
+        # The stock check stats the file, seeks to its end and formats the record
+        # an extra time on every emit; a file may now overshoot maxBytes by
+        # whatever is logged within one interval
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        # Let the previous backup finish compressing before the .gz files are shifted
+        if self._compressing is not None:
+            wait([self._compressing])
+            self._compressing = None
+        super().doRollover()
+
+    @staticmethod
+    def _gzip_name(name):
+        return name + '.gz'
+
+    def _gzip_rotator(self, source, dest):
+        # Rename now so logging can continue in a fresh file; compress in the background
+        pending = dest[:-len('.gz')]
+        os.replace(source, pending)
+        self._compressing = _compress_executor.submit(_gzip_file, pending, dest)
+
+
+def _from_root_loggers(record):
+    """Filter out records from the dedicated loggers"""
+    return record.name.split('.', 1)[0] not in _DEDICATED_LOGGERS
+
+
+@atexit.register
+def stop_logging():
+    """Flush queued records and stop the background log listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
 
 def setup_logging(debug=False):
     """Setup logging configuration"""
+    global _queue_listener
+    stop_logging()
     
     # Create logs directory if it doesn't exist
     log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -38,48 +121,68 @@ def setup_logging(debug=False):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO if not debug else logging.DEBUG)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.addFilter(_from_root_loggers)
     
     # File handler for general logs
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = ThrottledRotatingFileHandler(
         os.path.join(log_dir, 'winsentry.log'),
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
+        backupCount=5,
+        compress=True
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.addFilter(_from_root_loggers)
     
     # File handler for port monitoring logs
-    port_monitor_handler = logging.handlers.RotatingFileHandler(
+    port_monitor_handler = ThrottledRotatingFileHandler(
         os.path.join(log_dir, 'port_monitor.log'),
         maxBytes=5*1024*1024,  # 5MB
-        backupCount=3
+        backupCount=3,
+        compress=True
     )
     port_monitor_handler.setLevel(logging.INFO)
     port_monitor_handler.setFormatter(detailed_formatter)
+    port_monitor_handler.addFilter(logging.Filter('port_monitor'))
     
     # Create port monitor logger
     port_logger = logging.getLogger('port_monitor')
-    port_logger.addHandler(port_monitor_handler)
     port_logger.setLevel(logging.INFO)
     port_logger.propagate = False  # Don't propagate to root logger
     
     # File handler for service management logs
-    service_handler = logging.handlers.RotatingFileHandler(
+    service_handler = ThrottledRotatingFileHandler(
         os.path.join(log_dir, 'service_manager.log'),
         maxBytes=5*1024*1024,  # 5MB
-        backupCount=3
+        backupCount=3,
+        compress=True
     )
     service_handler.setLevel(logging.INFO)
     service_handler.setFormatter(detailed_formatter)
+    service_handler.addFilter(logging.Filter('service_manager'))
     
     # Create service manager logger
     service_logger = logging.getLogger('service_manager')
-    service_logger.addHandler(service_handler)
     service_logger.setLevel(logging.INFO)
     service_logger.propagate = False  # Don't propagate to root logger
     
+    # Loggers only enqueue records; formatting and console/file writes happen on the
+    # listener thread instead of the event loop. Handler filters keep each dedicated
+    # logger's records in its own file.
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for target in (root_logger, port_logger, service_logger):
+        for handler in target.handlers[:]:
+            if isinstance(handler, logging.handlers.QueueHandler):
+                target.removeHandler(handler)
+        target.addHandler(queue_handler)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, port_monitor_handler, service_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    
     # Suppress some noisy loggers
     logging.getLogger('tornado.access').setLevel(logging.WARNING)
     logging.getLogger('tornado.application').setLevel(logging.WARNING)
@@ -7,25 +7,12 @@ import logging
 import signal
 import sys
 import os
+from typing import List, Protocol
 from tornado import web, ioloop
 from tornado.options import define, options, parse_command_line
 
-# Try to use winloop for better performance on Windows
-try:
-    import winloop
-    winloop.install()
-    USING_WINLOOP = True
-except ImportError:
-    USING_WINLOOP = False
-
-# Try absolute imports first (when installed as package)
-from winsentry.app import WinSentryApplication
-from winsentry.service_manager import ServiceManager
-from winsentry.port_monitor import PortMonitor
-from winsentry.service_monitor import ServiceMonitor
-from winsentry.system_resource_monitor import SystemResourceMonitor
-from winsentry.adhoc_check_manager import AdhocCheckManager
-from winsentry.logger import setup_logging
+from winsentry.logger import setup_logging, stop_logging
+from winsentry._loop import install_fast_loop
 
 
 # Configuration options
@@ -35,48 +22,46 @@ define("db_path", default="winsentry.db", help="Path to SQLite database", type=s
 define("log_level", default="INFO", help="Logging level (DEBUG, INFO, WARNING, ERROR)", type=str)
 
 
-# Global references for cleanup
-_port_monitor = None
-_service_monitor = None
-_resource_monitor = None
-_adhoc_check_manager = None
+class MonitorBase(Protocol):
+    """Lifecycle shared by the background monitors"""
+    
+    async def start_monitoring(self): ...
+    
+    async def stop_monitoring(self): ...
+
+
+# Monitors started in main(), kept for cleanup
+_monitors: List[MonitorBase] = []
+# Task running every monitor's start_monitoring(), kept so it is not garbage collected
+_monitors_task = None
 _shutdown_event = None
 
 
+async def _start_monitor(monitor, logger):
+    """Run one monitor, logging a failure without affecting the others"""
+    try:
+        await monitor.start_monitoring()
+    except Exception as e:
+        logger.error("Error starting %s: %s", type(monitor).__name__, e)
+
+
+async def _run_monitors(logger):
+    """Run all monitors under one task"""
+    await asyncio.gather(*(_start_monitor(m, logger) for m in _monitors))
+
+
 async def shutdown_monitors(logger):
     """Gracefully stop all monitoring tasks"""
-    global _port_monitor, _service_monitor, _resource_monitor, _adhoc_check_manager
-    
     logger.info("Stopping monitoring tasks...")
     
-    tasks = []
-    
-    if _port_monitor:
-        try:
-            tasks.append(_port_monitor.stop_monitoring())
-        except Exception as e:
-            logger.error(f"Error stopping port monitor: {e}")
-    
-    if _service_monitor:
-        try:
-            tasks.append(_service_monitor.stop_monitoring())
-        except Exception as e:
-            logger.error(f"Error stopping service monitor: {e}")
+    results = await asyncio.gather(*(m.stop_monitoring() for m in _monitors), return_exceptions=True)
+    for monitor, result in zip(_monitors, results):
+        if isinstance(result, Exception):
+            logger.error("Error stopping %s: %s", type(monitor).__name__, result)
     
-    if _resource_monitor:
-        try:
-            tasks.append(_resource_monitor.stop_monitoring())
-        except Exception as e:
-            logger.error(f"Error stopping resource monitor: {e}")
-    
-    if _adhoc_check_manager:
-        try:
-            tasks.append(_adhoc_check_manager.stop_monitoring())
-        except Exception as e:
-            logger.error(f"Error stopping adhoc check manager: {e}")
-    
-    if tasks:
-        await asyncio.gather(*tasks, return_exceptions=True)
+    # Anything still looping after being told to stop is cancelled with the group
+    if _monitors_task is not None and not _monitors_task.done():
+        _monitors_task.cancel()
     
     logger.info("All monitoring tasks stopped")
 
@@ -97,10 +82,19 @@ def signal_handler(signum, frame):
 
 def main():
     """Main entry point"""
-    global _port_monitor, _service_monitor, _resource_monitor, _adhoc_check_manager
+    global _monitors
     
+    loop_name = install_fast_loop()
     parse_command_line()
     
+    # Imported here so --help and option errors return without loading the monitors
+    from winsentry.app import WinSentryApplication
+    from winsentry.service_manager import ServiceManager
+    from winsentry.port_monitor import PortMonitor
+    from winsentry.service_monitor import ServiceMonitor
+    from winsentry.system_resource_monitor import SystemResourceMonitor
+    from winsentry.adhoc_check_manager import AdhocCheckManager
+    
     # Setup logging
     log_level = getattr(logging, options.log_level.upper(), logging.INFO)
     setup_logging(debug=options.debug)
@@ -112,7 +106,7 @@ def main():
     logger.info("WinSentry - Windows Service & Port Monitor")
     logger.info("=" * 50)
     logger.info(f"Python version: {sys.version}")
-    logger.info(f"Using winloop: {USING_WINLOOP}")
+    logger.info("Event loop: %s", loop_name or "asyncio")
     logger.info(f"Debug mode: {options.debug}")
     logger.info(f"Database path: {options.db_path}")
     logger.info(f"Log level: {options.log_level}")
@@ -128,20 +122,21 @@ def main():
         logger.info("Initializing components...")
         
         service_manager = ServiceManager(db_path=options.db_path)
-        _port_monitor = PortMonitor(db_path=options.db_path)
-        _service_monitor = ServiceMonitor(db_path=options.db_path)
-        _resource_monitor = SystemResourceMonitor(db_path=options.db_path)
-        _adhoc_check_manager = AdhocCheckManager(db_path=options.db_path)
+        port_monitor = PortMonitor(db_path=options.db_path)
+        service_monitor = ServiceMonitor(db_path=options.db_path)
+        resource_monitor = SystemResourceMonitor(db_path=options.db_path)
+        adhoc_check_manager = AdhocCheckManager(db_path=options.db_path)
+        _monitors = [port_monitor, service_monitor, resource_monitor, adhoc_check_manager]
         
         logger.info("All components initialized successfully")
         
         # Create application
         app = WinSentryApplication(
             service_manager, 
-            _port_monitor, 
-            _service_monitor, 
-            _resource_monitor,
-            _adhoc_check_manager
+            port_monitor, 
+            service_monitor, 
+            resource_monitor,
+            adhoc_check_manager
         )
         
         # Start the server
@@ -157,13 +152,16 @@ def main():
         # Start the event loop
         loop = ioloop.IOLoop.current()
         
+        # Let tasks that finish without suspending (e.g. stopping an idle monitor)
+        # complete inline instead of waiting for a pass of the loop
+        if sys.version_info >= (3, 12):
+            loop.asyncio_loop.set_task_factory(asyncio.eager_task_factory)
+        
         # Start monitoring tasks as background tasks
         def start_monitoring_tasks():
+            global _monitors_task
             logger.info("Starting monitoring tasks...")
-            asyncio.create_task(_port_monitor.start_monitoring())
-            asyncio.create_task(_service_monitor.start_monitoring())
-            asyncio.create_task(_resource_monitor.start_monitoring())
-            asyncio.create_task(_adhoc_check_manager.start_monitoring())
+            _monitors_task = asyncio.create_task(_run_monitors(logger))
             logger.info("All monitoring tasks started")
         
         # Schedule the monitoring tasks to start after the loop begins
@@ -182,6 +180,7 @@ def main():
         sys.exit(1)
     finally:
         logger.info("WinSentry shutdown complete")
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -5,20 +5,37 @@ Port monitoring functionality
 import asyncio
 import logging
 import os
+import stat
 import socket
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 
+from ._procutil import memory_percent as _memory_percent
+from ._schemas import DATACLASS_OPTIONS
 from .database import Database
 from .email_alert import EmailAlert
 
 logger = logging.getLogger(__name__)
 
+# Seconds one listening-socket snapshot is shared between port checks
+CONNECTIONS_SNAPSHOT_TTL = 1.0
 
-@dataclass
+# Snapshots are taken on their own thread so a slow enumeration never ties up the default executor
+_connections_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='winsentry-netconn')
+
+# Port states as stored in port_status/port_logs
+PORT_ONLINE = "ONLINE"
+PORT_OFFLINE = "OFFLINE"
+
+# psutil.Process handles kept for listeners seen recently, least recently used evicted first
+PROCESS_CACHE_SIZE = 256
+
+@dataclass(**DATACLASS_OPTIONS)
 class PortConfig:
     """Configuration for port monitoring"""
     port: int
@@ -33,6 +50,7 @@ class PortConfig:
     # Recovery script configuration
     recovery_script_delay: int = 20  # Minimum seconds between recovery script executions (default 20 seconds)
     last_recovery_script_run: Optional[datetime] = None  # When recovery script was last executed
+    last_email_sent: Optional[datetime] = None  # When the last failure alert was emailed
 
 
 class PortMonitor:
@@ -47,6 +65,17 @@ class PortMonitor:
         self.db = Database(db_path)
         self.email_alert = EmailAlert(db_path)
         
+        # (monotonic time taken, {port: [pid, ...]} of listening sockets); enumerating
+        # the connection table is expensive, so ports checked in the same tick share one
+        self._listeners_snapshot = (float('-inf'), {})
+        self._listeners_lock = threading.Lock()
+        # Reused so repeated checks skip reopening the process and cpu_percent()
+        # measures from the previous check instead of returning 0.0. A plain dict keeps
+        # insertion order, so pop-and-reinsert is enough for LRU without OrderedDict's
+        # per-entry linked-list node
+        self._processes: Dict[int, object] = {}
+        self._processes_lock = threading.Lock()
+        
         # Load existing configurations from database
         self._load_configurations()
     
@@ -236,8 +265,10 @@ class PortMonitor:
                 self.logger.error("PowerShell script path is empty")
                 return False
             
-            # Check if file exists
-            if not os.path.exists(script_path):
+            # Check if file exists; one stat answers both this and the is-a-file check
+            try:
+                st = os.stat(script_path)
+            except OSError:
                 self.logger.error(f"PowerShell script not found: {script_path}")
                 return False
             
@@ -247,7 +278,7 @@ class PortMonitor:
                 return False
             
             # Check if it's a file (not directory)
-            if not os.path.isfile(script_path):
+            if not stat.S_ISREG(st.st_mode):
                 self.logger.error(f"PowerShell script path is not a file: {script_path}")
                 return False
             
@@ -443,13 +474,15 @@ $env:PYTHONUTF8 = "1"
             return True
         
         is_used = await self.is_port_in_use(port)
-        config.last_check = datetime.now()
+        # One clock read per check; the cooldown comparisons below reuse it
+        now = datetime.now()
+        config.last_check = now
         config.last_status = is_used
         
         # Determine status string
-        status = "ONLINE" if is_used else "OFFLINE"
+        status = PORT_ONLINE if is_used else PORT_OFFLINE
         
-        self.logger.debug(f"Port {port} check: {status} at {config.last_check}")
+        self.logger.debug("Port %s check: %s at %s", port, status, now)
         
         # Always update real-time status in database
         self.db.update_port_status(port, status, config.failure_count)
@@ -459,7 +492,7 @@ $env:PYTHONUTF8 = "1"
             self.logger.warning(f"Port {port} is not in use (failure #{config.failure_count})")
             
             # Log to database
-            self.db.log_port_check(port, "OFFLINE", config.failure_count, f"Port {port} is offline (failure #{config.failure_count})")
+            self.db.log_port_check(port, PORT_OFFLINE, config.failure_count, f"Port {port} is offline (failure #{config.failure_count})")
             
             # Get email configuration for this port
             email_config = self.email_alert.get_port_email_config(port)
@@ -470,7 +503,7 @@ $env:PYTHONUTF8 = "1"
                 # Check if we should wait before running recovery script again
                 can_run_recovery = True
                 if config.last_recovery_script_run:
-                    seconds_since_last_run = (datetime.now() - config.last_recovery_script_run).total_seconds()
+                    seconds_since_last_run = (now - config.last_recovery_script_run).total_seconds()
                     if seconds_since_last_run < config.recovery_script_delay:
                         remaining_wait = int(config.recovery_script_delay - seconds_since_last_run)
                         self.logger.info(f"Recovery script for port {port} on cooldown. Next run in {remaining_wait}s")
@@ -480,7 +513,7 @@ $env:PYTHONUTF8 = "1"
                     # Prioritize script file path over inline commands
                     if config.powershell_script and config.powershell_script.strip():
                         # Use the .ps1 script file
-                        config.last_recovery_script_run = datetime.now()
+                        config.last_recovery_script_run = now
                         self.logger.info(f"Executing PowerShell script file for port {port}: {config.powershell_script}")
                         success = await self.execute_powershell_script(config.powershell_script, port)
                         if success:
@@ -489,7 +522,7 @@ $env:PYTHONUTF8 = "1"
                             self.logger.error(f"PowerShell script failed for port {port}")
                     elif config.powershell_commands and config.powershell_commands.strip():
                         # Use inline PowerShell commands as fallback
-                        config.last_recovery_script_run = datetime.now()
+                        config.last_recovery_script_run = now
                         self.logger.info(f"Executing inline PowerShell commands for port {port}")
                         result = await self.execute_powershell_commands(config.powershell_commands, port)
                         if result['success']:
@@ -505,8 +538,8 @@ $env:PYTHONUTF8 = "1"
                 email_config.get("recipients")):
                 
                 # Only send email if we haven't sent one recently (avoid spam)
-                if not hasattr(config, 'last_email_sent') or \
-                   (datetime.now() - config.last_email_sent).total_seconds() > 300:  # 5 minutes
+                if config.last_email_sent is None or \
+                   (now - config.last_email_sent).total_seconds() > 300:  # 5 minutes
                     
                     await self.email_alert.send_alert_email(
                         port=port,
@@ -521,11 +554,10 @@ $env:PYTHONUTF8 = "1"
         else:
             if config.failure_count > 0:
                 # Port came back online
-                self.db.log_port_check(port, "ONLINE", 0, f"Port {port} is back online")
+                self.db.log_port_check(port, PORT_ONLINE, 0, f"Port {port} is back online")
                 
                 # Reset email sent flag
-                if hasattr(config, 'last_email_sent'):
-                    delattr(config, 'last_email_sent')
+                config.last_email_sent = None
                     
             config.failure_count = 0
             
@@ -551,8 +583,8 @@ $env:PYTHONUTF8 = "1"
                     memory_rss_bytes=process['memory_rss']
                 )
             
-            # Check thresholds
-            threshold_result = await self.check_resource_thresholds(port)
+            # Check thresholds against the processes just collected
+            threshold_result = await self.check_resource_thresholds(port, processes)
             if threshold_result.get('exceeded', False):
                 self.logger.warning(f"Resource thresholds exceeded for port {port}: {len(threshold_result.get('alerts', []))} alerts")
             
@@ -831,36 +863,62 @@ $env:PYTHONUTF8 = "1"
             self.logger.error(f"Failed to get port logs: {e}")
             return []
     
+    def _get_listeners(self) -> Dict[int, List[int]]:
+        """Map each listening port to its PIDs, reusing a snapshot within CONNECTIONS_SNAPSHOT_TTL"""
+        import psutil
+        with self._listeners_lock:
+            taken_at, listeners = self._listeners_snapshot
+            if time.monotonic() - taken_at >= CONNECTIONS_SNAPSHOT_TTL:
+                listeners = {}
+                for conn in psutil.net_connections(kind='inet'):
+                    if conn.status == psutil.CONN_LISTEN:
+                        listeners.setdefault(conn.laddr.port, []).append(conn.pid)
+                self._listeners_snapshot = (time.monotonic(), listeners)
+            return listeners
+    
+    def _get_process(self, pid: int):
+        """Get a cached psutil.Process for pid, replacing it if the PID has been reused"""
+        import psutil
+        with self._processes_lock:
+            process = self._processes.pop(pid, None)
+            if process is None or not process.is_running():
+                process = psutil.Process(pid)
+            self._processes[pid] = process
+            if len(self._processes) > PROCESS_CACHE_SIZE:
+                del self._processes[next(iter(self._processes))]
+            return process
+    
     async def get_processes_on_port(self, port: int) -> List[Dict]:
         """Get all processes using a specific port with detailed resource usage"""
-        def _get_processes():
+        def _get_processes(pids):
             try:
                 import psutil
                 processes = []
                 
-                for conn in psutil.net_connections(kind='inet'):
-                    if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                        try:
-                            process = psutil.Process(conn.pid)
-                            
+                for pid in pids:
+                    try:
+                        process = self._get_process(pid)
+                        
+                        # Read every attribute inside one oneshot() so psutil batches the queries
+                        with process.oneshot():
                             # Get CPU and memory usage
                             cpu_percent = process.cpu_percent()
                             memory_info = process.memory_info()
-                            memory_percent = process.memory_percent()
-                            
+                            memory_percent = _memory_percent(memory_info.rss)
+                        
                             # Get additional process details
                             try:
                                 cmdline = process.cmdline()
                             except (psutil.NoSuchProcess, psutil.AccessDenied):
                                 cmdline = []
-                            
+                        
                             try:
                                 username = process.username()
                             except (psutil.NoSuchProcess, psutil.AccessDenied):
                                 username = "Unknown"
-                            
+                        
                             processes.append({
-                                'pid': conn.pid,
+                                'pid': pid,
                                 'name': process.name(),
                                 'status': process.status(),
                                 'create_time': process.create_time(),
@@ -872,9 +930,9 @@ $env:PYTHONUTF8 = "1"
                                 'username': username,
                                 'port': port
                             })
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            # Process may have died or we don't have access
-                            continue
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        # Process may have died or we don't have access
+                        continue
                 
                 return processes
                 
@@ -883,7 +941,11 @@ $env:PYTHONUTF8 = "1"
         
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, _get_processes)
+            listeners = await loop.run_in_executor(_connections_executor, self._get_listeners)
+            pids = listeners.get(port)
+            if not pids:
+                return []
+            return await loop.run_in_executor(None, _get_processes, pids)
         except Exception as e:
             self.logger.error(f"Failed to get processes on port {port}: {e}")
             return []
@@ -989,8 +1051,8 @@ $env:PYTHONUTF8 = "1"
             self.logger.error(f"Failed to get database stats: {e}")
             return {}
     
-    async def check_resource_thresholds(self, port: int) -> Dict:
-        """Check if processes on a port exceed resource thresholds"""
+    async def check_resource_thresholds(self, port: int, processes: Optional[List[Dict]] = None) -> Dict:
+        """Check if processes on a port exceed resource thresholds, collecting them unless given"""
         try:
             # Get port configuration with thresholds
             port_config = self.db.get_port_config(port)
@@ -1003,7 +1065,8 @@ $env:PYTHONUTF8 = "1"
                 return {'exceeded': False, 'alerts': []}
             
             # Get current processes on the port
-            processes = await self.get_processes_on_port(port)
+            if processes is None:
+                processes = await self.get_processes_on_port(port)
             alerts = []
             
             for process in processes:
@@ -1079,8 +1142,13 @@ $env:PYTHONUTF8 = "1"
     async def get_port_resource_summary(self, port: int) -> Dict:
         """Get comprehensive resource summary for a port"""
         try:
-            processes = await self.get_processes_on_port(port)
-            thresholds = self.db.get_port_thresholds(port) or {}
+            # Process enumeration and the threshold lookup are independent; run them together
+            loop = asyncio.get_event_loop()
+            processes, thresholds = await asyncio.gather(
+                self.get_processes_on_port(port),
+                loop.run_in_executor(None, self.db.get_port_thresholds, port)
+            )
+            thresholds = thresholds or {}
             
             # Calculate totals
             total_cpu = sum(p['cpu_percent'] for p in processes)
@@ -1103,103 +1171,6 @@ $env:PYTHONUTF8 = "1"
             self.logger.error(f"Failed to get resource summary for port {port}: {e}")
             return {'error': str(e)}
     
-    async def get_processes_on_port(self, port: int) -> List[Dict]:
-        """Get all processes using a specific port with detailed resource usage"""
-        try:
-            import psutil
-            processes = []
-            
-            for conn in psutil.net_connections(kind='inet'):
-                if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                    try:
-                        process = psutil.Process(conn.pid)
-                        
-                        # Get CPU and memory usage
-                        cpu_percent = process.cpu_percent()
-                        memory_info = process.memory_info()
-                        memory_percent = process.memory_percent()
-                        
-                        # Get additional process details
-                        try:
-                            cmdline = process.cmdline()
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            cmdline = []
-                        
-                        try:
-                            username = process.username()
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            username = "Unknown"
-                        
-                        processes.append({
-                            'pid': conn.pid,
-                            'name': process.name(),
-                            'status': process.status(),
-                            'create_time': process.create_time(),
-                            'cpu_percent': round(cpu_percent, 2),
-                            'memory_rss': memory_info.rss,  # Resident Set Size in bytes
-                            'memory_vms': memory_info.vms,  # Virtual Memory Size in bytes
-                            'memory_percent': round(memory_percent, 2),
-                            'cmdline': cmdline,
-                            'username': username,
-                            'port': port
-                        })
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        # Process may have died or we don't have access
-                        continue
-            
-            return processes
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get processes on port {port}: {e}")
-            return []
-    
-    async def kill_process(self, pid: int) -> bool:
-        """Kill a process gracefully"""
-        try:
-            import psutil
-            process = psutil.Process(pid)
-            process.terminate()
-            
-            # Wait for process to terminate
-            try:
-                process.wait(timeout=5)
-                self.logger.info(f"Process {pid} terminated gracefully")
-                return True
-            except psutil.TimeoutExpired:
-                # If it doesn't terminate, force kill it
-                process.kill()
-                self.logger.info(f"Process {pid} force killed after timeout")
-                return True
-                
-        except psutil.NoSuchProcess:
-            self.logger.warning(f"Process {pid} no longer exists")
-            return True
-        except psutil.AccessDenied:
-            self.logger.error(f"Access denied when trying to kill process {pid}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Failed to kill process {pid}: {e}")
-            return False
-    
-    async def force_kill_process(self, pid: int) -> bool:
-        """Force kill a process immediately"""
-        try:
-            import psutil
-            process = psutil.Process(pid)
-            process.kill()
-            self.logger.info(f"Process {pid} force killed")
-            return True
-            
-        except psutil.NoSuchProcess:
-            self.logger.warning(f"Process {pid} no longer exists")
-            return True
-        except psutil.AccessDenied:
-            self.logger.error(f"Access denied when trying to force kill process {pid}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Failed to force kill process {pid}: {e}")
-            return False
-    
     async def kill_processes_on_port(self, port: int) -> Dict:
         """Kill all processes running on a specific port"""
         try:
@@ -12,14 +12,21 @@ import logging
 import os
 import subprocess
 import signal
+import time
 import psutil
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from ._schemas import DATACLASS_OPTIONS
+from .log_writer import get_log_writer
+
 logger = logging.getLogger(__name__)
 
+# Seconds a snapshot of running Python processes is reused when looking for app PIDs
+PROCESS_SNAPSHOT_TTL = 5.0
+
 
 class AppStatus(Enum):
     RUNNING = "running"
@@ -29,7 +36,7 @@ class AppStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PythonAppConfig:
     """Configuration for Python application monitoring"""
     app_id: str  # Unique identifier for the app
@@ -66,6 +73,8 @@ class PythonAppMonitor:
         self.monitoring_tasks: Dict[str, asyncio.Task] = {}
         self._running = False
         self._main_task: Optional[asyncio.Task] = None
+        # (monotonic time taken, [(pid, cmdline), ...]) of running Python processes
+        self._process_snapshot = (float('-inf'), [])
         
         # Import email alert lazily
         self.email_alert = None
@@ -173,6 +182,7 @@ class PythonAppMonitor:
         
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_python_app_logs_app_id ON python_app_logs(app_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_python_app_logs_timestamp ON python_app_logs(timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_python_app_logs_app_id_timestamp ON python_app_logs(app_id, timestamp)')
         
         conn.commit()
     
@@ -310,34 +320,27 @@ class PythonAppMonitor:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
     
+    def _python_processes(self, max_age: float = PROCESS_SNAPSHOT_TTL) -> List[tuple]:
+        """(pid, cmdline) of running Python processes, reusing a snapshot younger than max_age"""
+        taken_at, processes = self._process_snapshot
+        now = time.monotonic()
+        if now - taken_at < max_age:
+            return processes
+        
+        processes = []
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = proc.info['cmdline'] or []
+            if len(cmdline) >= 2 and 'python' in cmdline[0].lower():
+                processes.append((proc.pid, cmdline))
+        
+        self._process_snapshot = (now, processes)
+        return processes
+    
     async def _find_app_process_async(self, app: PythonAppConfig) -> Optional[int]:
         """Find the PID of a running Python app by its script path (async)"""
-        def _find():
-            try:
-                script_name = os.path.basename(app.script_path)
-                
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                    try:
-                        info = proc.info
-                        cmdline = info.get('cmdline') or []
-                        
-                        # Check if this is a Python process running our script
-                        if len(cmdline) >= 2:
-                            if 'python' in cmdline[0].lower():
-                                for arg in cmdline[1:]:
-                                    if script_name in arg or app.script_path in arg:
-                                        return info['pid']
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-                
-                return None
-                
-            except Exception as e:
-                return None
-        
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, _find)
+            return await loop.run_in_executor(None, self._find_app_process, app)
         except Exception as e:
             self.logger.error(f"Error finding app process: {e}")
             return None
@@ -345,28 +348,33 @@ class PythonAppMonitor:
     def _find_app_process(self, app: PythonAppConfig) -> Optional[int]:
         """Find the PID of a running Python app by its script path (sync version)"""
         try:
-            script_name = os.path.basename(app.script_path)
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    info = proc.info
-                    cmdline = info.get('cmdline') or []
-                    
-                    # Check if this is a Python process running our script
-                    if len(cmdline) >= 2:
-                        if 'python' in cmdline[0].lower():
-                            for arg in cmdline[1:]:
-                                if script_name in arg or app.script_path in arg:
-                                    return info['pid']
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return None
+            taken_at = self._process_snapshot[0]
+            pid = self._match_app_process(app, self._python_processes())
+            if pid is None and self._process_snapshot[0] == taken_at:
+                # Only the cached snapshot was searched, and it can predate an app restarted
+                # outside WinSentry; look again before check_app treats the app as down and
+                # starts a duplicate
+                pid = self._match_app_process(app, self._python_processes(max_age=0))
+            return pid
             
         except Exception as e:
             self.logger.error(f"Error finding app process: {e}")
             return None
     
+    @staticmethod
+    def _match_app_process(app: PythonAppConfig, processes: List[tuple]) -> Optional[int]:
+        """PID of the live process in a (pid, cmdline) snapshot that runs the app's script"""
+        script_name = os.path.basename(app.script_path)
+        for pid, cmdline in processes:
+            # Check if this Python process is running our script; the snapshot
+            # may be a few seconds old, so make sure the match is still alive
+            for arg in cmdline[1:]:
+                if script_name in arg or app.script_path in arg:
+                    if psutil.pid_exists(pid):
+                        return pid
+                    break
+        return None
+    
     async def start_app(self, app_id: str) -> Dict:
         """Start a Python application"""
         if app_id not in self.monitored_apps:
@@ -663,18 +671,11 @@ class PythonAppMonitor:
                        restart_count: int, message: str):
         """Log an app event to database"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            get_log_writer(self.db_path).write('''
                 INSERT INTO python_app_logs (app_id, status, pid, restart_count, message)
                 VALUES (?, ?, ?, ?, ?)
             ''', (app_id, status, pid, restart_count, message))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             self.logger.error(f"Failed to log app event: {e}")
     
@@ -12,14 +12,57 @@ import asyncio
 import logging
 import subprocess
 import os
+import tempfile
+from collections import deque
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import re
 
+from ._schemas import DATACLASS_OPTIONS
+from .log_writer import get_log_writer
+
 logger = logging.getLogger(__name__)
 
+# Characters of stdout/stderr kept per execution in the log table and in memory
+TASK_OUTPUT_LOG_LIMIT = 10000
+
+# Most recent execution log rows kept in memory to answer get_task_logs
+RECENT_TASK_LOGS = 5000
+
+# Recent log entries are kept as plain tuples in this field order
+TASK_LOG_FIELDS = ('task_id', 'status', 'output', 'error', 'execution_time_ms', 'timestamp')
+
+# Bytes of stdout/stderr read back from a task run; a runaway script's output beyond
+# this is dropped instead of being loaded into memory
+TASK_MAX_OUTPUT_BYTES = int(os.environ.get('WINSENTRY_TASK_MAX_OUTPUT_BYTES', str(1024 * 1024)))
+TRUNCATED_MARKER = '\n...[truncated]'
+
+
+def _read_output(f) -> str:
+    """Read at most TASK_MAX_OUTPUT_BYTES from a spooled output file"""
+    f.seek(0)
+    data = f.read(TASK_MAX_OUTPUT_BYTES + 1)
+    truncated = len(data) > TASK_MAX_OUTPUT_BYTES
+    # Same decoding and newline handling as the text-mode capture this replaced:
+    # UTF-8 with errors='replace' (which also covers a character split by the size
+    # cap) and universal newlines
+    text = data[:TASK_MAX_OUTPUT_BYTES].decode('utf-8', errors='replace')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text + TRUNCATED_MARKER if truncated else text
+
+
+def _run_captured(cmd, cwd: Optional[str], shell: bool = False, timeout: int = 3600) -> Dict:
+    """Run a process with its output spooled to temp files and read back with a size cap"""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        result = subprocess.run(cmd, shell=shell, cwd=cwd, stdout=out, stderr=err, timeout=timeout)
+        return {
+            'success': result.returncode == 0,
+            'output': _read_output(out),
+            'error': _read_output(err)
+        }
+
 
 class ScheduleType(Enum):
     INTERVAL = "interval"  # Run every X seconds/minutes/hours
@@ -28,7 +71,7 @@ class ScheduleType(Enum):
     DAILY = "daily"  # Run daily at specified time
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ScheduledTask:
     """Configuration for a scheduled task"""
     task_id: str
@@ -68,6 +111,7 @@ class ScheduledTaskManager:
         self.task_handles: Dict[str, asyncio.Task] = {}
         self._running = False
         self.email_alert = None
+        self._recent_logs = deque(maxlen=RECENT_TASK_LOGS)
         
         self._load_configurations()
     
@@ -165,6 +209,7 @@ class ScheduledTaskManager:
         
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_task_logs_task_id ON scheduled_task_logs(task_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_task_logs_timestamp ON scheduled_task_logs(timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_task_logs_task_id_timestamp ON scheduled_task_logs(task_id, timestamp)')
         
         conn.commit()
     
@@ -345,11 +390,20 @@ class ScheduledTaskManager:
             cursor = conn.cursor()
             
             cursor.execute('DELETE FROM scheduled_tasks WHERE task_id = ?', (task_id,))
-            cursor.execute('DELETE FROM scheduled_task_logs WHERE task_id = ?', (task_id,))
             
             conn.commit()
             conn.close()
             
+            # Log rows are INSERTed by the background writer, so the DELETE goes through it
+            # too; that way a row still queued for this task cannot land after the delete
+            writer = get_log_writer(self.db_path)
+            writer.write('DELETE FROM scheduled_task_logs WHERE task_id = ?', (task_id,), droppable=False)
+            self._recent_logs = deque(
+                (entry for entry in self._recent_logs if entry[0] != task_id),
+                maxlen=RECENT_TASK_LOGS
+            )
+            await asyncio.get_event_loop().run_in_executor(None, writer.flush)
+            
             if task_id in self.tasks:
                 del self.tasks[task_id]
             
@@ -396,11 +450,15 @@ class ScheduledTaskManager:
             
             execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
             
+            # Truncate once; the task state and the log row share the same strings
+            logged_output = output[:TASK_OUTPUT_LOG_LIMIT] if output else None
+            logged_error = error[:TASK_OUTPUT_LOG_LIMIT] if error else None
+            
             # Update task state
             task.last_run = datetime.now()
             task.next_run = self._calculate_next_run(task)
             task.last_result = 'success' if success else 'failed'
-            task.last_output = output or error
+            task.last_output = logged_output or logged_error
             task.run_count += 1
             
             if not success:
@@ -408,7 +466,7 @@ class ScheduledTaskManager:
             
             # Log the execution
             self._log_task_execution(task_id, 'success' if success else 'failed', 
-                                     output, error, execution_time)
+                                     logged_output, logged_error, execution_time)
             
             # Send email if configured
             if success and task.email_on_success:
@@ -451,21 +509,7 @@ class ScheduledTaskManager:
                 else:
                     cmd = [script_path]
                 
-                result = subprocess.run(
-                    cmd,
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=3600,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                
-                return {
-                    'success': result.returncode == 0,
-                    'output': result.stdout,
-                    'error': result.stderr
-                }
+                return _run_captured(cmd, cwd)
                 
             except subprocess.TimeoutExpired:
                 return {'success': False, 'error': 'Script execution timed out'}
@@ -483,22 +527,7 @@ class ScheduledTaskManager:
         """Run a shell command"""
         def _execute():
             try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=working_directory,
-                    capture_output=True,
-                    text=True,
-                    timeout=3600,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                
-                return {
-                    'success': result.returncode == 0,
-                    'output': result.stdout,
-                    'error': result.stderr
-                }
+                return _run_captured(command, working_directory, shell=True)
                 
             except subprocess.TimeoutExpired:
                 return {'success': False, 'error': 'Command execution timed out'}
@@ -518,21 +547,7 @@ class ScheduledTaskManager:
             try:
                 cmd = ['powershell.exe', '-ExecutionPolicy', 'Bypass', '-Command', script]
                 
-                result = subprocess.run(
-                    cmd,
-                    cwd=working_directory,
-                    capture_output=True,
-                    text=True,
-                    timeout=3600,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                
-                return {
-                    'success': result.returncode == 0,
-                    'output': result.stdout,
-                    'error': result.stderr
-                }
+                return _run_captured(cmd, working_directory)
                 
             except subprocess.TimeoutExpired:
                 return {'success': False, 'error': 'PowerShell execution timed out'}
@@ -585,23 +600,21 @@ class ScheduledTaskManager:
         except Exception as e:
             self.logger.error(f"Failed to send task email: {e}")
     
-    def _log_task_execution(self, task_id: str, status: str, output: str, 
-                            error: str, execution_time: int):
-        """Log task execution to database"""
+    def _log_task_execution(self, task_id: str, status: str, output: Optional[str], 
+                            error: Optional[str], execution_time: int):
+        """Log task execution to database; output and error are already truncated"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            # Same format as SQLite's CURRENT_TIMESTAMP, stamped now rather than when the
+            # background writer gets to the row
+            timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            # The buffer and the writer share one tuple per execution
+            entry = (task_id, status, output, error, execution_time, timestamp)
+            self._recent_logs.append(entry)
+            get_log_writer(self.db_path).write('''
                 INSERT INTO scheduled_task_logs 
-                (task_id, status, output, error, execution_time_ms)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (task_id, status, output[:10000] if output else None, 
-                  error[:10000] if error else None, execution_time))
-            
-            conn.commit()
-            conn.close()
+                (task_id, status, output, error, execution_time_ms, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', entry)
             
         except Exception as e:
             self.logger.error(f"Failed to log task execution: {e}")
@@ -694,9 +707,27 @@ class ScheduledTaskManager:
             for t in self.tasks.values()
         ]
     
+    def _get_recent_task_logs(self, task_id: Optional[str], limit: int) -> Optional[List[Dict]]:
+        """Newest logs from the in-memory buffer, or None if it holds fewer than limit matches"""
+        logs = []
+        if limit <= 0:
+            return logs
+        # Snapshot first: rows may be appended while we scan
+        for entry in reversed(list(self._recent_logs)):
+            if task_id and entry[0] != task_id:
+                continue
+            logs.append(dict(zip(TASK_LOG_FIELDS, entry)))
+            if len(logs) >= limit:
+                return logs
+        return None
+    
     def get_task_logs(self, task_id: Optional[str] = None, 
                       limit: int = 100) -> List[Dict]:
         """Get task execution logs"""
+        recent = self._get_recent_task_logs(task_id, limit)
+        if recent is not None:
+            return recent
+        
         try:
             import sqlite3
             conn = sqlite3.connect(self.db_path)
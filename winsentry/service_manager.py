@@ -6,12 +6,18 @@ import asyncio
 import logging
 import subprocess
 from typing import List, Dict, Any, Optional
+import psutil
 import win32serviceutil
 import win32service
 import win32con
 
+from .jsonutil import JSONDecodeError, loads as _loads
+
 logger = logging.getLogger(__name__)
 
+# psutil start types mapped to the Win32_Service StartMode values the UI shows
+_START_MODES = {'automatic': 'Auto', 'manual': 'Manual', 'disabled': 'Disabled'}
+
 
 class ServiceManager:
     """Manages Windows services"""
@@ -126,36 +132,20 @@ class ServiceManager:
     async def _get_all_services(self) -> List[Dict[str, Any]]:
         """Get all services with exclusions"""
         try:
-            services = []
-            
-            # Use WMI to get service information in a non-blocking way
-            import wmi
-            
-            # Run WMI query in executor to avoid blocking with timeout
+            # Run the service query in executor to avoid blocking with timeout
             loop = asyncio.get_event_loop()
             try:
-                wmi_services = await asyncio.wait_for(
-                    loop.run_in_executor(None, self._get_wmi_services),
+                all_services = await asyncio.wait_for(
+                    loop.run_in_executor(None, self._list_services),
                     timeout=60.0  # 60 second timeout for all services
                 )
             except asyncio.TimeoutError:
-                self.logger.warning("WMI query timed out, returning empty list")
+                self.logger.warning("Service query timed out, returning empty list")
                 return []
             
-            for service in wmi_services:
-                # Apply exclusions
-                if service.Name in self.service_config['excluded_services']:
-                    continue
-                    
-                services.append({
-                    'name': service.Name,
-                    'display_name': service.DisplayName,
-                    'state': service.State,
-                    'start_mode': service.StartMode,
-                    'process_id': service.ProcessId,
-                    'status': service.Status,
-                    'description': service.Description or '',
-                })
+            # Apply exclusions
+            excluded = set(self.service_config['excluded_services'])
+            services = [service for service in all_services if service['name'] not in excluded]
             
             return services
             
@@ -195,15 +185,7 @@ class ServiceManager:
                     # Query for specific service
                     services = c.Win32_Service(Name=service_name)
                     for service in services:
-                        return {
-                            'name': service.Name,
-                            'display_name': service.DisplayName,
-                            'state': service.State,
-                            'start_mode': service.StartMode,
-                            'process_id': service.ProcessId,
-                            'status': service.Status,
-                            'description': service.Description or '',
-                        }
+                        return self._service_info(service)
                     
                     return None
                     
@@ -221,8 +203,55 @@ class ServiceManager:
             self.logger.error(f"Failed to get service {service_name}: {e}")
             return None
     
+    def _list_services(self) -> List[Dict[str, Any]]:
+        """Enumerate all services, preferring psutil's direct SCM access over WMI"""
+        if hasattr(psutil, 'win_service_iter'):
+            try:
+                return self._get_psutil_services()
+            except Exception as e:
+                self.logger.error("psutil service enumeration failed: %s", e)
+        # _get_wmi_services falls back to PowerShell itself when WMI is unavailable
+        return self._get_wmi_services()
+    
+    def _get_psutil_services(self) -> List[Dict[str, Any]]:
+        """Enumerate services straight from the SCM, without WMI or a subprocess"""
+        services = []
+        for service in psutil.win_service_iter():
+            try:
+                info = service.as_dict()
+            except psutil.NoSuchProcess:
+                # Service was deleted while enumerating
+                continue
+            except psutil.AccessDenied:
+                info = {'name': service.name(), 'display_name': service.display_name()}
+            
+            status = info.get('status')
+            services.append({
+                'name': info['name'],
+                'display_name': info['display_name'],
+                'state': status.replace('_', ' ').title() if status else 'Unknown',
+                'start_mode': _START_MODES.get(info.get('start_type'), 'Unknown'),
+                'process_id': info.get('pid') or 0,
+                'status': 'OK' if status else 'Unknown',
+                'description': info.get('description') or '',
+            })
+        return services
+    
+    @staticmethod
+    def _service_info(service) -> Dict[str, Any]:
+        """Convert a Win32_Service row to a plain dict"""
+        return {
+            'name': service.Name,
+            'display_name': service.DisplayName,
+            'state': service.State,
+            'start_mode': service.StartMode,
+            'process_id': service.ProcessId,
+            'status': service.Status,
+            'description': service.Description or '',
+        }
+    
     def _get_wmi_services(self):
-        """Get WMI services in a separate thread to avoid blocking"""
+        """Get WMI services as dicts in a separate thread to avoid blocking"""
         try:
             import wmi
             import pythoncom
@@ -238,12 +267,13 @@ class ServiceManager:
                     ["Name", "DisplayName", "State", "StartMode", "ProcessId", "Status", "Description"]
                 )
                 
-                # Return all services, but filter out only the most problematic ones
+                # Return all services, but filter out only the most problematic ones.
+                # Rows are read into dicts here, while COM is still initialized on this thread
                 filtered_services = []
                 for service in services:
                     # Only skip services that are known to cause issues
                     if service.Name and not service.Name.startswith(('WmiPrvSE',)):
-                        filtered_services.append(service)
+                        filtered_services.append(self._service_info(service))
                 
                 return filtered_services
                 
@@ -260,16 +290,18 @@ class ServiceManager:
         """Fallback method using PowerShell to get services"""
         try:
             import subprocess
-            import json
             
             self.logger.info("Using PowerShell fallback for service enumeration")
             
-            # Use PowerShell to get all services with better error handling
+            # Use PowerShell to get all services with better error handling.
+            # Status/StartType are enums that serialize as numbers unless cast to strings
             cmd = [
-                'powershell.exe', '-ExecutionPolicy', 'Bypass', '-Command',
+                'powershell.exe', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command',
                 '''
                 try {
-                    Get-Service | Select-Object Name, DisplayName, Status, StartType | 
+                    Get-Service | Select-Object Name, DisplayName,
+                        @{Name='Status'; Expression={[string]$_.Status}},
+                        @{Name='StartType'; Expression={[string]$_.StartType}} |
                     ConvertTo-Json -Compress
                 } catch {
                     Write-Error "PowerShell service enumeration failed: $_"
@@ -282,29 +314,25 @@ class ServiceManager:
             
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    services_data = json.loads(result.stdout)
+                    services_data = _loads(result.stdout)
                     if not isinstance(services_data, list):
                         services_data = [services_data]
                     
-                    # Convert PowerShell output to WMI-like objects
-                    services = []
-                    for svc in services_data:
-                        class Service:
-                            def __init__(self, data):
-                                self.Name = data.get('Name', '')
-                                self.DisplayName = data.get('DisplayName', '')
-                                self.State = 'Running' if data.get('Status') == 'Running' else 'Stopped'
-                                self.StartMode = data.get('StartType', 'Unknown')
-                                self.ProcessId = 0
-                                self.Status = data.get('Status', 'Unknown')
-                                self.Description = ''
-                        
-                        services.append(Service(svc))
+                    # Convert PowerShell output to the same dicts as the WMI path
+                    services = [{
+                        'name': svc.get('Name', ''),
+                        'display_name': svc.get('DisplayName', ''),
+                        'state': 'Running' if svc.get('Status') == 'Running' else 'Stopped',
+                        'start_mode': svc.get('StartType', 'Unknown'),
+                        'process_id': 0,
+                        'status': svc.get('Status', 'Unknown'),
+                        'description': '',
+                    } for svc in services_data]
                     
                     self.logger.info(f"PowerShell fallback loaded {len(services)} services")
                     return services
                     
-                except json.JSONDecodeError as e:
+                except JSONDecodeError as e:
                     self.logger.error(f"Failed to parse PowerShell JSON output: {e}")
                     self.logger.error(f"PowerShell output: {result.stdout[:200]}...")
                     return []
@@ -5,19 +5,47 @@ Service monitoring functionality
 import asyncio
 import logging
 import os
+import re
+import stat
 import subprocess
+import threading
 import time
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 
+from ._procutil import memory_percent as _memory_percent
+from ._schemas import DATACLASS_OPTIONS
 from .database import Database
 from .email_alert import EmailAlert
 
+# Service state is read straight from the Service Control Manager when pywin32 is
+# available; elsewhere (and in tests) 'sc query' output is parsed instead
+try:
+    import pywintypes
+    import win32service
+    import win32serviceutil
+    _SERVICE_STATES = {
+        win32service.SERVICE_RUNNING: 'running',
+        win32service.SERVICE_STOPPED: 'stopped',
+        win32service.SERVICE_PAUSED: 'paused',
+    }
+except ImportError:
+    win32serviceutil = None
+
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+
+# One pass over raw 'sc query' output finds the STATE value
+_SC_STATE_RE = re.compile(rb'\b(RUNNING|STOPPED|PAUSED)\b', re.IGNORECASE)
+
+_SC_STATES = {b'RUNNING': 'running', b'STOPPED': 'stopped', b'PAUSED': 'paused'}
+
 logger = logging.getLogger(__name__)
 
+# Services checked at once in a monitoring pass; each check may spawn sc.exe or wait on a restart
+SERVICE_CHECK_CONCURRENCY = 8
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ServiceConfig:
     """Configuration for service monitoring"""
     service_name: str
@@ -47,6 +75,7 @@ class ServiceConfig:
     alert_on_started: bool = False  # Alert when service starts
     alert_on_restart_success: bool = True  # Alert when restart succeeds
     alert_on_restart_failed: bool = True  # Alert when all restart attempts fail
+    last_email_sent: Optional[datetime] = None  # When the last failure alert was emailed
 
 
 
@@ -60,6 +89,11 @@ class ServiceMonitor:
         self.running = False
         self.db = Database(db_path)
         self.email_alert = EmailAlert(db_path)
+        # SCM connection and per-service query handles, opened on first use and kept
+        # so each check is a single QueryServiceStatus call
+        self._scm = None
+        self._service_handles: Dict[str, object] = {}
+        self._handles_lock = threading.Lock()
         
         # Load existing configurations from database
         self._load_configurations()
@@ -140,6 +174,7 @@ class ServiceMonitor:
             if not self.db.delete_service_config(service_name):
                 return False
             
+            self._close_service_handle(service_name)
             if service_name in self.monitored_services:
                 del self.monitored_services[service_name]
                 self.logger.info(f"Removed service {service_name} from monitoring")
@@ -208,8 +243,10 @@ class ServiceMonitor:
                 self.logger.error("PowerShell script path is empty")
                 return False
             
-            # Check if file exists
-            if not os.path.exists(script_path):
+            # Check if file exists; one stat answers both this and the is-a-file check
+            try:
+                st = os.stat(script_path)
+            except OSError:
                 self.logger.error(f"PowerShell script not found: {script_path}")
                 return False
             
@@ -219,7 +256,7 @@ class ServiceMonitor:
                 return False
             
             # Check if it's a file (not directory)
-            if not os.path.isfile(script_path):
+            if not stat.S_ISREG(st.st_mode):
                 self.logger.error(f"PowerShell script path is not a file: {script_path}")
                 return False
             
@@ -235,26 +272,95 @@ class ServiceMonitor:
             self.logger.error(f"Failed to validate PowerShell script {script_path}: {e}")
             return False
 
+    async def _sc_query(self, service_name: str, timeout: float = 10):
+        """Run 'sc query' on the event loop's subprocess support; returns (returncode, stdout, stderr) as bytes"""
+        proc = await asyncio.create_subprocess_exec(
+            'sc', 'query', service_name,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise asyncio.TimeoutError(f"sc query {service_name} timed out after {timeout} seconds")
+        return proc.returncode, stdout, stderr
+    
+    @staticmethod
+    def _sc_state(returncode: int, stdout: bytes) -> str:
+        """Map raw 'sc query' output to running/stopped/paused/unknown/not_found"""
+        if returncode != 0:
+            return 'not_found'
+        match = _SC_STATE_RE.search(stdout)
+        return _SC_STATES[match.group(1).upper()] if match else 'unknown'
+    
+    def _get_service_handle(self, service_name: str):
+        """Get a cached SCM handle for querying a service, opening it on first use"""
+        with self._handles_lock:
+            handle = self._service_handles.get(service_name)
+            if handle is None:
+                if self._scm is None:
+                    self._scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+                handle = win32service.OpenService(self._scm, service_name, win32service.SERVICE_QUERY_STATUS)
+                self._service_handles[service_name] = handle
+            return handle
+    
+    def _close_service_handle(self, service_name: str):
+        """Drop a service's cached handle so the next query reopens it"""
+        with self._handles_lock:
+            handle = self._service_handles.pop(service_name, None)
+        if handle is not None:
+            try:
+                win32service.CloseServiceHandle(handle)
+            except pywintypes.error:
+                pass
+    
+    def _close_service_handles(self):
+        """Close every cached service handle and the SCM connection"""
+        with self._handles_lock:
+            handles = list(self._service_handles.values())
+            self._service_handles.clear()
+            if self._scm is not None:
+                handles.append(self._scm)
+                self._scm = None
+        for handle in handles:
+            try:
+                win32service.CloseServiceHandle(handle)
+            except pywintypes.error:
+                pass
+    
+    def _query_service_state(self, service_name: str) -> str:
+        """Read a service's state from the SCM (blocking); same values as _sc_state"""
+        try:
+            status = win32service.QueryServiceStatus(self._get_service_handle(service_name))
+        except pywintypes.error as e:
+            # The service may have been deleted or reinstalled; reopen on the next query
+            self._close_service_handle(service_name)
+            if e.winerror == ERROR_SERVICE_DOES_NOT_EXIST:
+                return 'not_found'
+            raise
+        return _SERVICE_STATES.get(status[1], 'unknown')
+    
+    async def _get_service_state(self, service_name: str, timeout: float = 10) -> str:
+        """Get a service's state without blocking the event loop"""
+        if win32serviceutil is not None:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._query_service_state, service_name)
+        returncode, stdout, _ = await self._sc_query(service_name, timeout)
+        return self._sc_state(returncode, stdout)
+    
     async def is_service_running(self, service_name: str) -> bool:
         """Check if a Windows service is running"""
         try:
-            # Use sc query to check service status
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: subprocess.run([
-                    'sc', 'query', service_name
-                ], capture_output=True, text=True, timeout=10)
-            )
+            state = await self._get_service_state(service_name)
             
-            if result.returncode != 0:
-                self.logger.warning(f"Service {service_name} not found or error querying: {result.stderr}")
+            if state == 'not_found':
+                self.logger.warning(f"Service {service_name} not found")
                 return False
             
-            # Check if service is in RUNNING state
-            output = result.stdout.lower()
-            return 'running' in output
+            return state == 'running'
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.logger.error(f"Timeout checking service {service_name}")
             return False
         except Exception as e:
@@ -425,7 +531,8 @@ $env:PYTHONUTF8 = "1"
         config.last_check = datetime.now()
         config.last_status = is_running
         
-        self.logger.debug(f"Service {service_name} check: {'RUNNING' if is_running else 'STOPPED'} at {config.last_check}")
+        self.logger.debug("Service %s check: %s at %s", service_name,
+                          'RUNNING' if is_running else 'STOPPED', config.last_check)
         
         if not is_running:
             config.failure_count += 1
@@ -449,6 +556,8 @@ $env:PYTHONUTF8 = "1"
             
             # Get email configuration for this service
             email_config = self.email_alert.get_service_email_config(service_name)
+            # One clock read for the cooldowns below, taken after any restart attempt
+            now = datetime.now()
             
             # Execute PowerShell script or commands after N failures
             # But only if enough time has passed since last recovery script run
@@ -456,7 +565,7 @@ $env:PYTHONUTF8 = "1"
                 # Check if we should wait before running recovery script again
                 can_run_recovery = True
                 if config.last_recovery_script_run:
-                    seconds_since_last_run = (datetime.now() - config.last_recovery_script_run).total_seconds()
+                    seconds_since_last_run = (now - config.last_recovery_script_run).total_seconds()
                     if seconds_since_last_run < config.recovery_script_delay:
                         remaining_wait = int(config.recovery_script_delay - seconds_since_last_run)
                         self.logger.info(f"Recovery script for service {service_name} on cooldown. Next run in {remaining_wait}s")
@@ -464,10 +573,10 @@ $env:PYTHONUTF8 = "1"
                 
                 if can_run_recovery:
                     if config.powershell_script:
-                        config.last_recovery_script_run = datetime.now()
+                        config.last_recovery_script_run = now
                         await self.execute_powershell_script(config.powershell_script, service_name)
                     elif config.powershell_commands:
-                        config.last_recovery_script_run = datetime.now()
+                        config.last_recovery_script_run = now
                         result = await self.execute_powershell_commands(config.powershell_commands, service_name)
                         if result['success']:
                             self.logger.info(f"PowerShell commands executed successfully for service {service_name}")
@@ -480,8 +589,8 @@ $env:PYTHONUTF8 = "1"
                 email_config.get("recipients")):
                 
                 # Only send email if we haven't sent one recently (avoid spam)
-                if not hasattr(config, 'last_email_sent') or \
-                   (datetime.now() - config.last_email_sent).total_seconds() > 300:  # 5 minutes
+                if config.last_email_sent is None or \
+                   (now - config.last_email_sent).total_seconds() > 300:  # 5 minutes
                     
                     await self.email_alert.send_service_alert_email(
                         service_name=service_name,
@@ -501,8 +610,7 @@ $env:PYTHONUTF8 = "1"
                 self.db.log_service_check(service_name, "RUNNING", 0, f"Service {service_name} is back running")
                 
                 # Reset email sent flag
-                if hasattr(config, 'last_email_sent'):
-                    delattr(config, 'last_email_sent')
+                config.last_email_sent = None
             
             # Reset all failure and restart counters
             config.failure_count = 0
@@ -678,6 +786,8 @@ $env:PYTHONUTF8 = "1"
                 await self.monitoring_task
             except asyncio.CancelledError:
                 pass
+        if win32serviceutil is not None:
+            self._close_service_handles()
         self.logger.info("Service monitoring stopped")
     
     async def _monitoring_loop(self):
@@ -685,11 +795,20 @@ $env:PYTHONUTF8 = "1"
         self.logger.info("Service monitoring loop started")
         while self.running:
             try:
-                # Check all monitored services
-                for service_name, config in self.monitored_services.items():
-                    if config.enabled:
-                        self.logger.debug(f"Checking service {service_name}")
-                        await self.check_service(service_name)
+                # Check all monitored services concurrently so one slow check or
+                # restart does not hold up the rest of the pass
+                enabled = [name for name, config in self.monitored_services.items() if config.enabled]
+                semaphore = asyncio.Semaphore(SERVICE_CHECK_CONCURRENCY)
+                
+                async def _check(service_name):
+                    async with semaphore:
+                        self.logger.debug("Checking service %s", service_name)
+                        return await self.check_service(service_name)
+                
+                results = await asyncio.gather(*(_check(name) for name in enabled), return_exceptions=True)
+                for service_name, result in zip(enabled, results):
+                    if isinstance(result, Exception):
+                        self.logger.error("Error checking service %s: %s", service_name, result)
                 
                 # Wait for the shortest interval
                 if self.monitored_services:
@@ -707,6 +826,37 @@ $env:PYTHONUTF8 = "1"
                 self.logger.error(f"Error in service monitoring loop: {e}")
                 await asyncio.sleep(5)  # Wait before retrying
     
+    def _service_entry(self, service_name: str, config: ServiceConfig, result) -> Dict:
+        """Build a service's status row from its state string or the error raised fetching it"""
+        if isinstance(result, Exception):
+            self.logger.error(f"Error getting status for {service_name}: {result}")
+            is_running = config.last_status
+            current_status = 'running' if is_running else 'stopped' if is_running is False else 'unknown'
+        else:
+            current_status = result
+            if current_status == 'running':
+                is_running = True
+            elif current_status in ('stopped', 'paused'):
+                is_running = False
+            else:
+                is_running = None
+                
+            # Update cached status
+            config.last_status = is_running
+            config.last_check = datetime.now()
+        
+        return {
+            'service_name': service_name,
+            'interval': config.interval,
+            'powershell_script': config.powershell_script,
+            'enabled': config.enabled,
+            'last_check': config.last_check.isoformat() if config.last_check else None,
+            'last_status': is_running,
+            'status': current_status,
+            'failure_count': config.failure_count,
+            'is_running': is_running
+        }
+    
     def get_monitored_services(self) -> List[Dict]:
         """Get list of monitored services with their current status (synchronous version)
         
@@ -714,68 +864,35 @@ $env:PYTHONUTF8 = "1"
         use get_monitored_services_async() instead.
         """
         services = []
-        for service_name, config in self.monitored_services.items():
+        for service_name, config in list(self.monitored_services.items()):
             # Fetch live current status for this service
-            current_status = None
-            is_running = None
-            
             try:
-                import subprocess
-                # Quick check of current service status
-                result = subprocess.run(
-                    ['sc', 'query', service_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0:
-                    output = result.stdout.upper()
-                    if 'RUNNING' in output:
-                        is_running = True
-                        current_status = 'running'
-                    elif 'STOPPED' in output:
-                        is_running = False
-                        current_status = 'stopped'
-                    elif 'PAUSED' in output:
-                        is_running = False
-                        current_status = 'paused'
-                    else:
-                        is_running = None
-                        current_status = 'unknown'
+                if win32serviceutil is not None:
+                    result = self._query_service_state(service_name)
                 else:
-                    is_running = None
-                    current_status = 'not_found'
-                    
-                # Update cached status
-                config.last_status = is_running
-                config.last_check = datetime.now()
-                
+                    completed = subprocess.run(
+                        ['sc', 'query', service_name],
+                        capture_output=True,
+                        timeout=5
+                    )
+                    result = self._sc_state(completed.returncode, completed.stdout)
             except Exception as e:
-                self.logger.error(f"Error getting status for {service_name}: {e}")
-                is_running = config.last_status
-                current_status = 'running' if is_running else 'stopped' if is_running is False else 'unknown'
-            
-            services.append({
-                'service_name': service_name,
-                'interval': config.interval,
-                'powershell_script': config.powershell_script,
-                'enabled': config.enabled,
-                'last_check': config.last_check.isoformat() if config.last_check else None,
-                'last_status': is_running,
-                'status': current_status,
-                'failure_count': config.failure_count,
-                'is_running': is_running
-            })
+                result = e
+            services.append(self._service_entry(service_name, config, result))
         return services
     
     async def get_monitored_services_async(self) -> List[Dict]:
         """Get list of monitored services with their current status (async version)
         
-        This version uses run_in_executor to prevent blocking the event loop.
+        All services are queried concurrently.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_monitored_services)
+        items = list(self.monitored_services.items())
+        results = await asyncio.gather(
+            *(self._get_service_state(service_name, timeout=5) for service_name, _ in items),
+            return_exceptions=True
+        )
+        return [self._service_entry(service_name, config, result)
+                for (service_name, config), result in zip(items, results)]
     
     def get_service_logs(self, service_name: Optional[str] = None) -> List[Dict]:
         """Get logs for service monitoring from database"""
@@ -823,37 +940,41 @@ $env:PYTHONUTF8 = "1"
                             service_name.lower() in cmdline or
                             any(service_name.lower() in arg.lower() for arg in cmdline_list)):
                             
-                            process = psutil.Process(proc_info['pid'])
+                            # process_iter() hands back the same Process objects on every call, so
+                            # cpu_percent() measures since the previous pass instead of returning 0.0
+                            process = proc
                             
-                            # Get CPU and memory usage
-                            cpu_percent = process.cpu_percent()
-                            memory_info = process.memory_info()
-                            memory_percent = process.memory_percent()
+                            # Read every attribute inside one oneshot() so psutil batches the queries
+                            with process.oneshot():
+                                # Get CPU and memory usage
+                                cpu_percent = process.cpu_percent()
+                                memory_info = process.memory_info()
+                                memory_percent = _memory_percent(memory_info.rss)
                             
-                            # Get additional process details
-                            try:
-                                cmdline_full = process.cmdline()
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                cmdline_full = []
+                                # Get additional process details
+                                try:
+                                    cmdline_full = process.cmdline()
+                                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                    cmdline_full = []
                             
-                            try:
-                                username = process.username()
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                username = "Unknown"
+                                try:
+                                    username = process.username()
+                                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                    username = "Unknown"
                             
-                            processes.append({
-                                'pid': proc_info['pid'],
-                                'name': proc_info['name'],
-                                'status': process.status(),
-                                'create_time': process.create_time(),
-                                'cpu_percent': round(cpu_percent, 2),
-                                'memory_rss': memory_info.rss,  # Resident Set Size in bytes
-                                'memory_vms': memory_info.vms,  # Virtual Memory Size in bytes
-                                'memory_percent': round(memory_percent, 2),
-                                'cmdline': cmdline_full,
-                                'username': username,
-                                'service_name': service_name
-                            })
+                                processes.append({
+                                    'pid': proc_info['pid'],
+                                    'name': proc_info['name'],
+                                    'status': process.status(),
+                                    'create_time': process.create_time(),
+                                    'cpu_percent': round(cpu_percent, 2),
+                                    'memory_rss': memory_info.rss,  # Resident Set Size in bytes
+                                    'memory_vms': memory_info.vms,  # Virtual Memory Size in bytes
+                                    'memory_percent': round(memory_percent, 2),
+                                    'cmdline': cmdline_full,
+                                    'username': username,
+                                    'service_name': service_name
+                                })
                             
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         # Process may have died or we don't have access
@@ -967,7 +1088,7 @@ $env:PYTHONUTF8 = "1"
                 processes = []
                 
                 # Get all running processes
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'username', 'cpu_percent', 'memory_percent', 'memory_info']):
+                for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'username', 'cpu_percent', 'memory_info']):
                     try:
                         proc_info = proc.info
                         
@@ -983,7 +1104,7 @@ $env:PYTHONUTF8 = "1"
                                 'cmdline': ' '.join(proc_info['cmdline']) if proc_info['cmdline'] else None,
                                 'username': proc_info['username'],
                                 'cpu_percent': proc_info['cpu_percent'] or 0.0,
-                                'memory_percent': proc_info['memory_percent'] or 0.0,
+                                'memory_percent': _memory_percent(proc_info['memory_info'].rss) if proc_info['memory_info'] else 0.0,
                                 'memory_info': proc_info['memory_info'].rss if proc_info['memory_info'] else 0,
                                 'memory_rss': proc_info['memory_info'].rss if proc_info['memory_info'] else 0
                             })
@@ -1006,8 +1127,13 @@ $env:PYTHONUTF8 = "1"
     async def get_service_resource_summary(self, service_name: str) -> Dict:
         """Get comprehensive resource summary for a service"""
         try:
-            processes = await self.get_service_processes(service_name)
-            thresholds = self.db.get_service_thresholds(service_name) or {}
+            # Process enumeration and the threshold lookup are independent; run them together
+            loop = asyncio.get_event_loop()
+            processes, thresholds = await asyncio.gather(
+                self.get_service_processes(service_name),
+                loop.run_in_executor(None, self.db.get_service_thresholds, service_name)
+            )
+            thresholds = thresholds or {}
             
             # Calculate totals
             total_cpu = sum(p['cpu_percent'] for p in processes)
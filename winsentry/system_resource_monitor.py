@@ -9,16 +9,62 @@ With configurable thresholds and email alerts
 """
 
 import asyncio
+import ctypes
 import logging
+import time
 import psutil
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from ._schemas import DATACLASS_OPTIONS
+from .log_writer import get_log_writer
+
 logger = logging.getLogger(__name__)
 
+# While a threshold stays normal, persist at most one 'normal' check per this many seconds;
+# 'exceeded' results and transitions back to normal are always logged
+NORMAL_CHECK_LOG_INTERVAL = 300
+
+# Minimum seconds between system CPU samples; reads in between reuse the last value
+CPU_SAMPLE_MIN_INTERVAL = 1.0
+
+# Seconds the fixed-disk partition list is reused before drives are enumerated again
+PARTITIONS_CACHE_TTL = 30.0
+
+# Byte counts are scaled by multiplying with the reciprocal; 1/2**30 is exact in binary
+_INV_GB = 1.0 / (1024 ** 3)
+
+# On Windows free space is read with GetDiskFreeSpaceExW directly; elsewhere psutil is used
+try:
+    _GetDiskFreeSpaceExW = ctypes.WinDLL('kernel32', use_last_error=True).GetDiskFreeSpaceExW
+    _GetDiskFreeSpaceExW.argtypes = [ctypes.c_wchar_p] + [ctypes.POINTER(ctypes.c_ulonglong)] * 3
+    _GetDiskFreeSpaceExW.restype = ctypes.c_int
+except (AttributeError, OSError):
+    _GetDiskFreeSpaceExW = None
+
+
+def _disk_usage(path: str):
+    """Get (total, used, free, percent) for a mount point, matching psutil.disk_usage"""
+    if _GetDiskFreeSpaceExW is None:
+        usage = psutil.disk_usage(path)
+        return usage.total, usage.used, usage.free, usage.percent
+    
+    total = ctypes.c_ulonglong()
+    free = ctypes.c_ulonglong()
+    if not _GetDiskFreeSpaceExW(path, None, ctypes.byref(total), ctypes.byref(free)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    total, free = total.value, free.value
+    used = total - free
+    return total, used, free, round(used / total * 100, 1) if total else 0.0
+
+
+def _norm_drive(path: str) -> str:
+    """Normalize a drive or mount point for prefix matching ('c:\\' and 'C:' both give 'C:')"""
+    return path.rstrip('\\/').upper()
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ResourceThreshold:
     """Configuration for resource monitoring thresholds"""
     resource_type: str  # 'cpu', 'ram', 'disk'
@@ -33,6 +79,8 @@ class ResourceThreshold:
     last_value: float = 0.0
     last_check: Optional[datetime] = None
     alert_sent: bool = False  # Track if alert was already sent for current breach
+    last_logged_status: Optional[str] = None
+    last_logged_at: float = 0.0  # time.monotonic() of the last persisted check
 
 
 class SystemResourceMonitor:
@@ -46,6 +94,16 @@ class SystemResourceMonitor:
         self._monitoring_task: Optional[asyncio.Task] = None
         self.email_alert = None
         
+        # Baseline for the non-blocking cpu_percent() reads; each later read reports
+        # usage since the previous one, so the first covers the time since startup
+        psutil.cpu_percent(interval=None)
+        # (time.monotonic() of the last sample, its value)
+        self._cpu_sample = (float('-inf'), 0.0)
+        # (time.monotonic() of the enumeration, [(normalized mount point, partition), ...]
+        # for fixed disks, mount points that failed disk_usage() since then and are
+        # skipped until the next enumeration)
+        self._partitions = (float('-inf'), [], set())
+        
         self._load_configurations()
     
     def _get_email_alert(self):
@@ -124,6 +182,7 @@ class SystemResourceMonitor:
         
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_sys_resource_logs_type ON system_resource_logs(resource_type)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_sys_resource_logs_timestamp ON system_resource_logs(timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sys_resource_logs_type_timestamp ON system_resource_logs(resource_type, timestamp)')
         
         conn.commit()
     
@@ -212,13 +271,21 @@ class SystemResourceMonitor:
             return False
     
     def get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage (blocking - use async version in async code)"""
-        return psutil.cpu_percent(interval=1)
+        """Get CPU usage percentage since the previous sample"""
+        # Back-to-back callers (dashboard refreshes, several CPU thresholds) would
+        # otherwise each measure a sliver of time and get a noisy value
+        now = time.monotonic()
+        sampled_at, value = self._cpu_sample
+        if now - sampled_at < CPU_SAMPLE_MIN_INTERVAL:
+            return value
+        value = psutil.cpu_percent(interval=None)
+        self._cpu_sample = (now, value)
+        return value
     
     async def get_cpu_usage_async(self) -> float:
-        """Get current CPU usage percentage (non-blocking)"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: psutil.cpu_percent(interval=1))
+        """Get CPU usage percentage since the previous sample"""
+        # Non-blocking read of the kernel counters; no executor hop needed
+        return self.get_cpu_usage()
     
     def get_ram_usage(self) -> Dict:
         """Get current RAM usage"""
@@ -228,45 +295,56 @@ class SystemResourceMonitor:
             'total_bytes': memory.total,
             'available_bytes': memory.available,
             'used_bytes': memory.used,
-            'total_gb': round(memory.total / (1024**3), 2),
-            'available_gb': round(memory.available / (1024**3), 2),
-            'used_gb': round(memory.used / (1024**3), 2)
+            'total_gb': round(memory.total * _INV_GB, 2),
+            'available_gb': round(memory.available * _INV_GB, 2),
+            'used_gb': round(memory.used * _INV_GB, 2)
         }
     
+    def _get_partitions(self):
+        """Get fixed-disk partitions and the inaccessible mount set, cached for PARTITIONS_CACHE_TTL"""
+        taken_at, partitions, inaccessible = self._partitions
+        now = time.monotonic()
+        if now - taken_at >= PARTITIONS_CACHE_TTL:
+            # Skip removable/network drives unless specifically requested
+            partitions = [(_norm_drive(p.mountpoint), p) for p in psutil.disk_partitions()
+                          if 'removable' not in p.opts.lower() and 'cdrom' not in p.opts.lower()]
+            inaccessible = set()
+            self._partitions = (now, partitions, inaccessible)
+        return partitions, inaccessible
+    
     def get_disk_usage(self, drive_letter: str = None) -> List[Dict]:
         """Get disk usage for specified drive or all drives"""
         disks = []
         
         try:
-            partitions = psutil.disk_partitions()
+            partitions, inaccessible = self._get_partitions()
+            drive = _norm_drive(drive_letter) if drive_letter else None
             
-            for partition in partitions:
-                # Skip removable/network drives unless specifically requested
-                if 'removable' in partition.opts.lower() or 'cdrom' in partition.opts.lower():
-                    continue
-                
+            for mount_key, partition in partitions:
                 mount_point = partition.mountpoint
+                if mount_point in inaccessible:
+                    continue
                 
                 # Filter by drive letter if specified
-                if drive_letter:
-                    if not mount_point.upper().startswith(drive_letter.upper()):
-                        continue
+                if drive is not None and not mount_key.startswith(drive):
+                    continue
                 
                 try:
-                    usage = psutil.disk_usage(mount_point)
+                    total, used, free, percent = _disk_usage(mount_point)
                     disks.append({
                         'drive': mount_point,
                         'device': partition.device,
                         'fstype': partition.fstype,
-                        'percent': usage.percent,
-                        'total_bytes': usage.total,
-                        'used_bytes': usage.used,
-                        'free_bytes': usage.free,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2)
+                        'percent': percent,
+                        'total_bytes': total,
+                        'used_bytes': used,
+                        'free_bytes': free,
+                        'total_gb': round(total * _INV_GB, 2),
+                        'used_gb': round(used * _INV_GB, 2),
+                        'free_gb': round(free * _INV_GB, 2)
                     })
                 except (PermissionError, OSError):
+                    inaccessible.add(mount_point)
                     continue
             
         except Exception as e:
@@ -288,12 +366,15 @@ class SystemResourceMonitor:
     async def check_thresholds(self) -> List[Dict]:
         """Check all configured thresholds and return violations"""
         violations = []
+        # Every threshold checked in this pass shares one clock read
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         for threshold_id, threshold in self.thresholds.items():
             if not threshold.enabled:
                 continue
             
-            threshold.last_check = datetime.now()
+            threshold.last_check = now
             current_value = 0.0
             
             try:
@@ -317,7 +398,7 @@ class SystemResourceMonitor:
                         'drive_letter': threshold.drive_letter,
                         'current_value': current_value,
                         'threshold': threshold.threshold_percent,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': timestamp
                     }
                     violations.append(violation)
                     
@@ -388,21 +469,21 @@ class SystemResourceMonitor:
     def _log_resource_check(self, threshold: ResourceThreshold, value: float, 
                            status: str, message: str):
         """Log resource check to database"""
+        now = time.monotonic()
+        if (status == 'normal' and threshold.last_logged_status == 'normal'
+                and now - threshold.last_logged_at < NORMAL_CHECK_LOG_INTERVAL):
+            return
+        threshold.last_logged_status = status
+        threshold.last_logged_at = now
+        
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            get_log_writer(self.db_path).write('''
                 INSERT INTO system_resource_logs 
                 (resource_type, drive_letter, value_percent, threshold_percent, status, message)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (threshold.resource_type, threshold.drive_letter, value,
                   threshold.threshold_percent, status, message))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             self.logger.error(f"Failed to log resource check: {e}")
     
@@ -86,6 +86,10 @@ class WinSentryService(win32serviceutil.ServiceFramework):
             from winsentry.service_monitor import ServiceMonitor
             from winsentry.system_resource_monitor import SystemResourceMonitor
             from winsentry.logger import setup_logging
+            from winsentry._loop import install_fast_loop
+            
+            # Pick the loop implementation before the service loop is created
+            install_fast_loop()
             
             # Setup logging
             setup_logging(debug=False)